@@ -0,0 +1,60 @@
+import hashlib
+import json
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 사용자별 데이터이므로 공유 캐시에는 저장하지 않고, 매번 ETag 로 재검증하도록 함
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """응답 내용을 결정하는 값들로 강한 ETag 를 만듭니다"""
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return f'"{hashlib.sha256(encoded).hexdigest()[:32]}"'
+
+
+class ConditionalGet:
+    """If-None-Match 조건부 GET 처리 (FastAPI 의존성)
+
+    사용법:
+        async def handler(..., conditional: ConditionalGet = Depends()):
+            etag = make_etag(...)
+            if conditional.not_modified(etag):
+                return conditional.not_modified_response()
+            ...  # 평소처럼 응답 (ETag / Cache-Control 헤더는 자동으로 붙음)
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+        self.etag: Optional[str] = None
+
+    def _client_etags(self) -> set:
+        header = self.request.headers.get("if-none-match")
+        if not header:
+            return set()
+        # If-None-Match 는 약한 비교를 사용하므로 W/ 접두사는 무시
+        return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+    def has_if_none_match(self) -> bool:
+        """클라이언트가 재검증할 ETag 를 보냈는지 (없으면 ETag 비교용 추가 조회를 건너뛸 수 있음)"""
+        return bool(self._client_etags())
+
+    def not_modified(self, etag: str, cache_control: str = DEFAULT_CACHE_CONTROL) -> bool:
+        """응답에 ETag 를 설정하고, 클라이언트가 같은 버전을 갖고 있으면 True 를 반환합니다"""
+        self.etag = etag
+        self.response.headers["ETag"] = etag
+        self.response.headers["Cache-Control"] = cache_control
+        self.response.headers["Vary"] = "Authorization"
+
+        client_etags = self._client_etags()
+        return "*" in client_etags or etag in client_etags
+
+    def not_modified_response(self) -> Response:
+        """본문 없는 304 응답 (not_modified() 에서 설정한 헤더 포함)"""
+        return Response(status_code=304, headers={
+            key: value
+            for key, value in self.response.headers.items()
+            if key.lower() in ("etag", "cache-control", "vary")
+        })
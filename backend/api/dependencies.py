@@ -0,0 +1,108 @@
+from repositories.routine_repository import IRoutineRepository, FirestoreRoutineRepository
+from repositories.cached_routine_repository import CachedRoutineRepository
+from repositories.execution_repository import IExecutionRepository, FirestoreExecutionRepository
+from repositories.feedback_repository import FirestoreFeedbackRepository
+from repositories.sync_repository import ISyncRepository, FirestoreSyncRepository
+from repositories.change_watcher import FirestoreChangeWatcher
+from services.change_hub import ChangeHub
+from services.idempotency_cache import IdempotencyCache
+from services.feedback_cache import FeedbackCache
+from services.ai_feedback import generate_ai_feedback
+from services.timetable import TimetableCache
+
+# 저장소 인스턴스 (lazy initialization, 프로세스 단위 공유)
+_routine_repository = None
+_execution_repository = None
+_feedback_cache = None
+_timetable_cache = None
+_sync_repository = None
+_change_hub = None
+_idempotency_cache = None
+
+
+def get_routine_repository() -> IRoutineRepository:
+    """라우터에 주입할 루틴 저장소를 반환합니다
+
+    테스트나 다른 저장소로 교체할 때는 app.dependency_overrides 를 사용합니다.
+    """
+    global _routine_repository
+    if _routine_repository is None:
+        _routine_repository = CachedRoutineRepository(FirestoreRoutineRepository())
+    return _routine_repository
+
+
+def get_execution_repository() -> IExecutionRepository:
+    """라우터에 주입할 수행 기록 저장소를 반환합니다"""
+    global _execution_repository
+    if _execution_repository is None:
+        _execution_repository = FirestoreExecutionRepository()
+    return _execution_repository
+
+
+def get_feedback_cache() -> FeedbackCache:
+    """AI 피드백 캐시를 반환합니다"""
+    global _feedback_cache
+    if _feedback_cache is None:
+        _feedback_cache = FeedbackCache(FirestoreFeedbackRepository(), generate_ai_feedback)
+    return _feedback_cache
+
+
+def get_timetable_cache() -> TimetableCache:
+    """사용자별 주간 시간표 색인 캐시를 반환합니다"""
+    global _timetable_cache
+    if _timetable_cache is None:
+        _timetable_cache = TimetableCache()
+    return _timetable_cache
+
+
+def get_sync_repository() -> ISyncRepository:
+    """증분 동기화 저장소를 반환합니다"""
+    global _sync_repository
+    if _sync_repository is None:
+        _sync_repository = FirestoreSyncRepository()
+    return _sync_repository
+
+
+def get_idempotency_cache() -> IdempotencyCache:
+    """최근 생성한 수행 기록 응답 캐시를 반환합니다 (재시도 요청용)"""
+    global _idempotency_cache
+    if _idempotency_cache is None:
+        _idempotency_cache = IdempotencyCache()
+    return _idempotency_cache
+
+
+def get_change_hub() -> ChangeHub:
+    """실시간 변경 스트림 허브를 반환합니다 (사용자별 리스너를 워커 안에서 공유)"""
+    global _change_hub
+    if _change_hub is None:
+        _change_hub = ChangeHub(FirestoreChangeWatcher())
+    return _change_hub
+
+
+def close_change_hub():
+    """변경 리스너를 모두 해제하고 열린 스트림을 끝냅니다 (앱 종료 시 호출)"""
+    global _change_hub
+    hub, _change_hub = _change_hub, None
+    if hub is not None:
+        hub.close()
+
+
+def stream_stats() -> dict:
+    """실시간 스트림 연결 / 리스너 통계 (/metrics 용)"""
+    if _change_hub is None:
+        return {"connections": 0, "users": 0, "events": 0, "resyncs": 0}
+    return _change_hub.stats()
+
+
+def cache_stats() -> dict:
+    """지금까지 만들어진 프로세스 내 캐시의 통계 (/metrics 용, 아직 없는 캐시는 제외)"""
+    stats = {}
+    if isinstance(_routine_repository, CachedRoutineRepository):
+        stats["routines"] = _routine_repository.stats()
+    if _feedback_cache is not None:
+        stats["feedback"] = _feedback_cache.stats()
+    if _timetable_cache is not None:
+        stats["timetable"] = _timetable_cache.stats()
+    if _idempotency_cache is not None:
+        stats["idempotency"] = _idempotency_cache.stats()
+    return stats
@@ -1,102 +1,336 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from firebase_admin import firestore
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from auth.middleware import verify_firebase_token
-from api.schemas import ExecutionCreate, ExecutionResponse, DailySummaryResponse, DailyFeedbackResponse
+from repositories.executor import run_blocking
+from repositories.routine_repository import IRoutineRepository
+from repositories.execution_repository import IExecutionRepository
+from repositories.execution_rollups import summarize_executions, period_of, rollup_is_complete
+from services.execution_stats import build_range_stats, days_between
+from api.dependencies import get_routine_repository, get_execution_repository, get_feedback_cache, get_idempotency_cache
+from api.conditional import ConditionalGet, make_etag
+from api.fast_json import FAST_JSON_RESPONSES, ValidatedJSON
+from api.schemas import (
+    ExecutionCreate, ExecutionResponse, ExecutionBatchCreate, DailySummaryResponse, DailyFeedbackResponse,
+    DailyStatsResponse, RoutineDailyStat, RangeStatsResponse, BatchItemResult, BatchResponse,
+)
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Literal, Optional
+import hashlib
+import json
 import logging
 
-# Firebase 초기화 확인
-import auth.firebase_init
-
-# AI 피드백 서비스
-from services.ai_feedback import generate_ai_feedback
+# AI 피드백 캐시 / 스트리밍
+from services.feedback_cache import FeedbackCache
+from services.idempotency_cache import IdempotencyCache
+from services.ai_feedback import stream_ai_feedback
 
 router = APIRouter(prefix="/executions", tags=["Executions"])
 
-logging.basicConfig(level=logging.INFO)
+# 기간 통계 조회 범위 상한 (일)
+MAX_RANGE_DAYS = 366
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+DAILY_SUMMARY_JSON = ValidatedJSON(DailySummaryResponse)
+RANGE_STATS_JSON = ValidatedJSON(RangeStatsResponse)
+
 logger = logging.getLogger(__name__)
 
 
-def get_db():
-    """Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
-    return firestore.client(database_id="uphilldb")
+def parse_execution_date(started_at: str) -> str:
+    """started_at(ISO8601)에서 날짜(YYYY-MM-DD)를 추출합니다 (잘못되면 400)"""
+    try:
+        started_dt = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format for started_at")
+    return started_dt.strftime('%Y-%m-%d')
+
+
+def normalize_started_at(started_at: str) -> str:
+    """started_at 을 비교 가능한 형태로 바꿉니다 ("Z" / "+00:00" 등 표기 차이 제거)"""
+    started_dt = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+    if started_dt.tzinfo is not None:
+        started_dt = started_dt.astimezone(timezone.utc)
+    return started_dt.isoformat()
+
+
+def execution_doc_id(routine_id: str, started_at: str, idempotency_key: Optional[str] = None) -> str:
+    """수행 기록 문서 ID (같은 요청을 재시도하면 같은 ID)
+
+    Idempotency-Key 가 있으면 그 키로, 없으면 루틴 ID + 시작 시각으로 만듭니다.
+    (같은 루틴을 같은 시각에 시작한 기록은 하나뿐이므로)
+    """
+    if idempotency_key:
+        source = f"key\n{idempotency_key}"
+    else:
+        source = f"start\n{routine_id}\n{normalize_started_at(started_at)}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:20]
+
+
+def execution_fingerprint(data: dict) -> tuple:
+    """같은 수행 기록 요청인지 비교할 때 쓰는 값"""
+    return (
+        data.get("routine_id"),
+        data.get("routine_title"),
+        normalize_started_at(data.get("started_at", "")),
+        data.get("ended_at"),
+        data.get("duration_seconds"),
+    )
+
+
+def build_execution_data(routine_id: str, execution: ExecutionCreate, date_str: str, now: str) -> dict:
+    """Firestore 에 저장할 수행 기록 문서를 만듭니다"""
+    return {
+        "routine_id": routine_id,
+        "routine_title": execution.routine_title,
+        "started_at": execution.started_at,
+        "ended_at": execution.ended_at,
+        "duration_seconds": execution.duration_seconds,
+        "date": date_str,
+        "created_at": now,
+    }
+
+
+def execution_row(data: dict) -> dict:
+    """저장소에서 읽은 수행 기록 딕셔너리를 응답 스키마 형태의 dict 로 바꿉니다 (없는 필드는 기본값)"""
+    return {
+        "id": data["id"],
+        "routine_id": data.get("routine_id", ""),
+        "routine_title": data.get("routine_title", ""),
+        "started_at": data.get("started_at", ""),
+        "ended_at": data.get("ended_at", ""),
+        "duration_seconds": data.get("duration_seconds", 0),
+        "date": data.get("date", ""),
+        "created_at": data.get("created_at", ""),
+    }
+
+
+def to_execution_response(data: dict) -> ExecutionResponse:
+    """저장소에서 읽은 수행 기록 딕셔너리를 응답 스키마로 변환합니다"""
+    return ExecutionResponse(**execution_row(data))
+
+
+def daily_summary_row(date: str, docs: List[dict]) -> dict:
+    """날짜의 수행 기록 목록으로 일간 통계 dict 를 만듭니다 (시작 시간순 정렬)"""
+    executions = [execution_row(data) for data in docs]
+    executions.sort(key=lambda x: x["started_at"])
+    return {
+        "date": date,
+        "total_routines": len(executions),
+        "total_duration_seconds": sum(execution["duration_seconds"] for execution in executions),
+        "executions": executions,
+    }
+
+
+def build_daily_summary(date: str, docs: List[dict]) -> DailySummaryResponse:
+    """날짜의 수행 기록 목록으로 일간 통계를 만듭니다 (시작 시간순 정렬)"""
+    return DailySummaryResponse(**daily_summary_row(date, docs))
+
+
+def mark_existing(result: BatchItemResult, stored: dict, execution_data: dict):
+    """이미 저장된 항목을 내용이 같으면 200, 다르면 409 로 표시합니다 (단건 저장과 같은 기준)"""
+    if execution_fingerprint(stored) == execution_fingerprint(execution_data):
+        result.status = 200
+    else:
+        result.status = 409
+        result.error = "Execution already recorded with different values"
+
+
+def mark_routine_missing(result: BatchItemResult):
+    """루틴이 없어 저장하지 않은 항목을 404 로 표시합니다"""
+    result.status = 404
+    result.id = None
+    result.error = "Routine not found"
+
+
+@router.post(":batch", response_model=BatchResponse)
+async def create_executions_batch(
+    batch: ExecutionBatchCreate,
+    uid: str = Depends(verify_firebase_token),
+    routine_repo: IRoutineRepository = Depends(get_routine_repository),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    feedback_cache: FeedbackCache = Depends(get_feedback_cache)
+):
+    """
+    여러 수행 기록을 한 번에 저장합니다 (오프라인 동기화용, 최대 500개).
+
+    루틴 존재 여부는 사용자 루틴 목록 한 번으로 확인하고, 유효한 항목만 하나의 WriteBatch 로 저장합니다.
+    목록은 캐시에서 올 수 있으므로 배치마다 루틴 문서 전제조건을 함께 쓰며,
+    그 사이 다른 워커에서 삭제된 루틴의 항목은 저장하지 않고 404 로 표시합니다.
+    문서 ID 는 routine_id + started_at 으로 정해지므로 재전송된 항목은 다시 저장되지 않고 200 으로 표시됩니다.
+    단건 저장과 같이 이미 저장된 내용과 다르면 (같은 요청 안의 중복 포함) 409 로 표시됩니다.
+
+    Args:
+        batch: 저장할 수행 기록 목록 (각 항목의 routine_id 사용)
+        uid: 인증된 사용자의 uid
+
+    Returns:
+        BatchResponse: 항목별 처리 결과
+    """
+    logger.debug("📦 수행 기록 일괄 생성 요청: %s개", len(batch.executions))
+
+    try:
+        routines = await run_blocking(routine_repo.get_all_by_user, uid)
+        routine_ids = {routine["id"] for routine in routines}
+
+        now = datetime.now(timezone.utc).isoformat()
+
+        results: List[BatchItemResult] = []
+        valid_indexes = []
+        execution_ids = []
+        execution_docs = []
+        seen_ids = set()
+        # 같은 요청 안에서 중복된 항목 (index, execution_id, execution_data)
+        duplicates = []
+
+        for index, execution in enumerate(batch.executions):
+            if execution.routine_id not in routine_ids:
+                results.append(BatchItemResult(index=index, status=404, error="Routine not found"))
+                continue
+            try:
+                date_str = parse_execution_date(execution.started_at)
+            except HTTPException as e:
+                results.append(BatchItemResult(index=index, status=e.status_code, error=e.detail))
+                continue
+            execution_id = execution_doc_id(execution.routine_id, execution.started_at)
+            execution_data = build_execution_data(execution.routine_id, execution, date_str, now)
+            results.append(BatchItemResult(index=index, status=201, id=execution_id))
+            if execution_id in seen_ids:
+                # 저장 결과와 비교한 뒤 200 / 409 로 표시
+                duplicates.append((index, execution_id, execution_data))
+                continue
+            seen_ids.add(execution_id)
+            valid_indexes.append(index)
+            execution_ids.append(execution_id)
+            execution_docs.append(execution_data)
+
+        created = 0
+        stored_by_id = {}
+        if execution_docs:
+            outcomes = await run_blocking(execution_repo.create_many, uid, execution_ids, execution_docs)
+            for index, execution_id, execution_data, outcome in zip(
+                valid_indexes, execution_ids, execution_docs, outcomes
+            ):
+                if outcome is None:
+                    # 다른 워커에서 삭제된 루틴 (루틴 문서 전제조건으로 거부됨)
+                    routine_repo.forget(uid, execution_data["routine_id"])
+                    stored_by_id[execution_id] = None
+                    mark_routine_missing(results[index])
+                    continue
+                stored, was_created = outcome
+                stored_by_id[execution_id] = stored
+                if was_created:
+                    created += 1
+                else:
+                    mark_existing(results[index], stored, execution_data)
+            for date_str in {outcome[0]["date"] for outcome in outcomes if outcome is not None and outcome[1]}:
+                feedback_cache.invalidate(uid, date_str)
+        for index, execution_id, execution_data in duplicates:
+            if stored_by_id[execution_id] is None:
+                mark_routine_missing(results[index])
+            else:
+                mark_existing(results[index], stored_by_id[execution_id], execution_data)
+
+        logger.debug("✅ 수행 기록 일괄 생성 완료: %s/%s개", created, len(results))
+
+        return BatchResponse(
+            created=created,
+            failed=sum(1 for result in results if result.status >= 400),
+            results=results,
+        )
+
+    except Exception as e:
+        logger.error("❌ 수행 기록 일괄 생성 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create executions: {str(e)}"
+        )
 
 
 @router.post("/{routine_id}", response_model=ExecutionResponse, status_code=201)
 async def create_execution(
     routine_id: str,
     execution: ExecutionCreate,
-    uid: str = Depends(verify_firebase_token)
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, max_length=IDEMPOTENCY_KEY_MAX_LENGTH),
+    uid: str = Depends(verify_firebase_token),
+    routine_repo: IRoutineRepository = Depends(get_routine_repository),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    feedback_cache: FeedbackCache = Depends(get_feedback_cache),
+    idempotency_cache: IdempotencyCache = Depends(get_idempotency_cache)
 ):
     """
     루틴 수행 기록을 저장합니다.
 
+    문서 ID 를 Idempotency-Key 헤더(없으면 routine_id + started_at)로 정하고 create 전제조건으로 저장하므로,
+    네트워크 재시도로 같은 요청이 여러 번 와도 한 번만 저장되고 처음 저장된 수행 기록이 반환됩니다
+    (Idempotent-Replayed: true 헤더). 최근 요청의 재시도는 메모리 캐시에서 바로 응답하며,
+    같은 키로 다른 내용이 오면 409 를 반환합니다.
+
+    루틴 존재 여부는 루틴 저장소가 기억하는 루틴 ID 집합으로 확인하므로 보통은 쓰기 한 번이며
+    (같은 배치의 루틴 문서 전제조건이 그 사이 삭제된 루틴을 거부), 집합에 없는 루틴일 때만
+    루틴 조회와 저장을 한 트랜잭션으로 처리합니다.
+
     Args:
         routine_id: 루틴 ID
         execution: 수행 기록 정보
+        idempotency_key: 재시도 식별 키 (선택)
         uid: 인증된 사용자의 uid
 
     Returns:
-        ExecutionResponse: 생성된 수행 기록
+        ExecutionResponse: 생성된(또는 이미 저장되어 있던) 수행 기록
     """
-    logger.info("=" * 60)
-    logger.info("📝 루틴 수행 기록 생성 요청")
-    logger.info(f"   - UID: {uid}")
-    logger.info(f"   - Routine ID: {routine_id}")
-    logger.info(f"   - Title: {execution.routine_title}")
-    logger.info(f"   - Duration: {execution.duration_seconds}초")
-    logger.info("=" * 60)
 
     try:
-        db = get_db()
-
-        # 루틴 존재 확인
-        routine_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
-        routine_doc = routine_ref.get()
-        if not routine_doc.exists:
-            raise HTTPException(status_code=404, detail="Routine not found")
-
         # 날짜 추출 (YYYY-MM-DD)
-        try:
-            started_dt = datetime.fromisoformat(execution.started_at.replace('Z', '+00:00'))
-            date_str = started_dt.strftime('%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format for started_at")
+        date_str = parse_execution_date(execution.started_at)
 
         now = datetime.now(timezone.utc).isoformat()
 
-        execution_data = {
-            "routine_id": routine_id,
-            "routine_title": execution.routine_title,
-            "started_at": execution.started_at,
-            "ended_at": execution.ended_at,
-            "duration_seconds": execution.duration_seconds,
-            "date": date_str,
-            "created_at": now,
-        }
-
-        # executions 컬렉션에 저장
-        doc_ref = db.collection("users").document(uid).collection("executions").document()
-        doc_ref.set(execution_data)
-
-        logger.info(f"✅ 수행 기록 생성 성공: {doc_ref.id}")
-
-        return ExecutionResponse(
-            id=doc_ref.id,
-            routine_id=routine_id,
-            routine_title=execution.routine_title,
-            started_at=execution.started_at,
-            ended_at=execution.ended_at,
-            duration_seconds=execution.duration_seconds,
-            date=date_str,
-            created_at=now,
-        )
+        execution_id = execution_doc_id(routine_id, execution.started_at, idempotency_key)
+        execution_data = build_execution_data(routine_id, execution, date_str, now)
+
+        stored = idempotency_cache.get(uid, execution_id)
+        created = False
+        if stored is None:
+            if routine_repo.is_known(uid, routine_id):
+                # 존재가 확인된 루틴: 조회 없이 쓰기 한 번 (이미 있으면 저장된 문서)
+                result = await run_blocking(execution_repo.create, uid, execution_id, execution_data)
+                if result is None:
+                    # 다른 워커에서 삭제된 루틴 (루틴 문서 전제조건으로 배치가 거부됨)
+                    routine_repo.forget(uid, routine_id)
+                    raise HTTPException(status_code=404, detail="Routine not found")
+                stored, created = result
+            else:
+                # 루틴 확인과 저장을 한 트랜잭션으로
+                result = await run_blocking(
+                    execution_repo.create_for_routine, uid, routine_id, execution_id, execution_data
+                )
+                if result is None:
+                    raise HTTPException(status_code=404, detail="Routine not found")
+                stored, created = result
+                routine_repo.remember(uid, routine_id)
+            idempotency_cache.put(uid, execution_id, stored)
+
+        if created:
+            # 해당 날짜의 AI 피드백 캐시 무효화
+            feedback_cache.invalidate(uid, date_str)
+            logger.debug("✅ 수행 기록 생성 성공: %s", execution_id)
+        else:
+            if execution_fingerprint(stored) != execution_fingerprint(execution_data):
+                raise HTTPException(
+                    status_code=409,
+                    detail="Execution already recorded with different values"
+                )
+            response.headers["Idempotent-Replayed"] = "true"
+            logger.debug("♻️ 재시도된 수행 기록 요청: %s", execution_id)
+
+        return to_execution_response(stored)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 수행 기록 생성 실패: {e}")
+        logger.error("❌ 수행 기록 생성 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create execution: {str(e)}"
@@ -106,11 +340,20 @@ async def create_execution(
 @router.get("/daily", response_model=DailySummaryResponse)
 async def get_daily_executions(
     date: str = Query(..., description="조회할 날짜 (YYYY-MM-DD 형식)"),
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    conditional: Optional[ConditionalGet] = Depends(ConditionalGet)
 ):
     """
     특정 날짜의 모든 수행 기록과 통계를 조회합니다.
 
+    수행 기록은 추가만 되므로 그날의 수행 기록 수(total_routines)로 ETag 를 만듭니다.
+    If-None-Match 가 있고 그날의 일간 집계가 수행 기록 전체를 반영하면(rollup_is_complete)
+    집계 문서 하나만 읽어 같은 ETag 를 계산하고, 일치하면 수행 기록을 읽지 않고 304 를 반환합니다.
+    집계 도입 이전 기록이 있을 수 있는 날짜는 두 값이 다를 수 있으므로 수행 기록으로만 비교하며,
+    If-None-Match 가 없으면 집계 문서는 읽지 않습니다.
+    다른 핸들러에서 직접 호출할 때는 conditional=None 으로 넘깁니다.
+
     Args:
         date: 조회할 날짜 (YYYY-MM-DD)
         uid: 인증된 사용자의 uid
@@ -118,7 +361,7 @@ async def get_daily_executions(
     Returns:
         DailySummaryResponse: 일간 수행 통계
     """
-    logger.info(f"📋 일간 수행 기록 조회: {date}")
+    logger.debug("📋 일간 수행 기록 조회: %s", date)
 
     try:
         # 날짜 형식 검증
@@ -127,56 +370,168 @@ async def get_daily_executions(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-        db = get_db()
+        if conditional is not None and conditional.has_if_none_match() and rollup_is_complete(date):
+            stats = await run_blocking(execution_repo.get_daily_stats, uid, date)
+            if stats is not None and conditional.not_modified(make_etag("daily", date, stats.get("total_routines"))):
+                return conditional.not_modified_response()
 
         # 해당 날짜의 수행 기록 조회
-        executions_ref = db.collection("users").document(uid).collection("executions")
-        query = executions_ref.where("date", "==", date)
-        docs = query.stream()
-
-        executions = []
-        total_duration = 0
-
-        for doc in docs:
-            data = doc.to_dict()
-            executions.append(ExecutionResponse(
-                id=doc.id,
-                routine_id=data.get("routine_id", ""),
-                routine_title=data.get("routine_title", ""),
-                started_at=data.get("started_at", ""),
-                ended_at=data.get("ended_at", ""),
-                duration_seconds=data.get("duration_seconds", 0),
-                date=data.get("date", ""),
-                created_at=data.get("created_at", ""),
-            ))
-            total_duration += data.get("duration_seconds", 0)
-
-        # 시작 시간순으로 정렬
-        executions.sort(key=lambda x: x.started_at)
-
-        logger.info(f"✅ 일간 기록 조회 성공: {len(executions)}개")
-
-        return DailySummaryResponse(
+        docs = await run_blocking(execution_repo.get_by_date, uid, date)
+
+        summary = daily_summary_row(date, docs)
+
+        if conditional is not None and conditional.not_modified(make_etag("daily", date, summary["total_routines"])):
+            return conditional.not_modified_response()
+
+        logger.debug("✅ 일간 기록 조회 성공: %s개", summary["total_routines"])
+
+        if conditional is None:
+            # 다른 핸들러에서 직접 호출한 경우 모델로 반환
+            return DailySummaryResponse(**summary)
+        if FAST_JSON_RESPONSES:
+            return DAILY_SUMMARY_JSON.response(summary, conditional.response)
+        return summary
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("❌ 일간 기록 조회 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch daily executions: {str(e)}"
+        )
+
+
+@router.get("/daily/stats", response_model=DailyStatsResponse)
+async def get_daily_stats(
+    date: str = Query(..., description="조회할 날짜 (YYYY-MM-DD 형식)"),
+    uid: str = Depends(verify_firebase_token),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    conditional: ConditionalGet = Depends()
+):
+    """
+    특정 날짜의 수행 통계(완료 수, 총 시간, 루틴별 합계)를 조회합니다.
+
+    수행 기록 생성 시 함께 갱신되는 일간 집계 문서 하나만 읽으므로
+    그날의 수행 기록 수와 관계없이 비용이 일정합니다. If-None-Match 가 일치하면 304 를 반환합니다.
+
+    Args:
+        date: 조회할 날짜 (YYYY-MM-DD)
+        uid: 인증된 사용자의 uid
+
+    Returns:
+        DailyStatsResponse: 일간 집계
+    """
+    logger.debug("📊 일간 집계 조회: %s", date)
+
+    try:
+        try:
+            datetime.strptime(date, '%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+        stats = await run_blocking(execution_repo.get_daily_stats, uid, date)
+
+        if stats is None:
+            # 집계 도입 이전 날짜: 수행 기록을 읽어 같은 형태로 계산
+            executions = await run_blocking(execution_repo.get_by_date, uid, date)
+            stats = summarize_executions(executions).get(date, {})
+
+        if conditional.not_modified(make_etag("daily-stats", date, stats)):
+            return conditional.not_modified_response()
+
+        routines = [
+            RoutineDailyStat(
+                routine_id=routine_id,
+                routine_title=routine.get("routine_title", ""),
+                count=routine.get("count", 0),
+                duration_seconds=routine.get("duration_seconds", 0),
+            )
+            for routine_id, routine in stats.get("routines", {}).items()
+        ]
+        routines.sort(key=lambda x: x.duration_seconds, reverse=True)
+
+        return DailyStatsResponse(
             date=date,
-            total_routines=len(executions),
-            total_duration_seconds=total_duration,
-            executions=executions
+            total_routines=stats.get("total_routines", 0),
+            total_duration_seconds=stats.get("total_duration_seconds", 0),
+            routines=routines,
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 일간 기록 조회 실패: {e}")
+        logger.error("❌ 일간 집계 조회 실패: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to fetch daily executions: {str(e)}"
+            detail=f"Failed to fetch daily stats: {str(e)}"
+        )
+
+
+@router.get("/range", response_model=RangeStatsResponse)
+async def get_range_stats(
+    from_date: str = Query(..., alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: str = Query(..., alias="to", description="종료 날짜 (YYYY-MM-DD)"),
+    granularity: Literal["day", "week", "month"] = Query("day", description="집계 단위"),
+    uid: str = Depends(verify_firebase_token),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository)
+):
+    """
+    기간별(일/주/월) 수행 통계와 루틴별 연속 수행 기록을 조회합니다.
+
+    수행 기록 생성 시 함께 갱신되는 일/주/월 집계 문서만 읽으므로
+    주간·월간 화면에서 날짜별 요청을 반복할 필요가 없습니다.
+    범위는 집계 단위의 경계(주: 월~일, 월: 1일~말일)에 맞춰 확장됩니다.
+
+    Args:
+        from_date: 시작 날짜 (YYYY-MM-DD)
+        to_date: 종료 날짜 (YYYY-MM-DD)
+        granularity: day | week | month
+        uid: 인증된 사용자의 uid
+
+    Returns:
+        RangeStatsResponse: 기간별 통계와 루틴별 요약
+    """
+    logger.debug("📊 기간 통계 조회: %s ~ %s (%s)", from_date, to_date, granularity)
+
+    try:
+        try:
+            datetime.strptime(from_date, '%Y-%m-%d')
+            datetime.strptime(to_date, '%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+        if from_date > to_date:
+            raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+        if days_between(from_date, to_date) > MAX_RANGE_DAYS:
+            raise HTTPException(status_code=400, detail=f"Range must not exceed {MAX_RANGE_DAYS} days")
+
+        start = period_of(from_date, granularity)[1]
+        end = period_of(to_date, granularity)[2]
+
+        rollups = await run_blocking(execution_repo.get_rollups, uid, granularity, start, end)
+
+        stats = build_range_stats(rollups, granularity, start, end, to_date)
+        if FAST_JSON_RESPONSES:
+            return RANGE_STATS_JSON.response(stats)
+        return RangeStatsResponse(**stats)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("❌ 기간 통계 조회 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch range stats: {str(e)}"
         )
 
 
 @router.get("/daily/{date}/feedback", response_model=DailyFeedbackResponse)
 async def get_daily_feedback(
     date: str,
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    feedback_cache: FeedbackCache = Depends(get_feedback_cache)
 ):
     """
     특정 날짜의 AI 피드백을 생성합니다.
@@ -188,16 +543,16 @@ async def get_daily_feedback(
     Returns:
         DailyFeedbackResponse: 일간 AI 피드백
     """
-    logger.info(f"🤖 AI 피드백 생성 요청: {date}")
+    logger.debug("🤖 AI 피드백 생성 요청: %s", date)
 
     try:
         # 먼저 일간 통계 조회
-        summary = await get_daily_executions(date=date, uid=uid)
+        summary = await get_daily_executions(date=date, uid=uid, execution_repo=execution_repo, conditional=None)
 
-        # AI 피드백 생성
-        ai_feedback = generate_ai_feedback(summary)
+        # AI 피드백 생성 (같은 통계에 대해서는 캐시된 피드백 사용)
+        ai_feedback = await feedback_cache.get_or_generate(uid, summary)
 
-        logger.info(f"✅ AI 피드백 생성 성공")
+        logger.debug("✅ AI 피드백 생성 성공")
 
         return DailyFeedbackResponse(
             date=date,
@@ -210,8 +565,66 @@ async def get_daily_feedback(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ AI 피드백 생성 실패: {e}")
+        logger.error("❌ AI 피드백 생성 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate feedback: {str(e)}"
         )
+
+
+@router.get("/daily/{date}/feedback/stream")
+async def stream_daily_feedback(
+    date: str,
+    uid: str = Depends(verify_firebase_token),
+    execution_repo: IExecutionRepository = Depends(get_execution_repository),
+    feedback_cache: FeedbackCache = Depends(get_feedback_cache)
+):
+    """
+    특정 날짜의 AI 피드백을 NDJSON 스트림으로 보냅니다.
+
+    한 줄에 하나씩 {"event": ..., "data": ...} 객체를 보내며 순서는 다음과 같습니다.
+    summary(일간 통계, 즉시) → short(한 줄 피드백) → full(상세 피드백 조각, 여러 번)
+    → recommendations → done. 생성 도중 실패하면 fallback(기본 피드백 전체)을 보낸 뒤 done 으로 끝납니다.
+
+    Args:
+        date: 조회할 날짜 (YYYY-MM-DD)
+        uid: 인증된 사용자의 uid
+
+    Returns:
+        StreamingResponse: application/x-ndjson 스트림
+    """
+    logger.debug("🤖 AI 피드백 스트리밍 요청: %s", date)
+
+    try:
+        summary = await get_daily_executions(date=date, uid=uid, execution_repo=execution_repo, conditional=None)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("❌ AI 피드백 스트리밍 준비 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to stream daily feedback: {str(e)}"
+        )
+
+    def line(event: str, data) -> bytes:
+        return (json.dumps({"event": event, "data": data}, ensure_ascii=False) + "\n").encode("utf-8")
+
+    async def events():
+        yield line("summary", summary.model_dump())
+
+        cached = await feedback_cache.get_cached(uid, summary)
+        if cached is not None:
+            yield line("short", cached["short"])
+            yield line("full", cached["full"])
+            yield line("recommendations", cached["recommendations"])
+            yield line("done", {"cached": True, "fallback": False})
+            return
+
+        async for event, value in stream_ai_feedback(summary):
+            if event == "feedback":
+                await feedback_cache.store(uid, summary, value)
+                yield line("done", {"cached": False, "fallback": bool(value.get("fallback"))})
+            else:
+                yield line(event, value)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
@@ -0,0 +1,61 @@
+import json
+import os
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없는 환경에서는 표준 json 으로 직렬화
+    orjson = None
+
+# 0 으로 두면 빠른 응답 경로를 끄고 response_model 검증 / 직렬화를 그대로 사용
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "1") != "0"
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트로 직렬화합니다 (orjson 이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """검증 없이 바로 직렬화하는 JSON 응답 (이미 JSON 으로 표현 가능한 dict / list 전용)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ValidatedJSON:
+    """응답 스키마로 한 번만 검증하고 바로 직렬화하는 빠른 응답 경로
+
+    response_model 을 쓰는 핸들러가 모델 객체를 반환하면, 모델 생성 시 한 번,
+    FastAPI 가 응답을 만들 때 다시 검증하고 dict 로 바꾼 뒤 json.dumps 합니다.
+    여기서는 저장소 dict 로 만든 응답 dict 를 strict 모드로 한 번 검증하고 (타입이 이미 맞으므로
+    변환 없이 통과) 그대로 직렬화합니다. strict 검증에 실패하면 (예: 숫자가 문자열로 저장된 옛 문서)
+    기존처럼 lax 모드로 변환한 모델을 직렬화하므로 응답 내용은 response_model 경로와 같습니다.
+
+    response_model 은 그대로 두어 OpenAPI 문서는 바뀌지 않습니다.
+    """
+
+    def __init__(self, type_: Any):
+        self.adapter = TypeAdapter(type_)
+
+    def dump(self, content: Any) -> bytes:
+        try:
+            self.adapter.validate_python(content, strict=True)
+        except ValidationError:
+            return self.adapter.dump_json(self.adapter.validate_python(content))
+        return dumps(content)
+
+    def response(self, content: Any, response: Optional[Response] = None, status_code: int = 200) -> Response:
+        """직렬화한 응답을 반환합니다 (의존성으로 받은 response 에 설정한 헤더도 함께 담음)"""
+        return Response(
+            content=self.dump(content),
+            status_code=status_code,
+            media_type="application/json",
+            headers=dict(response.headers) if response is not None else None,
+        )
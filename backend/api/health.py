@@ -0,0 +1,104 @@
+import importlib
+import logging
+import os
+import threading
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from auth.firebase_init import initialize_firebase
+from repositories.firestore_client import get_firestore_client, has_firestore_client
+
+router = APIRouter(tags=["Health"])
+
+logger = logging.getLogger(__name__)
+
+# 첫 요청 때 불러오도록 미뤄 둔 무거운 모듈 (워밍업에서 미리 불러옴)
+# 하나라도 불러오지 못하면 /ready 가 준비되지 않으므로 Pipfile 로 설치되는 패키지만 넣습니다.
+# (openai 는 Pipfile 에 없으므로 넣지 않고, LLM 클라이언트가 첫 호출 때 불러옴)
+WARM_UP_MODULES = (
+    "firebase_admin.auth",
+    "google.cloud.firestore",
+    "google.oauth2.id_token",
+)
+
+# 워밍업 최대 시도 횟수와 첫 재시도 대기 시간 (이후 두 배씩: 1, 2, 4, 8초...)
+WARM_UP_MAX_ATTEMPTS = int(os.getenv("WARM_UP_MAX_ATTEMPTS", "5"))
+WARM_UP_RETRY_SECONDS = float(os.getenv("WARM_UP_RETRY_SECONDS", "1"))
+
+# starting → ready | retrying → ... → ready | failed
+_state = {"status": "starting", "warm_up_seconds": None, "firebase": None, "error": None, "attempts": 0}
+# 앱 종료 시 재시도 대기를 끝내기 위한 신호
+_stop = threading.Event()
+
+
+def _prepare() -> bool:
+    """모듈과 클라이언트를 준비하고 Firebase 사용 여부를 반환합니다"""
+    for module in WARM_UP_MODULES:
+        importlib.import_module(module)
+
+    firebase_app = initialize_firebase()
+    if firebase_app is not None:
+        get_firestore_client()
+    return firebase_app is not None
+
+
+def warm_up():
+    """무거운 모듈과 Firebase / Firestore 클라이언트를 미리 준비합니다
+
+    앱 시작 직후 백그라운드 스레드에서 실행되며, 끝나면 /ready 가 200 을 반환합니다.
+    워밍업 전에 들어온 요청도 각 경로에서 필요한 것을 직접 준비하므로 정상 처리됩니다.
+    실패하면 WARM_UP_MAX_ATTEMPTS 번까지 간격을 두 배씩 늘려 다시 시도합니다.
+    """
+    started = time.monotonic()
+    for attempt in range(1, WARM_UP_MAX_ATTEMPTS + 1):
+        _state["attempts"] = attempt
+        try:
+            firebase = _prepare()
+        except Exception as e:
+            _state["error"] = str(e)
+            if attempt == WARM_UP_MAX_ATTEMPTS:
+                _state["status"] = "failed"
+                logger.error("❌ 워밍업 실패 (%s회 시도): %s", attempt, e)
+                return
+            delay = WARM_UP_RETRY_SECONDS * 2 ** (attempt - 1)
+            _state["status"] = "retrying"
+            logger.warning("⚠️ 워밍업 실패, %s초 후 다시 시도 (%s/%s): %s", delay, attempt, WARM_UP_MAX_ATTEMPTS, e)
+            if _stop.wait(delay):
+                return
+            continue
+
+        _state.update(
+            status="ready",
+            firebase=firebase,
+            error=None,
+            warm_up_seconds=round(time.monotonic() - started, 3),
+        )
+        logger.info("✅ 워밍업 완료: %s초", _state['warm_up_seconds'])
+        return
+
+
+def stop_warm_up():
+    """진행 중인 워밍업 재시도 대기를 끝냅니다 (앱 종료 시 호출)"""
+    _stop.set()
+
+
+@router.get("/health")
+def liveness():
+    """프로세스 생존 확인 (워밍업 상태와 관계없이 200, 컨테이너 HEALTHCHECK 용)"""
+    return {"status": "OK"}
+
+
+@router.get("/ready")
+def readiness():
+    """준비 상태 확인 (워밍업이 끝나야 200, 그 전이나 실패 시 503)
+
+    워밍업이 실패했더라도 이후 요청의 지연 초기화로 Firestore 클라이언트가 만들어졌으면 ready 로 바꿉니다.
+    `/health` 는 프로세스가 살아 있는지만 확인하는 liveness 용입니다.
+    """
+    if _state["status"] != "ready" and has_firestore_client():
+        _state.update(status="ready", firebase=True, error=None)
+        logger.info("✅ 지연 초기화로 Firestore 준비 완료")
+    status_code = 200 if _state["status"] == "ready" else 503
+    return JSONResponse(status_code=status_code, content=dict(_state))
@@ -0,0 +1,61 @@
+import hmac
+import os
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from api.dependencies import cache_stats, stream_stats
+from auth.middleware import token_cache
+from services.llm_client import get_llm_client
+from services.metrics import (
+    REGISTRY, CACHE_HITS, CACHE_MISSES, CACHE_ENTRIES, LLM_REQUESTS, LLM_TOKENS, LLM_CIRCUIT_OPEN,
+    STREAM_CONNECTIONS, STREAM_LISTENERS, STREAM_EVENTS, STREAM_RESYNCS,
+)
+
+router = APIRouter(tags=["Metrics"])
+
+# 설정하면 /metrics 요청에 "Authorization: Bearer <토큰>" 이 필요함 (내부망 스크레이프만 허용할 때는 비워 둠)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# 캐시마다 항목 수를 담는 통계 키가 다름
+_ENTRY_KEYS = ("size", "users", "entries")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def collect_runtime_stats():
+    """캐시 / LLM 클라이언트가 직접 세고 있는 누적 값을 지표로 옮깁니다 (스크레이프마다 호출)"""
+    caches = {"token": token_cache.stats(), **cache_stats()}
+    for name, stats in caches.items():
+        CACHE_HITS.set_total(name, value=stats["hits"])
+        CACHE_MISSES.set_total(name, value=stats["misses"])
+        CACHE_ENTRIES.set(name, value=next((stats[key] for key in _ENTRY_KEYS if key in stats), 0))
+
+    llm = get_llm_client()
+    LLM_REQUESTS.set_total(value=llm.requests)
+    LLM_TOKENS.set_total("prompt", value=llm.prompt_tokens)
+    LLM_TOKENS.set_total("completion", value=llm.completion_tokens)
+    LLM_CIRCUIT_OPEN.set(value=0 if llm.breaker.state == "closed" else 1)
+
+    stream = stream_stats()
+    STREAM_CONNECTIONS.set(value=stream["connections"])
+    STREAM_LISTENERS.set(value=stream["users"])
+    STREAM_EVENTS.set_total(value=stream["events"])
+    STREAM_RESYNCS.set_total(value=stream["resyncs"])
+
+
+REGISTRY.on_collect(collect_runtime_stats)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(authorization: str = Header(None)):
+    """Prometheus 텍스트 형식의 지표
+
+    - 경로별 요청 지연 시간, 토큰 검증 지연 시간, Firestore 작업별 지연 시간 / 횟수
+    - AI 피드백 생성 지연 시간, LLM 요청 / 토큰 수, 서킷 상태
+    - 프로세스 내 캐시(token, routines, feedback, timetable, idempotency) 적중 / 미스 / 항목 수
+    - 실시간 스트림 연결 / 리스너 수, 변경 이벤트 / resync 수
+    """
+    if METRICS_TOKEN and not hmac.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
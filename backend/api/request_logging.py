@@ -0,0 +1,165 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from services.metrics import REQUEST_LATENCY
+
+# json: 한 줄 JSON (운영), text: 사람이 읽기 쉬운 형식 (로컬 개발)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# 성공(4xx/5xx 가 아닌) 요청 중 로그로 남길 비율. 오류와 느린 요청은 항상 남김
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "0.1"))
+REQUEST_LOG_SLOW_MS = float(os.getenv("REQUEST_LOG_SLOW_MS", "500"))
+# 연결을 오래 유지하는 스트리밍 응답 (지연 시간은 응답 시작까지만 기록)
+STREAMING_MEDIA_TYPES = (b"text/event-stream", b"application/x-ndjson")
+
+access_logger = logging.getLogger("uphill.access")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON 으로 출력 (extra={"fields": {...}} 는 최상위 키로 합침)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """같은 프로세스의 리스너로 레코드를 그대로 넘기는 큐 핸들러
+
+    기본 QueueHandler 는 프로세스 간 전달을 위해 요청 스레드에서 메시지를 포맷하고 레코드를 복사하는데,
+    리스너가 같은 프로세스에 있으므로 그 작업을 리스너 스레드로 미룹니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging():
+    """루트 로거를 큐 핸들러로 설정합니다 (여러 번 호출해도 한 번만 적용)
+
+    요청을 처리하는 스레드는 레코드를 큐에 넣기만 하고, 포맷과 출력은 QueueListener 스레드가 맡습니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _LocalQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(_LocalQueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드를 멈춥니다"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+
+
+# 라우트에 매칭되지 않은 요청의 경로 값
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestLoggingMiddleware:
+    """요청마다 한 줄 구조화 로그를 남기고 경로별 지연 시간 히스토그램을 기록하는 ASGI 미들웨어
+
+    - 메서드, 경로 템플릿(/routines/{routine_id}), 상태 코드, 처리 시간(ms) 을 기록합니다.
+      실제 경로 대신 템플릿을 남겨 id 같은 값이 로그에 퍼지지 않도록 합니다.
+    - 성공 요청은 sample_rate 비율만, 오류(>= 400)와 느린 요청(>= slow_ms)은 항상 기록합니다.
+    - 히스토그램은 샘플링 없이 모든 요청을 기록합니다.
+    - 매칭되지 않은 경로(404 스캔 등)는 로그와 히스토그램 모두 "unmatched" 로 남겨
+      URL 에 든 id / 토큰이 로그에 남거나 경로 값 종류가 끝없이 늘지 않도록 합니다.
+    - 스트리밍 응답(SSE / NDJSON)은 연결 유지 시간 대신 응답 시작(http.response.start)까지의 시간을
+      그 시점에 기록하고, 로그에는 스트림 전체 시간을 stream_ms 로 함께 남깁니다.
+    """
+
+    def __init__(self, app, sample_rate: float = REQUEST_LOG_SAMPLE_RATE, slow_ms: float = REQUEST_LOG_SLOW_MS):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        # 스트리밍 응답이면 응답 시작까지의 시간 (히스토그램은 이때 이미 기록됨)
+        stream_started: Optional[float] = None
+
+        async def send_with_status(message):
+            nonlocal status_code, stream_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if _is_streaming(message.get("headers", ())):
+                    stream_started = time.perf_counter() - started
+                    route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+                    REQUEST_LATENCY.observe(stream_started, scope["method"], route, str(status_code))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            duration = elapsed if stream_started is None else stream_started
+            duration_ms = duration * 1000
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            if stream_started is None:
+                REQUEST_LATENCY.observe(duration, scope["method"], route, str(status_code))
+            if (
+                status_code >= 400
+                or duration_ms >= self.slow_ms
+                or random.random() < self.sample_rate
+            ) and access_logger.isEnabledFor(logging.INFO):
+                fields = {
+                    "method": scope["method"],
+                    "path": route,
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                }
+                if stream_started is not None:
+                    fields["stream_ms"] = round(elapsed * 1000, 2)
+                access_logger.info("request", extra={"fields": fields})
+
+
+def _is_streaming(headers) -> bool:
+    """응답 헤더의 Content-Type 이 스트리밍 형식인지"""
+    for name, value in headers:
+        if name.lower() == b"content-type":
+            return value.split(b";")[0].strip().lower() in STREAMING_MEDIA_TYPES
+    return False
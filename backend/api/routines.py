@@ -1,29 +1,228 @@
-from fastapi import APIRouter, HTTPException, Depends
-from firebase_admin import firestore
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from auth.middleware import verify_firebase_token
-from api.schemas import RoutineCreate, RoutineUpdate, RoutineResponse
+from repositories.executor import run_blocking
+from repositories.routine_repository import IRoutineRepository
+from api.dependencies import get_routine_repository, get_timetable_cache
+from api.conditional import ConditionalGet, make_etag
+from api.fast_json import FAST_JSON_RESPONSES, FastJSONResponse, ValidatedJSON
+from api.schemas import (
+    RoutineCreate, RoutineUpdate, RoutineResponse, RoutineBatchCreate, BatchItemResult, BatchResponse,
+    TimetableEntryResponse, TimetableDayResponse, TimetableResponse,
+    RescheduleRequest, RescheduleResponse, RoutineShiftResponse,
+)
+from services.scheduler import plan_reschedule
+from services.timetable import TimetableCache, TimetableEntry, WeeklyTimetable, DAY_MINUTES, format_minutes
+import asyncio
+import base64
+import binascii
+import json
 import logging
-from datetime import datetime
-from typing import List
+import re
+from datetime import date as date_cls, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 
 router = APIRouter(prefix="/routines", tags=["Routines"])
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Firebase 초기화 확인
-import auth.firebase_init
+# 목록 조회 페이지 크기 상한과 ?fields= 로 고를 수 있는 필드
+MAX_ROUTINE_PAGE_SIZE = 200
+ROUTINE_FIELDS = set(RoutineResponse.model_fields)
+ROUTINE_LIST_JSON = ValidatedJSON(List[RoutineResponse])
 
 
-def get_db():
-    """Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
-    return firestore.client(database_id="uphilldb")
+def routine_row(data: dict, uid: str) -> dict:
+    """저장소에서 읽은 루틴 딕셔너리를 응답 스키마 형태의 dict 로 바꿉니다 (없는 필드는 기본값)"""
+    return {
+        "id": data["id"],
+        "uid": data.get("uid", uid),
+        "title": data.get("title", ""),
+        "time": data.get("time", ""),
+        "category": data.get("category", ""),
+        "color": data.get("color"),
+        "days": data.get("days"),
+        "duration_minutes": data.get("duration_minutes"),
+        "flexibility_minutes": data.get("flexibility_minutes"),
+        "created_at": data.get("created_at", ""),
+        "updated_at": data.get("updated_at", ""),
+    }
+
+
+def to_routine_response(data: dict, uid: str) -> RoutineResponse:
+    """저장소에서 읽은 루틴 딕셔너리를 응답 스키마로 변환합니다"""
+    return RoutineResponse(**routine_row(data, uid))
+
+
+def validate_time_format(time_str: str):
+    """루틴 시간이 HH:MM 형식인지 검증합니다 (잘못되면 400)"""
+    time_parts = time_str.split(":")
+    if len(time_parts) != 2:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid time format. Expected HH:MM"
+        )
+    try:
+        hour, minute = int(time_parts[0]), int(time_parts[1])
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid time format. Expected HH:MM"
+        )
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid time values. Hour must be 0-23, minute must be 0-59"
+        )
+
+
+def encode_cursor(after: Tuple[str, str]) -> str:
+    """(time, id) 커서를 URL 에 넣을 수 있는 문자열로 만듭니다"""
+    raw = json.dumps(list(after), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """encode_cursor 로 만든 커서를 해석합니다 (잘못되면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        time_value, routine_id = json.loads(raw)
+        if not isinstance(time_value, str) or not isinstance(routine_id, str):
+            raise ValueError(cursor)
+        return time_value, routine_id
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid cursor"
+        )
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """?fields=id,title,time 형식의 필드 목록을 검증합니다 (모르는 필드면 400)"""
+    if fields is None:
+        return None
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in selected if field not in ROUTINE_FIELDS]
+    if not selected or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid fields: {', '.join(unknown) or fields}. Allowed: {', '.join(sorted(ROUTINE_FIELDS))}"
+        )
+    return selected
+
+
+def parse_week(week: Optional[str], today: date_cls) -> date_cls:
+    """ISO 주차(YYYY-Www)의 월요일을 반환합니다 (없으면 today 가 속한 주, 잘못되면 400)"""
+    if week is None:
+        return today - timedelta(days=today.weekday())
+    match = re.fullmatch(r"(\d{4})-W(\d{2})", week)
+    try:
+        if match is None:
+            raise ValueError(week)
+        return date_cls.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid week format. Use YYYY-Www (e.g. 2026-W03)"
+        )
+
+
+def to_timetable_entry(entry: TimetableEntry, monday: date_cls, timetable: WeeklyTimetable) -> TimetableEntryResponse:
+    """시간표 칸을 monday 로 시작하는 주의 날짜가 붙은 응답으로 변환합니다"""
+    return TimetableEntryResponse(
+        routine_id=entry.routine_id,
+        title=entry.title,
+        category=entry.category,
+        color=entry.color,
+        day=entry.day,
+        date=(monday + timedelta(days=entry.day)).isoformat(),
+        start=format_minutes(entry.start),
+        end=format_minutes(entry.end),
+        conflicts_with=sorted({other.routine_id for other in timetable.conflicts_of(entry)}),
+    )
+
+
+def build_routine_data(uid: str, routine: RoutineCreate, now_str: str) -> dict:
+    """Firestore 에 저장할 루틴 문서를 만듭니다"""
+    return {
+        "uid": uid,
+        "title": routine.title,
+        "time": routine.time,
+        "category": routine.category,
+        "color": routine.color,
+        "days": routine.days,  # 반복 요일
+        "duration_minutes": routine.duration_minutes,
+        "flexibility_minutes": routine.flexibility_minutes,
+        "created_at": now_str,
+        "updated_at": now_str,
+    }
+
+
+@router.post(":batch", response_model=BatchResponse)
+async def create_routines_batch(
+    batch: RoutineBatchCreate,
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
+):
+    """
+    여러 루틴을 한 번에 생성합니다 (오프라인 동기화용, 최대 500개).
+
+    모든 항목을 한 번에 검증한 뒤 유효한 항목만 하나의 WriteBatch 로 저장합니다.
+
+    Args:
+        batch: 생성할 루틴 목록
+        uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
+
+    Returns:
+        BatchResponse: 항목별 처리 결과
+    """
+    logger.debug("📦 루틴 일괄 생성 요청: %s개", len(batch.routines))
+
+    try:
+        now_str = datetime.utcnow().isoformat()
+
+        results: List[BatchItemResult] = []
+        valid_indexes = []
+        routine_docs = []
+
+        for index, routine in enumerate(batch.routines):
+            try:
+                validate_time_format(routine.time)
+            except HTTPException as e:
+                results.append(BatchItemResult(index=index, status=e.status_code, error=e.detail))
+                continue
+            valid_indexes.append(index)
+            routine_docs.append(build_routine_data(uid, routine, now_str))
+            results.append(BatchItemResult(index=index, status=201))
+
+        if routine_docs:
+            routine_ids = await run_blocking(repo.create_many, uid, routine_docs)
+            timetable_cache.invalidate(uid)
+            for index, routine_id in zip(valid_indexes, routine_ids):
+                results[index].id = routine_id
+
+        logger.debug("✅ 루틴 일괄 생성 완료: %s/%s개", len(routine_docs), len(results))
+
+        return BatchResponse(
+            created=len(routine_docs),
+            failed=len(results) - len(routine_docs),
+            results=results,
+        )
+
+    except Exception as e:
+        logger.error("❌ 루틴 일괄 생성 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create routines: {str(e)}"
+        )
 
 
 @router.post("", response_model=RoutineResponse, status_code=201)
 async def create_routine(
     routine: RoutineCreate,
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
 ):
     """
     새로운 루틴을 생성합니다.
@@ -35,70 +234,29 @@ async def create_routine(
     Returns:
         RoutineResponse: 생성된 루틴 정보
     """
-    logger.info("=" * 60)
-    logger.info("📝 루틴 생성 요청 수신")
-    logger.info(f"   - UID: {uid}")
-    logger.info(f"   - 제목: {routine.title}")
-    logger.info(f"   - 시간: {routine.time}")
-    logger.info(f"   - 카테고리: {routine.category}")
-    logger.info("=" * 60)
     
     try:
         # 시간 형식 검증 (HH:MM)
-        time_parts = routine.time.split(":")
-        if len(time_parts) != 2:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid time format. Expected HH:MM"
-            )
-        hour, minute = int(time_parts[0]), int(time_parts[1])
-        if not (0 <= hour < 24 and 0 <= minute < 60):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid time values. Hour must be 0-23, minute must be 0-59"
-            )
+        validate_time_format(routine.time)
         
         # 현재 시간
-        now = datetime.utcnow()
-        now_str = now.isoformat()
+        now_str = datetime.utcnow().isoformat()
         
         # Firestore에 루틴 저장
-        routine_data = {
-            "uid": uid,
-            "title": routine.title,
-            "time": routine.time,
-            "category": routine.category,
-            "color": routine.color,
-            "days": routine.days,  # 반복 요일
-            "created_at": now_str,
-            "updated_at": now_str,
-        }
+        routine_data = build_routine_data(uid, routine, now_str)
         
         # 사용자별 루틴 컬렉션에 저장
-        db = get_db()
-        doc_ref = db.collection("users").document(uid).collection("routines").document()
-        doc_ref.set(routine_data)
+        routine_id = await run_blocking(repo.create, uid, routine_data)
+        timetable_cache.invalidate(uid)
         
-        routine_id = doc_ref.id
+        logger.debug("✅ 루틴 생성 성공: %s", routine_id)
         
-        logger.info(f"✅ 루틴 생성 성공: {routine_id}")
-        
-        return RoutineResponse(
-            id=routine_id,
-            uid=uid,
-            title=routine.title,
-            time=routine.time,
-            category=routine.category,
-            color=routine.color,
-            days=routine.days,
-            created_at=now_str,
-            updated_at=now_str,
-        )
+        return to_routine_response({**routine_data, "id": routine_id}, uid)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 루틴 생성 실패: {e}")
+        logger.error("❌ 루틴 생성 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create routine: {str(e)}"
@@ -107,67 +265,220 @@ async def create_routine(
 
 @router.get("", response_model=List[RoutineResponse])
 async def get_routines(
-    uid: str = Depends(verify_firebase_token)
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_ROUTINE_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    conditional: ConditionalGet = Depends()
 ):
     """
-    현재 로그인한 사용자의 모든 루틴을 조회합니다.
-    
+    현재 로그인한 사용자의 루틴을 시간순으로 조회합니다.
+
+    limit 또는 cursor 를 주면 (time, id) 순으로 한 페이지만 읽고, 다음 페이지 커서를
+    X-Next-Cursor 헤더로 돌려줍니다 (마지막 페이지면 헤더 없음).
+    fields 를 주면 해당 필드만 담아 응답합니다 (예: ?fields=id,title,time).
+    응답에는 ETag 가 붙으며, If-None-Match 가 일치하면 본문 없이 304 를 반환합니다.
+
     Args:
+        limit: 페이지 크기 (최대 200, 생략하면 전체)
+        cursor: 이전 응답의 X-Next-Cursor 값
+        fields: 쉼표로 구분한 응답 필드 목록
         uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
-        
+
     Returns:
         List[RoutineResponse]: 사용자의 루틴 목록
     """
-    logger.info("=" * 60)
-    logger.info("📋 루틴 조회 요청 수신")
-    logger.info(f"   - UID: {uid}")
-    logger.info("=" * 60)
-    
+
+    selected = parse_fields(fields)
+    after = decode_cursor(cursor) if cursor is not None else None
+
     try:
-        # 사용자의 루틴 컬렉션에서 모든 루틴 조회
-        db = get_db()
-        routines_ref = db.collection("users").document(uid).collection("routines")
-        docs = routines_ref.stream()
-        
-        routines = []
-        for doc in docs:
-            data = doc.to_dict()
-            routines.append(
-                RoutineResponse(
-                    id=doc.id,
-                    uid=data.get("uid", uid),
-                    title=data.get("title", ""),
-                    time=data.get("time", ""),
-                    category=data.get("category", ""),
-                    color=data.get("color"),
-                    days=data.get("days"),
-                    created_at=data.get("created_at", ""),
-                    updated_at=data.get("updated_at", ""),
-                )
+        headers = {}
+        if limit is None and after is None:
+            # 사용자의 루틴 컬렉션에서 모든 루틴 조회
+            docs = await run_blocking(repo.get_all_by_user, uid)
+            # 시간순으로 정렬 (페이지 조회와 같은 순서)
+            docs.sort(key=lambda x: (x.get("time", ""), x["id"]))
+        else:
+            docs, next_after = await run_blocking(
+                repo.get_page, uid, limit or MAX_ROUTINE_PAGE_SIZE, after, selected
             )
-        
-        # 시간순으로 정렬
-        routines.sort(key=lambda x: x.time)
-        
-        logger.info(f"✅ 루틴 조회 성공: {len(routines)}개")
-        
-        return routines
-        
+            if next_after is not None:
+                headers["X-Next-Cursor"] = encode_cursor(next_after)
+
+        logger.debug("✅ 루틴 조회 성공: %s개", len(docs))
+
+        response.headers.update(headers)
+        etag = make_etag(
+            "routines", selected, cursor, limit,
+            [(data["id"], data.get("updated_at")) for data in docs],
+        )
+        if conditional.not_modified(etag):
+            return conditional.not_modified_response()
+
+        if selected is not None:
+            # 필드 선택 응답은 스키마 검증 없이 바로 직렬화
+            return FastJSONResponse(
+                content=[{field: data.get(field) for field in selected} for data in docs],
+                headers=dict(response.headers),
+            )
+
+        if FAST_JSON_RESPONSES:
+            return ROUTINE_LIST_JSON.response([routine_row(data, uid) for data in docs], response)
+
+        return [to_routine_response(data, uid) for data in docs]
+
     except Exception as e:
-        logger.error(f"❌ 루틴 조회 실패: {e}")
+        logger.error("❌ 루틴 조회 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch routines: {str(e)}"
         )
 
 
+@router.get("/timetable", response_model=TimetableResponse)
+async def get_timetable(
+    week: Optional[str] = Query(None, description="ISO 주차 (YYYY-Www, 기본값: 이번 주)"),
+    at: Optional[datetime] = Query(None, description="현재/다음 루틴을 찾을 기준 시각 (사용자 현지 시각)"),
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
+):
+    """
+    요일별로 펼친 주간 루틴 시간표를 조회합니다.
+
+    루틴의 반복 요일(days)과 시작 시각(time)으로 요일별 칸을 만들고, 시간이 겹치는 루틴을
+    conflicts_with 에 표시합니다. at 을 주면 그 시각에 진행 중인 루틴(current)과
+    다음에 시작할 루틴(next)도 함께 돌려줍니다.
+
+    Args:
+        week: 조회할 ISO 주차 (기본값: at 또는 오늘이 속한 주)
+        at: 기준 시각 (시간대 정보는 무시하고 요일과 시:분만 사용)
+        uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
+
+    Returns:
+        TimetableResponse: 주간 시간표
+    """
+    logger.debug("🗓️ 루틴 시간표 조회 요청: %s", week or 'this week')
+
+    today = at.date() if at is not None else datetime.now(timezone.utc).date()
+    monday = parse_week(week, today)
+
+    try:
+        routines = await run_blocking(repo.get_all_by_user, uid)
+        timetable = timetable_cache.get(uid, routines)
+
+        days = [
+            TimetableDayResponse(
+                day=day,
+                date=(monday + timedelta(days=day)).isoformat(),
+                entries=[to_timetable_entry(entry, monday, timetable) for entry in timetable.on_day(day)],
+            )
+            for day in range(7)
+        ]
+
+        current: List[TimetableEntryResponse] = []
+        next_entry: Optional[TimetableEntryResponse] = None
+        if at is not None:
+            minute = at.weekday() * DAY_MINUTES + at.hour * 60 + at.minute
+            at_monday = at.date() - timedelta(days=at.weekday())
+            for entry in timetable.at(minute):
+                # 지난주 일요일 밤에 시작한 칸이면 그 주의 날짜로 표시
+                entry_monday = at_monday if entry.start <= minute else at_monday - timedelta(days=7)
+                current.append(to_timetable_entry(entry, entry_monday, timetable))
+            upcoming = timetable.next_after(minute)
+            if upcoming is not None:
+                upcoming_monday = at_monday if upcoming.start > minute else at_monday + timedelta(days=7)
+                next_entry = to_timetable_entry(upcoming, upcoming_monday, timetable)
+
+        iso_year, iso_week, _ = monday.isocalendar()
+        logger.debug("✅ 루틴 시간표 조회 성공: %s칸", len(timetable))
+
+        return TimetableResponse(
+            week=f"{iso_year}-W{iso_week:02d}",
+            start=monday.isoformat(),
+            end=(monday + timedelta(days=6)).isoformat(),
+            days=days,
+            current=current,
+            next=next_entry,
+        )
+
+    except Exception as e:
+        logger.error("❌ 루틴 시간표 조회 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch timetable: {str(e)}"
+        )
+
+
+@router.post("/reschedule", response_model=RescheduleResponse)
+async def reschedule_routines(
+    request: RescheduleRequest,
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
+):
+    """
+    시간이 겹치는 루틴을 유연성(flexibility_minutes) 범위 안에서 최소한으로 옮깁니다.
+
+    유연성이 작은 루틴과 먼저 만든 루틴이 자리를 지키고, 나머지 루틴이 가장 가까운 빈 시각으로
+    옮겨집니다. apply 가 false 면 계획만 돌려주고, true 면 바뀐 루틴의 time 을 바로 수정합니다.
+
+    Args:
+        request: 적용 여부
+        uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
+
+    Returns:
+        RescheduleResponse: 옮겨지는 루틴과 남은 충돌 정보
+    """
+    logger.debug("🔀 루틴 자동 조정 요청 (apply=%s)", request.apply)
+
+    try:
+        routines = await run_blocking(repo.get_all_by_user, uid)
+        plan = plan_reschedule(routines)
+
+        if request.apply and plan.changes:
+            now_str = datetime.utcnow().isoformat()
+            await asyncio.gather(*[
+                run_blocking(repo.update, uid, change.routine_id, {"time": change.to_time, "updated_at": now_str})
+                for change in plan.changes
+            ])
+            timetable_cache.invalidate(uid)
+
+        logger.debug(
+            "✅ 루틴 자동 조정 완료: %s개 이동, 충돌 %s → %s",
+            len(plan.changes), plan.conflicts_before, plan.conflicts_after,
+        )
+
+        return RescheduleResponse(
+            applied=request.apply and bool(plan.changes),
+            changes=[RoutineShiftResponse(**vars(change)) for change in plan.changes],
+            unresolved=plan.unresolved,
+            conflicts_before=plan.conflicts_before,
+            conflicts_after=plan.conflicts_after,
+        )
+
+    except Exception as e:
+        logger.error("❌ 루틴 자동 조정 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to reschedule routines: {str(e)}"
+        )
+
+
 @router.get("/{routine_id}", response_model=RoutineResponse)
 async def get_routine(
     routine_id: str,
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    conditional: ConditionalGet = Depends()
 ):
     """
     특정 루틴의 상세 정보를 조회합니다.
+
+    updated_at 기반 ETag 를 붙이며, If-None-Match 가 일치하면 본문 없이 304 를 반환합니다.
     
     Args:
         routine_id: 루틴 ID
@@ -176,37 +487,26 @@ async def get_routine(
     Returns:
         RoutineResponse: 루틴 상세 정보
     """
-    logger.info(f"📋 루틴 상세 조회 요청: {routine_id}")
+    logger.debug("📋 루틴 상세 조회 요청: %s", routine_id)
     
     try:
-        db = get_db()
-        doc_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
-        doc = doc_ref.get()
+        data = await run_blocking(repo.get_by_id, uid, routine_id)
         
-        if not doc.exists:
+        if data is None:
             raise HTTPException(
                 status_code=404,
                 detail="Routine not found"
             )
-        
-        data = doc.to_dict()
-
-        return RoutineResponse(
-            id=doc.id,
-            uid=data.get("uid", uid),
-            title=data.get("title", ""),
-            time=data.get("time", ""),
-            category=data.get("category", ""),
-            color=data.get("color"),
-            days=data.get("days"),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-        )
+
+        if conditional.not_modified(make_etag("routine", routine_id, data.get("updated_at"))):
+            return conditional.not_modified_response()
+
+        return to_routine_response(data, uid)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 루틴 조회 실패: {e}")
+        logger.error("❌ 루틴 조회 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch routine: {str(e)}"
@@ -217,7 +517,9 @@ async def get_routine(
 async def update_routine(
     routine_id: str,
     routine_update: RoutineUpdate,
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
 ):
     """
     루틴을 수정합니다.
@@ -230,33 +532,12 @@ async def update_routine(
     Returns:
         RoutineResponse: 수정된 루틴 정보
     """
-    logger.info(f"✏️ 루틴 수정 요청: {routine_id}")
+    logger.debug("✏️ 루틴 수정 요청: %s", routine_id)
     
     try:
-        db = get_db()
-        doc_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
-        doc = doc_ref.get()
-        
-        if not doc.exists:
-            raise HTTPException(
-                status_code=404,
-                detail="Routine not found"
-            )
-        
         # 시간 형식 검증 (제공된 경우)
         if routine_update.time:
-            time_parts = routine_update.time.split(":")
-            if len(time_parts) != 2:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid time format. Expected HH:MM"
-                )
-            hour, minute = int(time_parts[0]), int(time_parts[1])
-            if not (0 <= hour < 24 and 0 <= minute < 60):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid time values. Hour must be 0-23, minute must be 0-59"
-                )
+            validate_time_format(routine_update.time)
         
         # 업데이트할 데이터 준비
         update_data = {
@@ -273,32 +554,29 @@ async def update_routine(
             update_data["color"] = routine_update.color
         if routine_update.days is not None:
             update_data["days"] = routine_update.days
+        if routine_update.duration_minutes is not None:
+            update_data["duration_minutes"] = routine_update.duration_minutes
+        if routine_update.flexibility_minutes is not None:
+            update_data["flexibility_minutes"] = routine_update.flexibility_minutes
         
-        # Firestore 업데이트
-        doc_ref.update(update_data)
+        # 저장소 업데이트 (존재 전제조건을 건 단일 쓰기, 수정된 문서 반환)
+        data = await run_blocking(repo.update, uid, routine_id, update_data)
+        timetable_cache.invalidate(uid)
         
-        # 업데이트된 문서 가져오기
-        updated_doc = doc_ref.get()
-        data = updated_doc.to_dict()
+        if data is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Routine not found"
+            )
         
-        logger.info(f"✅ 루틴 수정 성공: {routine_id}")
-
-        return RoutineResponse(
-            id=updated_doc.id,
-            uid=data.get("uid", uid),
-            title=data.get("title", ""),
-            time=data.get("time", ""),
-            category=data.get("category", ""),
-            color=data.get("color"),
-            days=data.get("days"),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-        )
+        logger.debug("✅ 루틴 수정 성공: %s", routine_id)
+
+        return to_routine_response(data, uid)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 루틴 수정 실패: {e}")
+        logger.error("❌ 루틴 수정 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update routine: {str(e)}"
@@ -308,7 +586,9 @@ async def update_routine(
 @router.delete("/{routine_id}", status_code=204)
 async def delete_routine(
     routine_id: str,
-    uid: str = Depends(verify_firebase_token)
+    uid: str = Depends(verify_firebase_token),
+    repo: IRoutineRepository = Depends(get_routine_repository),
+    timetable_cache: TimetableCache = Depends(get_timetable_cache)
 ):
     """
     루틴을 삭제합니다.
@@ -317,27 +597,24 @@ async def delete_routine(
         routine_id: 루틴 ID
         uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
     """
-    logger.info(f"🗑️ 루틴 삭제 요청: {routine_id}")
+    logger.debug("🗑️ 루틴 삭제 요청: %s", routine_id)
     
     try:
-        db = get_db()
-        doc_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
-        doc = doc_ref.get()
+        deleted = await run_blocking(repo.delete, uid, routine_id)
+        timetable_cache.invalidate(uid)
         
-        if not doc.exists:
+        if not deleted:
             raise HTTPException(
                 status_code=404,
                 detail="Routine not found"
             )
         
-        doc_ref.delete()
-        
-        logger.info(f"✅ 루틴 삭제 성공: {routine_id}")
+        logger.debug("✅ 루틴 삭제 성공: %s", routine_id)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 루틴 삭제 실패: {e}")
+        logger.error("❌ 루틴 삭제 실패: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to delete routine: {str(e)}"
@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import time
 
+# Firestore WriteBatch 한 번에 담을 수 있는 최대 쓰기 수
+MAX_BATCH_SIZE = 500
+
 
 class RoutineCreate(BaseModel):
     """루틴 생성 요청 스키마"""
@@ -10,6 +13,8 @@ class RoutineCreate(BaseModel):
     category: str
     color: Optional[str] = None  # 색상 코드 (예: "#FF5722")
     days: Optional[List[int]] = None  # 반복 요일 (0=월, 1=화, ..., 6=일)
+    duration_minutes: Optional[int] = Field(None, ge=1, le=1440)  # 소요 시간 (없으면 30분으로 간주)
+    flexibility_minutes: Optional[int] = Field(None, ge=0, le=720)  # 자동 조정 시 앞뒤로 옮길 수 있는 시간 (없으면 고정)
 
 
 class RoutineUpdate(BaseModel):
@@ -19,6 +24,8 @@ class RoutineUpdate(BaseModel):
     category: Optional[str] = None
     color: Optional[str] = None
     days: Optional[List[int]] = None  # 반복 요일 (0=월, 1=화, ..., 6=일)
+    duration_minutes: Optional[int] = Field(None, ge=1, le=1440)  # 소요 시간 (없으면 30분으로 간주)
+    flexibility_minutes: Optional[int] = Field(None, ge=0, le=720)  # 자동 조정 시 앞뒤로 옮길 수 있는 시간 (없으면 고정)
 
 
 class RoutineResponse(BaseModel):
@@ -30,10 +37,72 @@ class RoutineResponse(BaseModel):
     category: str
     color: Optional[str] = None
     days: Optional[List[int]] = None  # 반복 요일 (0=월, 1=화, ..., 6=일)
+    duration_minutes: Optional[int] = None
+    flexibility_minutes: Optional[int] = None
     created_at: str
     updated_at: str
 
 
+class RoutineBatchCreate(BaseModel):
+    """루틴 일괄 생성 요청 스키마"""
+    routines: List[RoutineCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+# ===== 루틴 시간표 스키마 =====
+
+class TimetableEntryResponse(BaseModel):
+    """시간표의 한 칸 (특정 날짜에 반복되는 루틴)"""
+    routine_id: str
+    title: str
+    category: str
+    color: Optional[str] = None
+    day: int                      # 요일 (0=월, ..., 6=일)
+    date: str                     # YYYY-MM-DD
+    start: str                    # HH:MM
+    end: str                      # HH:MM (자정을 넘기면 다음 날 시각)
+    conflicts_with: List[str] = []  # 시간이 겹치는 다른 루틴 ID
+
+
+class TimetableDayResponse(BaseModel):
+    """시간표 하루치"""
+    day: int
+    date: str
+    entries: List[TimetableEntryResponse]
+
+
+class TimetableResponse(BaseModel):
+    """주간 시간표 응답 스키마"""
+    week: str                     # ISO 주차 (YYYY-Www)
+    start: str                    # 월요일
+    end: str                      # 일요일
+    days: List[TimetableDayResponse]
+    current: List[TimetableEntryResponse] = []     # at 시각에 진행 중인 루틴
+    next: Optional[TimetableEntryResponse] = None  # at 시각 이후 처음 시작하는 루틴
+
+
+class RescheduleRequest(BaseModel):
+    """루틴 자동 조정 요청 스키마"""
+    apply: bool = False           # True 면 계산한 시각으로 루틴을 바로 수정
+
+
+class RoutineShiftResponse(BaseModel):
+    """자동 조정으로 옮겨지는 루틴"""
+    routine_id: str
+    title: str
+    from_time: str                # HH:MM
+    to_time: str                  # HH:MM
+    shift_minutes: int            # 양수면 늦춤, 음수면 당김
+
+
+class RescheduleResponse(BaseModel):
+    """루틴 자동 조정 응답 스키마"""
+    applied: bool
+    changes: List[RoutineShiftResponse]
+    unresolved: List[str]         # 유연성 범위 안에서 자리를 찾지 못한 루틴 ID
+    conflicts_before: int         # 겹치는 (루틴, 루틴, 요일) 쌍 수
+    conflicts_after: int
+
+
 # ===== 루틴 수행 기록 스키마 =====
 
 class ExecutionCreate(BaseModel):
@@ -45,6 +114,11 @@ class ExecutionCreate(BaseModel):
     duration_seconds: int
 
 
+class ExecutionBatchCreate(BaseModel):
+    """루틴 수행 기록 일괄 생성 요청 스키마"""
+    executions: List[ExecutionCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class ExecutionResponse(BaseModel):
     """루틴 수행 기록 응답 스키마"""
     id: str
@@ -65,6 +139,54 @@ class DailySummaryResponse(BaseModel):
     executions: List[ExecutionResponse]
 
 
+class RoutineDailyStat(BaseModel):
+    """루틴별 일간 집계"""
+    routine_id: str
+    routine_title: str
+    count: int
+    duration_seconds: int
+
+
+class DailyStatsResponse(BaseModel):
+    """일간 집계 응답 스키마 (수행 기록 목록 없이 통계만)"""
+    date: str
+    total_routines: int
+    total_duration_seconds: int
+    routines: List[RoutineDailyStat]
+
+
+class PeriodStats(BaseModel):
+    """기간(일/주/월) 하나의 집계"""
+    period: str                   # 2026-01-15 / 2026-W03 / 2026-01
+    start: str
+    end: str
+    total_routines: int
+    total_duration_seconds: int
+    routines: List[RoutineDailyStat]
+
+
+class RoutineRangeSummary(BaseModel):
+    """조회 범위 전체에 대한 루틴별 요약"""
+    routine_id: str
+    routine_title: str
+    count: int
+    duration_seconds: int
+    active_days: int              # 수행한 날 수
+    current_streak: int           # 종료일(또는 전날)까지 이어지는 연속 수행 일수
+    longest_streak: int           # 범위 내 최장 연속 수행 일수
+
+
+class RangeStatsResponse(BaseModel):
+    """기간 통계 응답 스키마"""
+    granularity: str              # day | week | month
+    start: str                    # 기간 경계에 맞춘 시작일
+    end: str                      # 기간 경계에 맞춘 종료일
+    total_routines: int
+    total_duration_seconds: int
+    periods: List[PeriodStats]
+    routines: List[RoutineRangeSummary]
+
+
 class DailyFeedbackResponse(BaseModel):
     """일간 AI 피드백 응답 스키마"""
     date: str
@@ -73,3 +195,37 @@ class DailyFeedbackResponse(BaseModel):
     ai_feedback_full: str         # 상세 피드백
     recommended_routines: List[str]  # 추천 루틴 목록
 
+
+# ===== 증분 동기화 스키마 =====
+
+class TombstoneResponse(BaseModel):
+    """삭제된 문서 기록"""
+    collection: str               # routines | executions
+    id: str                       # 삭제된 문서 ID
+    deleted_at: str
+
+
+class SyncResponse(BaseModel):
+    """증분 동기화 응답 스키마 (since 커서 이후 바뀐 문서만)"""
+    routines: List[RoutineResponse]        # 생성 / 수정된 루틴
+    executions: List[ExecutionResponse]    # 생성된 수행 기록
+    deleted: List[TombstoneResponse]       # 삭제된 문서
+    cursor: str                   # 다음 요청의 since 값
+    has_more: bool                # True 면 같은 cursor 로 바로 다시 요청
+
+
+# ===== 일괄 처리 공통 스키마 =====
+
+class BatchItemResult(BaseModel):
+    """일괄 처리 항목별 결과"""
+    index: int                    # 요청 목록에서의 위치
+    status: int                   # 201=생성, 200=이미 저장됨, 400=검증 실패, 404=루틴 없음, 409=다른 내용으로 저장됨
+    id: Optional[str] = None      # 수행 기록 문서 ID
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    """일괄 처리 응답 스키마"""
+    created: int
+    failed: int
+    results: List[BatchItemResult]
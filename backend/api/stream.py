@@ -0,0 +1,121 @@
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from auth.middleware import verify_firebase_token
+from services.change_hub import ChangeHub, StreamLimitError, Subscription, STREAM_CLOSED
+from api.dependencies import get_change_hub
+from api.executions import execution_row
+from api.fast_json import dumps
+from api.routines import routine_row
+import logging
+import os
+
+router = APIRouter(prefix="/stream", tags=["Stream"])
+
+logger = logging.getLogger(__name__)
+
+# 이벤트가 없을 때 연결 유지를 위해 보내는 주석 줄 간격 (프록시 / 로드밸런서 유휴 타임아웃보다 짧게)
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+# 끊긴 뒤 클라이언트가 다시 연결하기까지 기다릴 시간 (ms)
+STREAM_RETRY_MS = 5000
+
+_ROW_BUILDERS = {
+    "routines": routine_row,
+    "executions": lambda data, uid: execution_row(data),
+}
+
+
+def sse_event(event: str, data) -> bytes:
+    """text/event-stream 이벤트 하나 (data 는 한 줄 JSON)"""
+    return b"event: " + event.encode("ascii") + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def change_payload(event: dict, uid: str) -> dict:
+    """허브 이벤트를 응답 형태로 바꿉니다 (삭제는 data 가 null)"""
+    data = event["data"]
+    return {
+        "collection": event["collection"],
+        "change": event["change"],
+        "id": event["id"],
+        "data": None if data is None else _ROW_BUILDERS[event["collection"]](data, uid),
+    }
+
+
+class SubscriptionStreamingResponse(StreamingResponse):
+    """응답이 끝나면 구독을 해제하는 스트리밍 응답
+
+    본문 생성기의 finally 는 생성기가 한 번이라도 실행되어야 불리므로, 응답을 시작하기 전에
+    연결이 끊기는 경우까지 응답 전송을 감싸서 정리합니다. (unsubscribe 는 여러 번 불러도 안전)
+    """
+
+    def __init__(self, content, hub: ChangeHub, subscription: Subscription, **kwargs):
+        super().__init__(content, **kwargs)
+        self.hub = hub
+        self.subscription = subscription
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.hub.unsubscribe(self.subscription)
+
+
+@router.get("")
+async def stream_changes(
+    uid: str = Depends(verify_firebase_token),
+    hub: ChangeHub = Depends(get_change_hub)
+):
+    """
+    루틴 / 수행 기록 변경을 Server-Sent Events 로 실시간 전달합니다 (다른 기기의 변경 반영용).
+
+    이벤트 종류:
+    - ready: 구독 시작 (이후 변경부터 전달되므로 앱은 이때 GET /sync 로 상태를 맞춤)
+    - change: {"collection": "routines" | "executions", "change": "added" | "modified" | "removed", "id", "data"}
+    - resync: 이벤트를 제때 읽지 못해 일부를 놓침 → GET /sync 로 다시 맞춤
+
+    같은 사용자의 연결은 Firestore 리스너 하나를 공유하며, 워커 / 사용자별 연결 수 상한을 넘으면
+    503 / 429 를 반환합니다. 연결이 끊기면 앱은 다시 연결한 뒤 GET /sync 로 빈 구간을 채웁니다.
+
+    Args:
+        uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
+
+    Returns:
+        StreamingResponse: text/event-stream 스트림
+    """
+    try:
+        subscription = hub.subscribe(uid)
+    except StreamLimitError as e:
+        logger.warning("⚠️ 스트림 연결 거부: %s", e)
+        raise HTTPException(
+            status_code=429 if e.per_user else 503,
+            detail=str(e),
+            headers={"Retry-After": str(STREAM_RETRY_MS // 1000)},
+        )
+    except Exception as e:
+        logger.error("❌ 변경 스트림 구독 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to subscribe to changes: {str(e)}"
+        )
+
+    async def events():
+        yield f"retry: {STREAM_RETRY_MS}\n\n".encode("ascii")
+        yield sse_event("ready", {})
+        while True:
+            event = await subscription.next_event(STREAM_HEARTBEAT_SECONDS)
+            if event is None:
+                yield b": ping\n\n"
+            elif event is STREAM_CLOSED:
+                return
+            elif event["change"] == "resync":
+                yield sse_event("resync", {})
+            else:
+                yield sse_event("change", change_payload(event, uid))
+
+    # 상한 초과(429 / 503)를 상태 코드로 알리기 위해 구독은 응답 전에 하고, 해제는 응답이 맡음
+    return SubscriptionStreamingResponse(
+        events(),
+        hub,
+        subscription,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from auth.middleware import verify_firebase_token
+from repositories.executor import run_blocking
+from repositories.sync_repository import ISyncRepository, SYNC_CHANGE_FIELDS, TOMBSTONE_COLLECTION, parse_sync_time
+from api.dependencies import get_sync_repository
+from api.executions import execution_row
+from api.fast_json import FAST_JSON_RESPONSES, ValidatedJSON
+from api.routines import routine_row
+from api.schemas import SyncResponse
+import asyncio
+import base64
+import binascii
+import json
+import logging
+from typing import Dict, Optional, Tuple
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+logger = logging.getLogger(__name__)
+
+# 컬렉션별로 한 번에 돌려주는 문서 수
+DEFAULT_SYNC_LIMIT = 500
+MAX_SYNC_LIMIT = 1000
+
+SYNC_JSON = ValidatedJSON(SyncResponse)
+
+
+def encode_sync_cursor(positions: Dict[str, Optional[Tuple[str, Optional[str]]]]) -> str:
+    """컬렉션별 마지막 위치 (커밋 시각, 문서 ID) 를 URL 에 넣을 수 있는 문자열로 만듭니다"""
+    raw = json.dumps(
+        {collection: list(position) if position else None for collection, position in positions.items()},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> Dict[str, Optional[Tuple[str, Optional[str]]]]:
+    """encode_sync_cursor 로 만든 커서를 해석합니다 (잘못되면 400)"""
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        positions = {}
+        for collection in SYNC_CHANGE_FIELDS:
+            position = raw.get(collection)
+            if position is not None:
+                changed_at, doc_id = position
+                if not isinstance(changed_at, str) or not isinstance(doc_id, (str, type(None))):
+                    raise ValueError(cursor)
+                parse_sync_time(changed_at)
+                position = (changed_at, doc_id)
+            positions[collection] = position
+        return positions
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid sync cursor"
+        )
+
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 cursor (생략하면 처음부터 전체)"),
+    limit: int = Query(DEFAULT_SYNC_LIMIT, ge=1, le=MAX_SYNC_LIMIT, description="컬렉션별 최대 문서 수"),
+    uid: str = Depends(verify_firebase_token),
+    repo: ISyncRepository = Depends(get_sync_repository)
+):
+    """
+    since 커서 이후 생성 / 수정 / 삭제된 루틴과 수행 기록만 조회합니다 (오프라인 우선 앱 동기화용).
+
+    루틴 / 수행 기록 / 삭제 기록(tombstone)을 쓰기마다 기록되는 커밋 시각(sync_at) 순으로 읽고,
+    컬렉션마다 (커밋 시각, 문서 ID) 위치를 커서에 담아 이어서 읽습니다.
+    커서는 읽기 시각보다 몇 초 뒤에 두므로 최근 변경은 다음 응답에 한 번 더 올 수 있습니다.
+    앱은 응답을 로컬 저장소에 반영(upsert / 삭제)하고 cursor 를 저장해 두었다가 다음 실행 때 since 로 보냅니다.
+    has_more 가 True 면 한 컬렉션에 limit 개보다 많은 변경이 남아 있으므로 바로 다시 요청합니다.
+
+    Args:
+        since: 이전 응답의 cursor
+        limit: 컬렉션별 최대 문서 수 (최대 1000)
+        uid: 인증된 사용자의 uid (미들웨어에서 자동 추출)
+
+    Returns:
+        SyncResponse: 바뀐 루틴 / 수행 기록 / 삭제 기록과 다음 cursor
+    """
+    positions = decode_sync_cursor(since) if since else {collection: None for collection in SYNC_CHANGE_FIELDS}
+    logger.debug("🔄 증분 동기화 요청 (since=%s)", "initial" if since is None else "cursor")
+
+    try:
+        collections = list(SYNC_CHANGE_FIELDS)
+        results = await asyncio.gather(*(
+            run_blocking(repo.get_changes, uid, collection, limit, positions[collection])
+            for collection in collections
+        ))
+
+        changes = {}
+        has_more = False
+        for collection, (docs, last, more) in zip(collections, results):
+            changes[collection] = docs
+            if last is not None:
+                positions[collection] = last
+            has_more = has_more or more
+
+        content = {
+            "routines": [routine_row(data, uid) for data in changes["routines"]],
+            "executions": [execution_row(data) for data in changes["executions"]],
+            "deleted": [
+                {
+                    "collection": data.get("collection", ""),
+                    "id": data["id"],
+                    "deleted_at": data.get("deleted_at", ""),
+                }
+                for data in changes[TOMBSTONE_COLLECTION]
+            ],
+            "cursor": encode_sync_cursor(positions),
+            "has_more": has_more,
+        }
+
+        logger.debug(
+            "✅ 증분 동기화 완료: 루틴 %s개, 수행 기록 %s개, 삭제 %s개",
+            len(content["routines"]), len(content["executions"]), len(content["deleted"]),
+        )
+
+        if FAST_JSON_RESPONSES:
+            return SYNC_JSON.response(content)
+        return content
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("❌ 증분 동기화 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to sync changes: {str(e)}"
+        )
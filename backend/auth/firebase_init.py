@@ -1,25 +1,64 @@
-import firebase_admin
-from firebase_admin import credentials, auth
 import os
 import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import firebase_admin
+
+logger = logging.getLogger(__name__)
 
 
 FIREBASE_SERVICE_ACCOUNT_KEY = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY")
 FIREBASE_SERVICE_ACCOUNT_PATH = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "serviceAccountKey.json")
 
-if FIREBASE_SERVICE_ACCOUNT_KEY:
-    try:
-        service_account_dict = json.loads(FIREBASE_SERVICE_ACCOUNT_KEY)
-        cred = credentials.Certificate(service_account_dict)
-    except json.JSONDecodeError:
-        cred = credentials.Certificate(FIREBASE_SERVICE_ACCOUNT_KEY)
-elif os.path.exists(FIREBASE_SERVICE_ACCOUNT_PATH):
-    cred = credentials.Certificate(FIREBASE_SERVICE_ACCOUNT_PATH)
-else:
-    cred = None
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning("Firebase 서비스 계정 키를 찾을 수 없습니다. Firebase 기능이 비활성화됩니다.")
-
-if not firebase_admin._apps and cred:
-    firebase_admin.initialize_app(cred)
\ No newline at end of file
+_init_lock = threading.Lock()
+# 서비스 계정 키가 없어 비활성화된 경우 매번 다시 확인하지 않음
+_disabled = False
+
+
+def initialize_firebase() -> Optional["firebase_admin.App"]:
+    """Firebase 기본 앱을 초기화합니다 (여러 번 호출해도 한 번만 초기화, 스레드 안전)
+
+    앱 시작 후 워밍업, 첫 인증/Firestore 요청, 배치 스크립트 시작 시 호출됩니다.
+    서비스 계정 키가 없으면 경고만 남기고 None 을 반환합니다.
+    """
+    # firebase_admin 은 google.auth / cryptography 를 함께 불러오므로 처음 필요할 때 불러옴
+    import firebase_admin
+
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
+    if _disabled:
+        return None
+
+    with _init_lock:
+        if firebase_admin._apps:
+            return firebase_admin.get_app()
+        if _disabled:
+            return None
+        return _initialize()
+
+
+def _initialize() -> Optional["firebase_admin.App"]:
+    global _disabled
+    import firebase_admin
+    from firebase_admin import credentials
+
+    service_account_key = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY", FIREBASE_SERVICE_ACCOUNT_KEY)
+    service_account_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", FIREBASE_SERVICE_ACCOUNT_PATH)
+
+    if service_account_key:
+        try:
+            service_account_dict = json.loads(service_account_key)
+            cred = credentials.Certificate(service_account_dict)
+        except json.JSONDecodeError:
+            cred = credentials.Certificate(service_account_key)
+    elif os.path.exists(service_account_path):
+        cred = credentials.Certificate(service_account_path)
+    else:
+        logger.warning("Firebase 서비스 계정 키를 찾을 수 없습니다. Firebase 기능이 비활성화됩니다.")
+        _disabled = True
+        return None
+
+    return firebase_admin.initialize_app(cred)
@@ -1,14 +1,10 @@
 from fastapi import APIRouter, HTTPException
 from auth.schemas import GoogleLogin
-from google.oauth2 import id_token
-from google.auth.transport import requests
-from firebase_admin import auth
 import os
 import logging
 
 router = APIRouter(prefix="/auth", tags=["GoogleAuth"])
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -16,6 +12,11 @@ GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 
 @router.post("/google")
 async def google_login(payload: GoogleLogin):
+    # google.auth / firebase_admin.auth 는 무거우므로 첫 로그인 요청 때 불러옴
+    from google.oauth2 import id_token
+    from google.auth.transport import requests
+    from firebase_admin import auth
+
     id_token_str = payload.id_token
 
     try:
@@ -25,7 +26,7 @@ async def google_login(payload: GoogleLogin):
             GOOGLE_CLIENT_ID,
         )
     except Exception as e:
-        logger.error(f"Google ID Token verification failed: {e}")
+        logger.warning("❌ Google ID Token 검증 실패: %s", e)
         raise HTTPException(status_code=401, detail="Invalid Google ID Token")
 
     email = google_user.get("email")
@@ -33,18 +34,9 @@ async def google_login(payload: GoogleLogin):
     picture = google_user.get("picture")
     uid = google_user.get("sub")
 
-    logger.info("=" * 60)
-    logger.info("🔐 Google 로그인 성공!")
-    logger.info(f"👤 사용자 정보:")
-    logger.info(f"   - UID: {uid}")
-    logger.info(f"   - 이름: {name}")
-    logger.info(f"   - 이메일: {email}")
-    logger.info(f"   - 프로필 사진: {picture}")
-    logger.info("=" * 60)
-
     try:
         user = auth.get_user(uid)
-        logger.info(f"✅ 기존 사용자 로그인: {email}")
+        logger.debug("✅ 기존 사용자 로그인: uid=%s", uid)
     except auth.UserNotFoundError:
         user = auth.create_user(
             uid=uid,
@@ -52,7 +44,7 @@ async def google_login(payload: GoogleLogin):
             display_name=name,
             photo_url=picture
         )
-        logger.info(f"🆕 새 사용자 생성: {email}")
+        logger.info("🆕 새 사용자 생성: uid=%s", uid)
 
     firebase_custom_token = auth.create_custom_token(uid).decode("utf-8")
 
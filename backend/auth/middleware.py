@@ -1,11 +1,95 @@
 from fastapi import HTTPException, Header
-from firebase_admin import auth
+from starlette.concurrency import run_in_threadpool
+from collections import OrderedDict
+from typing import Optional
+import hashlib
 import logging
+import os
+import time
+
+from auth.firebase_init import initialize_firebase
+from services.metrics import TOKEN_VERIFY_LATENCY
 
 logger = logging.getLogger(__name__)
 
+# 검증 결과 캐시 설정
+# TTL 은 토큰의 exp 를 넘지 않으며, 폐기(revoke)된 토큰이 계속 통과할 수 있는 최대 시간이기도 합니다.
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+
+class TokenCache:
+    """검증된 Firebase ID Token 의 uid 를 보관하는 LRU + TTL 캐시
+
+    토큰 원문 대신 SHA-256 해시를 키로 사용하고, 만료 시각은 min(exp, now + ttl) 입니다.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE, ttl_seconds: int = TOKEN_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[str]:
+        """캐시된 uid 를 반환합니다 (없거나 만료되었으면 None)"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        uid, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return uid
+
+    def put(self, token: str, uid: str, exp: Optional[float] = None):
+        """검증된 토큰을 캐시에 저장합니다"""
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        key = self._key(token)
+        self._entries[key] = (uid, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCache()
+
+
+def _verify_id_token(token: str) -> dict:
+    from firebase_admin import auth
+
+    initialize_firebase()
+    return auth.verify_id_token(token)
+
 
 async def verify_firebase_token(authorization: str = Header(None)) -> str:
+    # firebase_admin.auth 는 무거우므로 첫 인증 요청 때 불러옴
+    from firebase_admin import auth
+
     if not authorization:
         logger.warning("⚠️ Authorization 헤더가 없습니다")
         raise HTTPException(
@@ -23,9 +107,20 @@ async def verify_firebase_token(authorization: str = Header(None)) -> str:
             )
         
         token = parts[1]
+
+        # 캐시 히트 시 서명 검증을 생략
+        cached_uid = token_cache.get(token)
+        if cached_uid:
+            return cached_uid
         
-        # Firebase ID Token 검증
-        decoded_token = auth.verify_id_token(token)
+        # Firebase ID Token 검증 (공개키 조회가 발생할 수 있어 스레드 풀에서 실행)
+        started = time.perf_counter()
+        try:
+            decoded_token = await run_in_threadpool(_verify_id_token, token)
+        except Exception:
+            TOKEN_VERIFY_LATENCY.observe(time.perf_counter() - started, "error")
+            raise
+        TOKEN_VERIFY_LATENCY.observe(time.perf_counter() - started, "ok")
         uid = decoded_token.get("uid")
         
         if not uid:
@@ -33,24 +128,26 @@ async def verify_firebase_token(authorization: str = Header(None)) -> str:
                 status_code=401,
                 detail="Token does not contain uid"
             )
+
+        token_cache.put(token, uid, decoded_token.get("exp"))
         
-        logger.info(f"✅ 토큰 검증 성공: uid={uid}")
+        logger.debug("✅ 토큰 검증 성공: uid=%s", uid)
         return uid
         
     except auth.InvalidIdTokenError as e:
-        logger.error(f"❌ 유효하지 않은 ID Token: {e}")
+        logger.error("❌ 유효하지 않은 ID Token: %s", e)
         raise HTTPException(
             status_code=401,
             detail="Invalid Firebase ID Token"
         )
     except auth.ExpiredIdTokenError as e:
-        logger.error(f"❌ 만료된 ID Token: {e}")
+        logger.error("❌ 만료된 ID Token: %s", e)
         raise HTTPException(
             status_code=401,
             detail="Expired Firebase ID Token"
         )
     except Exception as e:
-        logger.error(f"❌ 토큰 검증 실패: {e}")
+        logger.error("❌ 토큰 검증 실패: %s", e)
         raise HTTPException(
             status_code=401,
             detail=f"Token verification failed: {str(e)}"
@@ -1,15 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from auth.google_router import router as google_router
 from api.user import router as user_router
 from api.routines import router as routines_router
 from api.executions import router as executions_router
-import auth.firebase_init
+from api.sync import router as sync_router
+from api.stream import router as stream_router
+from api.health import router as health_router, stop_warm_up, warm_up
+from api.metrics import router as metrics_router
+from api.dependencies import close_change_hub
+from api.request_logging import RequestLoggingMiddleware, configure_logging, shutdown_logging
+from repositories.executor import FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS, drain_executor
+from repositories.firestore_client import close_firestore_clients
 from dotenv import load_dotenv
+import logging
 
 load_dotenv()
+configure_logging()
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 직후 무거운 의존성을 백그라운드에서 준비하고, 종료 시 정리합니다
+
+    무거운 모듈은 import 시점이 아니라 워밍업(또는 그것이 필요한 첫 요청)에서 불러오므로
+    서버는 바로 요청을 받기 시작하며, 준비가 끝나면 /ready 가 200 을 반환합니다.
+    """
+    configure_logging()
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    logger.info("🚀 앱 시작: 워밍업 진행 중")
+
+    yield
+
+    # 재시도 대기 중이면 기다리지 않고 끝냄
+    stop_warm_up()
+    await warm_up_task
+    # 열린 변경 스트림을 끝내고 스냅샷 리스너를 해제
+    close_change_hub()
+    # 진행 중인 Firestore 호출을 (최대 FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS 초) 마친 뒤 채널을 닫음
+    # 기다리는 동안에도 이벤트 루프가 돌도록 스레드에서 실행
+    if not await drain_executor():
+        logger.warning("⚠️ Firestore 호출이 %s초 안에 끝나지 않아 채널을 먼저 닫음", FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS)
+    await asyncio.to_thread(close_firestore_clients)
+    logger.info("👋 앱 종료: Firestore 연결 정리 완료")
+    shutdown_logging()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # TODO: 배포 환경에서는 허용 origin 을 실제 앱 도메인 / IP 로 제한
 app.add_middleware(
@@ -19,11 +60,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 요청당 한 줄 구조화 로그 (uvicorn 접근 로그는 Dockerfile 에서 끔)
+app.add_middleware(RequestLoggingMiddleware)
 
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(google_router)
 app.include_router(user_router)
 app.include_router(routines_router)
 app.include_router(executions_router)
+app.include_router(sync_router)
+app.include_router(stream_router)
 
 
 @app.get("/")
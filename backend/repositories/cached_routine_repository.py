@@ -0,0 +1,202 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import logging
+import os
+import threading
+import time
+
+from repositories.routine_repository import ALWAYS_SELECTED_FIELDS, IRoutineRepository
+
+logger = logging.getLogger(__name__)
+
+ROUTINE_CACHE_TTL_SECONDS = int(os.getenv("ROUTINE_CACHE_TTL_SECONDS", "60"))
+ROUTINE_CACHE_MAX_USERS = int(os.getenv("ROUTINE_CACHE_MAX_USERS", "10000"))
+# 존재가 확인된 루틴 ID 집합 유지 시간 (다른 워커에서 삭제된 루틴을 알아차리기까지의 최대 시간)
+ROUTINE_ID_CACHE_TTL_SECONDS = int(os.getenv("ROUTINE_ID_CACHE_TTL_SECONDS", "600"))
+
+
+class CachedRoutineRepository(IRoutineRepository):
+    """사용자별 루틴 목록을 캐시하는 read-through 저장소 (Decorator Pattern)
+
+    어떤 IRoutineRepository 구현 위에도 얹을 수 있으며, 쓰기(create/update/delete)가
+    발생하면 해당 사용자의 캐시를 무효화합니다.
+
+    목록 캐시와 별도로 사용자별로 존재가 확인된 루틴 ID 집합을 더 오래 유지합니다.
+    (수행 기록 저장 시 루틴 조회 없이 존재 여부를 확인하는 용도로, 수정에는 영향받지 않고
+    생성 / 삭제 시 바로 반영되며, 집합에 없는 ID 는 호출한 쪽에서 저장소로 확인합니다)
+    """
+
+    def __init__(
+        self,
+        backend: IRoutineRepository,
+        ttl_seconds: int = ROUTINE_CACHE_TTL_SECONDS,
+        max_users: int = ROUTINE_CACHE_MAX_USERS,
+        id_ttl_seconds: int = ROUTINE_ID_CACHE_TTL_SECONDS,
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        # uid -> (만료 시각, {routine_id: routine_data})
+        self.id_ttl_seconds = id_ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # uid -> (만료 시각, {존재가 확인된 routine_id})
+        self._known_ids: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.known_hits = 0
+        self.known_misses = 0
+
+    def _get_cached(self, uid: str) -> Optional[Dict[str, dict]]:
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, routines = entry
+            if expires_at <= time.monotonic():
+                del self._entries[uid]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return routines
+
+    def _store(self, uid: str, routines: List[dict]):
+        with self._lock:
+            self._entries[uid] = (
+                time.monotonic() + self.ttl_seconds,
+                {routine["id"]: routine for routine in routines},
+            )
+            self._entries.move_to_end(uid)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+            self._remember_ids(uid, [routine["id"] for routine in routines], replace=True)
+
+    def _remember_ids(self, uid: str, routine_ids: List[str], replace: bool = False):
+        """존재가 확인된 루틴 ID 를 기록합니다 (self._lock 을 잡은 상태에서 호출)"""
+        entry = self._known_ids.get(uid)
+        if entry is None or replace or entry[0] <= time.monotonic():
+            entry = (time.monotonic() + self.id_ttl_seconds, set())
+            self._known_ids[uid] = entry
+        entry[1].update(routine_ids)
+        self._known_ids.move_to_end(uid)
+        while len(self._known_ids) > self.max_users:
+            self._known_ids.popitem(last=False)
+
+    def is_known(self, uid: str, routine_id: str) -> bool:
+        with self._lock:
+            entry = self._known_ids.get(uid)
+            if entry is not None and entry[0] > time.monotonic() and routine_id in entry[1]:
+                self.known_hits += 1
+                return True
+            self.known_misses += 1
+            return False
+
+    def remember(self, uid: str, routine_id: str):
+        with self._lock:
+            self._remember_ids(uid, [routine_id])
+
+    def forget(self, uid: str, routine_id: str):
+        with self._lock:
+            entry = self._known_ids.get(uid)
+            if entry is not None:
+                entry[1].discard(routine_id)
+            # 목록 캐시에도 남아 있을 수 있으므로 함께 비움
+            self._entries.pop(uid, None)
+
+    def invalidate(self, uid: str):
+        """사용자의 루틴 캐시를 무효화합니다"""
+        with self._lock:
+            self._entries.pop(uid, None)
+
+    def create(self, uid: str, routine_data: dict) -> str:
+        routine_id = self.backend.create(uid, routine_data)
+        self.invalidate(uid)
+        self.remember(uid, routine_id)
+        return routine_id
+
+    def create_many(self, uid: str, routines: List[dict]) -> List[str]:
+        routine_ids = self.backend.create_many(uid, routines)
+        self.invalidate(uid)
+        with self._lock:
+            self._remember_ids(uid, routine_ids)
+        return routine_ids
+
+    def get_all_by_user(self, uid: str) -> List[dict]:
+        cached = self._get_cached(uid)
+        if cached is not None:
+            return [dict(routine) for routine in cached.values()]
+
+        routines = self.backend.get_all_by_user(uid)
+        self._store(uid, routines)
+        return [dict(routine) for routine in routines]
+
+    def get_page(
+        self,
+        uid: str,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[str, str]]]:
+        # 캐시가 있으면 메모리에서 잘라 주고, 없으면 해당 페이지만 읽습니다 (전체 목록을 채우지 않음)
+        cached = self._get_cached(uid)
+        if cached is None:
+            return self.backend.get_page(uid, limit, after, fields)
+
+        ordered = sorted(cached.values(), key=lambda routine: (routine.get("time", ""), routine["id"]))
+        if after is not None:
+            ordered = [routine for routine in ordered if (routine.get("time", ""), routine["id"]) > after]
+
+        page = ordered[:limit]
+        if fields is not None:
+            keep = set(fields) | ALWAYS_SELECTED_FIELDS | {"id"}
+            page = [{key: value for key, value in routine.items() if key in keep} for routine in page]
+        else:
+            page = [dict(routine) for routine in page]
+
+        if len(ordered) <= limit:
+            return page, None
+        return page, (page[-1].get("time", ""), page[-1]["id"])
+
+    def get_by_id(self, uid: str, routine_id: str) -> Optional[dict]:
+        cached = self._get_cached(uid)
+        if cached is not None:
+            routine = cached.get(routine_id)
+            return dict(routine) if routine is not None else None
+
+        routine = self.backend.get_by_id(uid, routine_id)
+        if routine is not None:
+            self.remember(uid, routine_id)
+        return routine
+
+    def update(self, uid: str, routine_id: str, update_data: dict, current: Optional[dict] = None) -> Optional[dict]:
+        # 캐시에 수정 전 상태가 있으면 넘겨 재조회 없이 응답을 만들 수 있게 합니다
+        if current is None:
+            cached = self._get_cached(uid)
+            if cached is not None and routine_id in cached:
+                current = dict(cached[routine_id])
+
+        try:
+            return self.backend.update(uid, routine_id, update_data, current)
+        finally:
+            self.invalidate(uid)
+
+    def delete(self, uid: str, routine_id: str) -> bool:
+        self.forget(uid, routine_id)
+        try:
+            return self.backend.delete(uid, routine_id)
+        finally:
+            self.invalidate(uid)
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "known_id_users": len(self._known_ids),
+            "known_id_hits": self.known_hits,
+            "known_id_misses": self.known_misses,
+        }
@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Callable, List
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, get_firestore_client
+from repositories.sync_repository import SYNC_FIELD
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 변경 이벤트 목록을 받는 콜백 (Firestore 리스너 스레드에서 호출됨)
+ChangeCallback = Callable[[List[dict]], None]
+
+
+class IChangeWatcher(ABC):
+    """사용자 데이터 변경 구독 인터페이스 (Dependency Inversion Principle)"""
+
+    @abstractmethod
+    def watch(self, uid: str, on_changes: ChangeCallback) -> Callable[[], None]:
+        """uid 의 루틴 / 수행 기록 변경을 구독합니다
+
+        on_changes 는 {"collection", "change", "id", "data"} 이벤트 목록으로 호출되며,
+        이벤트 루프가 아닌 다른 스레드에서 호출될 수 있습니다.
+
+        Returns:
+            구독 해제 함수
+        """
+        pass
+
+
+class FirestoreChangeWatcher(IChangeWatcher):
+    """Firestore 스냅샷 리스너 기반 변경 구독 구현
+
+    - 루틴: users/{uid}/routines 컬렉션 전체
+    - 수행 기록: 구독 시작 이후 created_at 인 문서만 (과거 기록 전체를 읽지 않도록)
+    리스너의 첫 스냅샷은 현재 상태 전체이므로 건너뜁니다. (초기 상태는 GET /sync 로 받음)
+    수행 기록 저장 시 루틴 문서의 last_logged_at 만 바뀐 경우는 sync_at 이 그대로이므로 알리지 않습니다.
+    """
+
+    def __init__(self, database_id: str = FIRESTORE_DATABASE_ID):
+        self.database_id = database_id
+
+    def watch(self, uid: str, on_changes: ChangeCallback) -> Callable[[], None]:
+        user_ref = get_firestore_client(self.database_id).collection("users").document(uid)
+        since = datetime.now(timezone.utc).isoformat()
+
+        watches = [
+            user_ref.collection("routines").on_snapshot(self._callback("routines", on_changes)),
+            user_ref.collection("executions").where("created_at", ">=", since).on_snapshot(
+                self._callback("executions", on_changes)
+            ),
+        ]
+
+        def unsubscribe():
+            for watch in watches:
+                try:
+                    watch.unsubscribe()
+                except Exception as e:
+                    logger.warning("⚠️ 스냅샷 리스너 해제 실패: %s", e)
+
+        return unsubscribe
+
+    @staticmethod
+    def _callback(collection: str, on_changes: ChangeCallback):
+        initial = [True]
+        # 문서별 마지막으로 본 sync_at (변경 내용이 없는 쓰기를 걸러냄)
+        synced_at = {}
+
+        def callback(docs, changes, read_time):
+            if initial[0]:
+                initial[0] = False
+                for doc in docs:
+                    synced_at[doc.id] = (doc.to_dict() or {}).get(SYNC_FIELD)
+                return
+
+            events = []
+            for change in changes:
+                change_type = change.type.name.lower()  # added | modified | removed
+                data = None
+                if change_type == "removed":
+                    synced_at.pop(change.document.id, None)
+                else:
+                    data = change.document.to_dict() or {}
+                    data["id"] = change.document.id
+                    previous = synced_at.get(change.document.id)
+                    synced_at[change.document.id] = data.get(SYNC_FIELD)
+                    if change_type == "modified" and previous is not None and previous == data.get(SYNC_FIELD):
+                        continue
+                events.append({
+                    "collection": collection,
+                    "change": change_type,
+                    "id": change.document.id,
+                    "data": data,
+                })
+            if events:
+                on_changes(events)
+
+        return callback
@@ -0,0 +1,339 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, get_firestore_client
+from services.metrics import timed_firestore
+from repositories.execution_rollups import (
+    ROLLUP_COLLECTIONS, build_rollup_document, build_rollup_increments, period_of, rollup_keys, summarize_executions,
+)
+from repositories.sync_repository import with_sync_stamp
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Firestore WriteBatch 한 번에 담을 수 있는 최대 쓰기 수
+WRITE_BATCH_LIMIT = 500
+# create 전제조건 충돌 시 이미 있는 문서를 빼고 다시 커밋하는 최대 횟수
+CREATE_CONFLICT_ATTEMPTS = 3
+
+
+class IExecutionRepository(ABC):
+    """루틴 수행 기록 저장소 인터페이스 (Dependency Inversion Principle)"""
+
+    @abstractmethod
+    def create(self, uid: str, execution_id: str, execution_data: dict) -> Optional[Tuple[dict, bool]]:
+        """execution_id 문서가 없을 때만 생성합니다 (execution_data["routine_id"] 루틴이 있어야 함)
+
+        Returns:
+            (저장된 수행 기록, 이번에 새로 생성했는지 여부), 루틴이 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def create_for_routine(
+        self, uid: str, routine_id: str, execution_id: str, execution_data: dict
+    ) -> Optional[Tuple[dict, bool]]:
+        """루틴이 있을 때만 create 와 같이 생성합니다 (루틴 확인과 쓰기를 원자적으로)
+
+        Returns:
+            create 와 같은 (저장된 수행 기록, 새로 생성했는지 여부), 루틴이 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def create_many(
+        self, uid: str, execution_ids: List[str], executions: List[dict]
+    ) -> List[Optional[Tuple[dict, bool]]]:
+        """서로 다른 execution_ids 문서들을 없는 것만 생성합니다 (각 항목의 루틴이 있어야 함)
+
+        Returns:
+            항목별 (저장된 수행 기록, 이번에 새로 생성했는지 여부) - 이미 있던 문서는 저장된 내용,
+            루틴이 없는 항목은 None
+        """
+        pass
+
+    @abstractmethod
+    def get_by_date(self, uid: str, date: str) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def get_daily_stats(self, uid: str, date: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def get_rollups(self, uid: str, granularity: str, start: str, end: str) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def get_active_uids(self, date: str) -> List[str]:
+        pass
+
+    @abstractmethod
+    def rebuild_rollup(self, uid: str, granularity: str, date: str) -> bool:
+        """date 가 속한 기간의 집계 문서를 수행 기록으로 다시 계산합니다
+
+        Returns:
+            집계 문서를 고쳐 썼는지 여부 (이미 맞으면 False)
+        """
+        pass
+
+
+class FirestoreExecutionRepository(IExecutionRepository):
+    """Firestore 기반 수행 기록 저장소 구현 (Single Responsibility Principle)"""
+
+    def __init__(self, database_id: str = FIRESTORE_DATABASE_ID):
+        self.database_id = database_id
+        self._db = None
+
+    def _get_db(self):
+        """공유 Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
+        if self._db is None:
+            self._db = get_firestore_client(self.database_id)
+        return self._db
+
+    def _executions_ref(self, uid: str):
+        return self._get_db().collection("users").document(uid).collection("executions")
+
+    def _rollup_ref(self, uid: str, collection: str, key: str):
+        return self._get_db().collection("users").document(uid).collection(collection).document(key)
+
+    def _routine_ref(self, uid: str, routine_id: str):
+        return self._get_db().collection("users").document(uid).collection("routines").document(routine_id)
+
+    def _daily_stats_ref(self, uid: str, date: str):
+        return self._rollup_ref(uid, ROLLUP_COLLECTIONS["day"], date)
+
+    @timed_firestore("executions.create")
+    def create(self, uid: str, execution_id: str, execution_data: dict) -> Optional[Tuple[dict, bool]]:
+        """수행 기록을 생성하고 같은 WriteBatch 안에서 일/주/월 집계를 증가시킵니다
+
+        create() 전제조건(문서가 없어야 함)으로 쓰므로 재시도된 요청은 배치 전체가 거부되어
+        수행 기록도 집계도 두 번 반영되지 않으며, 이때는 저장되어 있는 문서를 읽어 반환합니다.
+        같은 배치에서 루틴 문서의 last_logged_at 을 update()(문서가 있어야 함) 하므로, 다른 워커에서
+        루틴이 삭제되었으면 배치 전체가 거부되어 루틴 없는 수행 기록이 남지 않습니다. (조회 없이 커밋 한 번)
+        """
+        db = self._get_db()
+        doc_ref = self._executions_ref(uid).document(execution_id)
+        routine_ref = self._routine_ref(uid, execution_data["routine_id"])
+
+        from google.api_core.exceptions import AlreadyExists, NotFound
+        from google.cloud.firestore import SERVER_TIMESTAMP
+
+        batch = db.batch()
+        batch.create(doc_ref, with_sync_stamp(execution_data))
+        # 루틴 존재 전제조건 (sync_at / updated_at 은 바꾸지 않으므로 동기화 대상이 되지 않음)
+        batch.update(routine_ref, {"last_logged_at": SERVER_TIMESTAMP})
+        for (collection, key), increments in build_rollup_increments([execution_data]).items():
+            batch.set(self._rollup_ref(uid, collection, key), increments, merge=True)
+        try:
+            batch.commit()
+        except NotFound:
+            logger.debug("⚠️ 루틴이 삭제되어 수행 기록을 저장하지 않음: %s", execution_data["routine_id"])
+            return None
+        except AlreadyExists:
+            stored = doc_ref.get()
+            if not stored.exists:
+                raise
+            data = stored.to_dict()
+            data['id'] = execution_id
+            logger.debug("♻️ 이미 저장된 수행 기록: %s", execution_id)
+            return data, False
+
+        return {**execution_data, 'id': execution_id}, True
+
+    @timed_firestore("executions.create_for_routine")
+    def create_for_routine(
+        self, uid: str, routine_id: str, execution_id: str, execution_data: dict
+    ) -> Optional[Tuple[dict, bool]]:
+        """트랜잭션 안에서 루틴과 수행 기록 문서를 한 번에 읽고, 루틴이 있으면 생성합니다
+
+        메모리에서 루틴 존재를 확인하지 못했을 때 쓰는 경로로, 확인과 쓰기 사이에
+        루틴이 삭제되면 트랜잭션이 다시 실행되어 루틴이 없는 수행 기록이 남지 않습니다.
+        """
+        db = self._get_db()
+        routine_ref = self._routine_ref(uid, routine_id)
+        doc_ref = self._executions_ref(uid).document(execution_id)
+
+        from google.cloud import firestore
+
+        @firestore.transactional
+        def create_in_transaction(transaction):
+            snapshots = {
+                snapshot.reference.path: snapshot
+                for snapshot in db.get_all([routine_ref, doc_ref], transaction=transaction)
+            }
+            if not snapshots[routine_ref.path].exists:
+                return None
+
+            stored = snapshots[doc_ref.path]
+            if stored.exists:
+                data = stored.to_dict()
+                data['id'] = execution_id
+                return data, False
+
+            transaction.create(doc_ref, with_sync_stamp(execution_data))
+            for (collection, key), increments in build_rollup_increments([execution_data]).items():
+                transaction.set(self._rollup_ref(uid, collection, key), increments, merge=True)
+            return {**execution_data, 'id': execution_id}, True
+
+        return create_in_transaction(db.transaction())
+
+    @timed_firestore("executions.create_many")
+    def create_many(
+        self, uid: str, execution_ids: List[str], executions: List[dict]
+    ) -> List[Optional[Tuple[dict, bool]]]:
+        """여러 수행 기록을 WriteBatch 로 생성합니다
+
+        각 배치에는 수행 기록과 관련된 일/주/월 집계 증분이 함께 담겨 원자적으로 커밋되며,
+        쓰기 수가 WRITE_BATCH_LIMIT 을 넘으면 여러 배치로 나눕니다.
+        create 와 같이 배치가 다루는 루틴마다 last_logged_at 을 update() 하므로, 다른 워커에서
+        삭제된 루틴이 있으면 배치가 거부되어 루틴 없는 수행 기록과 집계 증분이 남지 않습니다.
+        이미 있는 문서나 없는 루틴이 섞여 배치가 거부되면, 해당 항목을 확인해 빼고 다시 커밋합니다.
+        """
+        db = self._get_db()
+        executions_ref = self._executions_ref(uid)
+
+        from google.api_core.exceptions import AlreadyExists, NotFound
+        from google.cloud.firestore import SERVER_TIMESTAMP
+
+        # execution_id → (저장된 수행 기록, 새로 생성했는지 여부), 루틴이 없으면 None
+        stored = {}
+        chunk: List[Tuple[str, dict]] = []
+        chunk_writes = set()
+
+        def commit_chunk(items: List[Tuple[str, dict]]):
+            for attempt in range(CREATE_CONFLICT_ATTEMPTS):
+                routine_ids = {d["routine_id"] for _, d in items}
+                batch = db.batch()
+                for execution_id, execution_data in items:
+                    batch.create(executions_ref.document(execution_id), with_sync_stamp(execution_data))
+                # 루틴 존재 전제조건 (sync_at / updated_at 은 바꾸지 않으므로 동기화 대상이 되지 않음)
+                for routine_id in routine_ids:
+                    batch.update(self._routine_ref(uid, routine_id), {"last_logged_at": SERVER_TIMESTAMP})
+                for (collection, key), increments in build_rollup_increments([d for _, d in items]).items():
+                    batch.set(self._rollup_ref(uid, collection, key), increments, merge=True)
+                try:
+                    batch.commit()
+                except NotFound:
+                    if attempt == CREATE_CONFLICT_ATTEMPTS - 1:
+                        raise
+                    refs = [self._routine_ref(uid, routine_id) for routine_id in routine_ids]
+                    missing = {doc.id for doc in db.get_all(refs, field_paths=["title"]) if not doc.exists}
+                    logger.debug("⚠️ 루틴이 삭제되어 수행 기록을 저장하지 않음: %s", sorted(missing))
+                    for execution_id, execution_data in items:
+                        if execution_data["routine_id"] in missing:
+                            stored[execution_id] = None
+                    items = [(execution_id, d) for execution_id, d in items if execution_id not in stored]
+                    if not items:
+                        return
+                    continue
+                except AlreadyExists:
+                    if attempt == CREATE_CONFLICT_ATTEMPTS - 1:
+                        raise
+                    refs = [executions_ref.document(execution_id) for execution_id, _ in items]
+                    for doc in db.get_all(refs):
+                        if doc.exists:
+                            data = doc.to_dict()
+                            data['id'] = doc.id
+                            stored[doc.id] = (data, False)
+                    items = [(execution_id, d) for execution_id, d in items if execution_id not in stored]
+                    if not items:
+                        return
+                    continue
+                for execution_id, execution_data in items:
+                    stored[execution_id] = ({**execution_data, 'id': execution_id}, True)
+                return
+
+        for execution_id, execution_data in zip(execution_ids, executions):
+            # 수행 기록 외에 배치마다 한 번씩만 쓰는 문서 (집계 문서, 루틴 전제조건)
+            writes = set(rollup_keys(execution_data["date"])) | {("routines", execution_data["routine_id"])}
+            new_writes = chunk_writes | writes
+            if len(chunk) + 1 + len(new_writes) > WRITE_BATCH_LIMIT:
+                commit_chunk(chunk)
+                chunk, new_writes = [], writes
+            chunk.append((execution_id, execution_data))
+            chunk_writes = new_writes
+        if chunk:
+            commit_chunk(chunk)
+
+        results = [stored[execution_id] for execution_id in execution_ids]
+        logger.debug(
+            "✅ 수행 기록 일괄 생성 성공: %s/%s개",
+            sum(1 for result in results if result is not None and result[1]), len(execution_ids)
+        )
+        return results
+
+    @timed_firestore("executions.get_by_date")
+    def get_by_date(self, uid: str, date: str) -> List[dict]:
+        """특정 날짜(YYYY-MM-DD)의 수행 기록을 조회합니다"""
+        docs = self._executions_ref(uid).where("date", "==", date).stream()
+
+        executions = []
+        for doc in docs:
+            data = doc.to_dict()
+            data['id'] = doc.id
+            executions.append(data)
+
+        return executions
+
+    @timed_firestore("executions.get_daily_stats")
+    def get_daily_stats(self, uid: str, date: str) -> Optional[dict]:
+        """일간 집계 문서를 조회합니다 (집계 도입 이전 날짜면 None)"""
+        doc = self._daily_stats_ref(uid, date).get()
+        if not doc.exists:
+            return None
+        return doc.to_dict()
+
+    @timed_firestore("executions.get_rollups")
+    def get_rollups(self, uid: str, granularity: str, start: str, end: str) -> List[dict]:
+        """시작일이 [start, end] 범위에 있는 일/주/월 집계 문서를 시작일 순으로 조회합니다"""
+        rollups_ref = self._get_db().collection("users").document(uid).collection(ROLLUP_COLLECTIONS[granularity])
+        query = rollups_ref.where("start", ">=", start).where("start", "<=", end).order_by("start")
+        return [doc.to_dict() for doc in query.stream()]
+
+    @timed_firestore("executions.get_active_uids")
+    def get_active_uids(self, date: str) -> List[str]:
+        """해당 날짜에 수행 기록이 있는 사용자 uid 목록을 조회합니다
+
+        사용자마다 하나뿐인 일간 집계 문서를 collection group 으로 조회하므로
+        수행 기록 전체를 훑지 않습니다. (daily_stats.date 단일 필드 collection group 인덱스 필요)
+        """
+        query = self._get_db().collection_group(ROLLUP_COLLECTIONS["day"]).where("date", "==", date)
+        return [doc.reference.parent.parent.id for doc in query.select(["date"]).stream()]
+
+    @timed_firestore("executions.rebuild_rollup")
+    def rebuild_rollup(self, uid: str, granularity: str, date: str) -> bool:
+        """집계 문서를 기간의 수행 기록 전체로 다시 계산해 덮어씁니다 (집계 도입 이전 기록 백필용)
+
+        집계 문서와 기간의 수행 기록을 같은 트랜잭션에서 읽으므로, 그 사이 저장된 수행 기록의
+        증분 배치와 겹치면 트랜잭션이 다시 실행되어 증분이 빠지거나 두 번 반영되지 않습니다.
+        """
+        db = self._get_db()
+        key, start, end = period_of(date, granularity)
+        rollup_ref = self._rollup_ref(uid, ROLLUP_COLLECTIONS[granularity], key)
+        query = self._executions_ref(uid).where("date", ">=", start).where("date", "<=", end)
+
+        from google.cloud import firestore
+
+        @firestore.transactional
+        def rebuild_in_transaction(transaction):
+            current = rollup_ref.get(transaction=transaction)
+            executions = [doc.to_dict() for doc in query.stream(transaction=transaction)]
+            period = summarize_executions(executions, granularity).get(key)
+            if period is None:
+                return False
+
+            rebuilt = build_rollup_document(period, granularity)
+            stored = current.to_dict() if current.exists else {}
+            if all(stored.get(field) == value for field, value in rebuilt.items()):
+                return False
+
+            rebuilt["version"] = (stored.get("version") or 0) + 1
+            rebuilt["updated_at"] = datetime.now(timezone.utc).isoformat()
+            transaction.set(rollup_ref, rebuilt)
+            return True
+
+        rebuilt = rebuild_in_transaction(db.transaction())
+        if rebuilt:
+            logger.debug("✅ 집계 문서 재계산: %s/%s", ROLLUP_COLLECTIONS[granularity], key)
+        return rebuilt
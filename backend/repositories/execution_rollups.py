@@ -0,0 +1,145 @@
+import os
+from datetime import date as date_cls, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+# 집계 단위별 Firestore 컬렉션 (users/{uid}/{컬렉션}/{기간 키})
+ROLLUP_COLLECTIONS = {
+    "day": "daily_stats",
+    "week": "weekly_stats",
+    "month": "monthly_stats",
+}
+
+# 일간 집계 문서가 그날의 수행 기록 전체를 반영한다고 믿을 수 있는 첫 날짜 (YYYY-MM-DD, 비우면 믿지 않음)
+# 집계 도입 이전 수행 기록이 있는 날짜는 백필 전까지 집계가 모자라므로, 집계를 배포한 날로 설정하고
+# scripts.backfill_execution_rollups 를 돌린 뒤에는 가장 이른 날짜(예: 0001-01-01)로 바꿉니다.
+ROLLUPS_COMPLETE_SINCE = os.getenv("ROLLUPS_COMPLETE_SINCE", "")
+
+
+def period_of(date_str: str, granularity: str) -> Tuple[str, str, str]:
+    """날짜(YYYY-MM-DD)가 속한 기간의 (키, 시작일, 종료일)을 반환합니다
+
+    - day:   ("2026-01-15", "2026-01-15", "2026-01-15")
+    - week:  ("2026-W03", 월요일, 일요일)  (ISO 주차)
+    - month: ("2026-01", "2026-01-01", "2026-01-31")
+    """
+    day = date_cls.fromisoformat(date_str)
+    if granularity == "day":
+        return date_str, date_str, date_str
+    if granularity == "week":
+        iso_year, iso_week, iso_weekday = day.isocalendar()
+        start = day - timedelta(days=iso_weekday - 1)
+        end = start + timedelta(days=6)
+        return f"{iso_year}-W{iso_week:02d}", start.isoformat(), end.isoformat()
+    if granularity == "month":
+        start = day.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        end = next_month - timedelta(days=1)
+        return start.strftime("%Y-%m"), start.isoformat(), end.isoformat()
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def summarize_executions(executions: List[dict], granularity: str = "day") -> Dict[str, dict]:
+    """수행 기록 목록을 기간별 집계(완료 수, 총 시간, 루틴별 합계와 수행일)로 묶습니다"""
+    summaries: Dict[str, dict] = {}
+    for execution in executions:
+        key, start, end = period_of(execution["date"], granularity)
+        period = summaries.setdefault(key, {
+            "period": key,
+            "start": start,
+            "end": end,
+            "date": start,
+            "total_routines": 0,
+            "total_duration_seconds": 0,
+            "routines": {},
+        })
+        duration = execution.get("duration_seconds", 0)
+        period["total_routines"] += 1
+        period["total_duration_seconds"] += duration
+
+        routine = period["routines"].setdefault(
+            execution["routine_id"],
+            {"routine_title": "", "count": 0, "duration_seconds": 0, "days": []},
+        )
+        routine["routine_title"] = execution.get("routine_title", routine["routine_title"])
+        routine["count"] += 1
+        routine["duration_seconds"] += duration
+        if execution["date"] not in routine["days"]:
+            routine["days"].append(execution["date"])
+    return summaries
+
+
+def rollup_is_complete(date_str: str) -> bool:
+    """날짜(YYYY-MM-DD)의 일간 집계를 수행 기록 대신 써도 되는지 (ROLLUPS_COMPLETE_SINCE 이후)"""
+    return bool(ROLLUPS_COMPLETE_SINCE) and date_str >= ROLLUPS_COMPLETE_SINCE
+
+
+def rollup_keys(date_str: str) -> List[Tuple[str, str]]:
+    """날짜가 갱신하는 집계 문서들의 (컬렉션, 문서 ID) 목록"""
+    return [
+        (collection, period_of(date_str, granularity)[0])
+        for granularity, collection in ROLLUP_COLLECTIONS.items()
+    ]
+
+
+def build_rollup_document(period: dict, granularity: str) -> dict:
+    """summarize_executions 의 기간 하나를 집계 문서 필드로 바꿉니다 (증분이 아닌 전체 값, 백필용)
+
+    build_rollup_increments 로 누적한 문서와 같은 모양이며, version / updated_at 은 호출하는 쪽에서 붙입니다.
+    """
+    routines = {}
+    for routine_id, routine in period["routines"].items():
+        routines[routine_id] = {
+            "routine_title": routine["routine_title"],
+            "count": routine["count"],
+            "duration_seconds": routine["duration_seconds"],
+        }
+        if granularity != "day":
+            routines[routine_id]["days"] = sorted(routine["days"])
+
+    return {
+        "period": period["period"],
+        "start": period["start"],
+        "end": period["end"],
+        "date": period["start"],
+        "total_routines": period["total_routines"],
+        "total_duration_seconds": period["total_duration_seconds"],
+        "routines": routines,
+    }
+
+
+def build_rollup_increments(executions: List[dict]) -> Dict[Tuple[str, str], dict]:
+    """수행 기록 목록을 일/주/월 집계 문서 증분(Increment, ArrayUnion)으로 변환합니다
+
+    Returns:
+        {(컬렉션, 문서 ID): 집계 문서에 merge 할 필드} 딕셔너리
+    """
+    # Firestore SDK 는 무거우므로 처음 쓸 때 불러옴
+    from firebase_admin import firestore
+
+    now = datetime.now(timezone.utc).isoformat()
+    increments = {}
+    for granularity, collection in ROLLUP_COLLECTIONS.items():
+        for key, period in summarize_executions(executions, granularity).items():
+            routines = {}
+            for routine_id, routine in period["routines"].items():
+                routines[routine_id] = {
+                    "routine_title": routine["routine_title"],
+                    "count": firestore.Increment(routine["count"]),
+                    "duration_seconds": firestore.Increment(routine["duration_seconds"]),
+                }
+                # 일 단위 문서는 날짜 자체가 수행일이므로 주/월 문서에만 수행일을 기록
+                if granularity != "day":
+                    routines[routine_id]["days"] = firestore.ArrayUnion(routine["days"])
+
+            increments[(collection, key)] = {
+                "period": key,
+                "start": period["start"],
+                "end": period["end"],
+                "date": period["start"],
+                "total_routines": firestore.Increment(period["total_routines"]),
+                "total_duration_seconds": firestore.Increment(period["total_duration_seconds"]),
+                "routines": routines,
+                "version": firestore.Increment(1),
+                "updated_at": now,
+            }
+    return increments
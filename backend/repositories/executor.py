@@ -0,0 +1,57 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Firestore Admin SDK 는 동기 클라이언트이므로 이벤트 루프를 막지 않도록
+# 전용 스레드 풀에서 호출합니다. 풀 크기가 곧 워커당 동시 Firestore RPC 상한입니다.
+FIRESTORE_MAX_WORKERS = int(os.getenv("FIRESTORE_MAX_WORKERS", "64"))
+# 앱 종료 시 진행 중인 Firestore 호출을 기다리는 최대 시간 (초)
+FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS", "10"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Firestore 전용 스레드 풀을 반환합니다 (lazy initialization)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=FIRESTORE_MAX_WORKERS,
+            thread_name_prefix="firestore",
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동기(blocking) 함수를 Firestore 전용 스레드 풀에서 실행하고 결과를 기다립니다"""
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await loop.run_in_executor(_get_executor(), func, *args)
+
+
+def shutdown_executor():
+    """진행 중인 Firestore 호출이 끝날 때까지 기다린 뒤 스레드 풀을 종료합니다 (blocking)"""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def drain_executor(timeout: float = FIRESTORE_SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+    """이벤트 루프를 막지 않고 스레드 풀을 종료합니다 (앱 종료 시 호출)
+
+    대기 중인 호출은 취소하고 진행 중인 호출은 timeout 초까지만 기다립니다.
+
+    Returns:
+        시간 안에 모든 호출이 끝났는지 여부 (False 면 남은 호출은 채널을 닫을 때 중단됨)
+    """
+    try:
+        await asyncio.wait_for(asyncio.to_thread(shutdown_executor), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, get_firestore_client
+from services.metrics import timed_firestore
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class IFeedbackRepository(ABC):
+    """AI 피드백 저장소 인터페이스 (Dependency Inversion Principle)"""
+
+    @abstractmethod
+    def get(self, uid: str, date: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def save(self, uid: str, date: str, feedback: dict):
+        pass
+
+
+class FirestoreFeedbackRepository(IFeedbackRepository):
+    """Firestore 기반 AI 피드백 저장소 구현 (users/{uid}/feedback/{date})"""
+
+    def __init__(self, database_id: str = FIRESTORE_DATABASE_ID):
+        self.database_id = database_id
+        self._db = None
+
+    def _get_db(self):
+        """공유 Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
+        if self._db is None:
+            self._db = get_firestore_client(self.database_id)
+        return self._db
+
+    def _feedback_ref(self, uid: str, date: str):
+        return self._get_db().collection("users").document(uid).collection("feedback").document(date)
+
+    @timed_firestore("feedback.get")
+    def get(self, uid: str, date: str) -> Optional[dict]:
+        """저장된 피드백을 조회합니다"""
+        doc = self._feedback_ref(uid, date).get()
+        if not doc.exists:
+            return None
+        return doc.to_dict()
+
+    @timed_firestore("feedback.save")
+    def save(self, uid: str, date: str, feedback: dict):
+        """피드백을 저장합니다 (같은 날짜의 이전 피드백은 덮어씀)"""
+        self._feedback_ref(uid, date).set(feedback)
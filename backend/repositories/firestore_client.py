@@ -0,0 +1,106 @@
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Dict
+
+from auth.firebase_init import initialize_firebase
+
+if TYPE_CHECKING:
+    from google.cloud.firestore import Client
+
+logger = logging.getLogger(__name__)
+
+FIRESTORE_DATABASE_ID = os.getenv("FIRESTORE_DATABASE_ID", "uphilldb")
+
+# gRPC keepalive 핑 간격 / 응답 대기 시간 (ms)
+# SDK 기본값(핑 30초, 응답 대기 20초)보다 응답 대기를 줄여, 로드밸런서 / NAT 가 조용히 끊은 연결을
+# 다음 요청이 20초 넘게 기다린 뒤에야 알게 되지 않도록 합니다. (핑 간격은 Google 프런트엔드가
+# 허용하는 최소 간격보다 짧아지지 않도록 SDK 와 같은 30초 유지)
+FIRESTORE_KEEPALIVE_TIME_MS = int(os.getenv("FIRESTORE_KEEPALIVE_TIME_MS", "30000"))
+FIRESTORE_KEEPALIVE_TIMEOUT_MS = int(os.getenv("FIRESTORE_KEEPALIVE_TIMEOUT_MS", "5000"))
+
+# Firestore gRPC 채널 옵션
+# 메시지 크기는 SDK 와 같이 제한하지 않습니다. 문서 하나는 1 MiB 까지지만 get_all / 쿼리 응답은
+# 여러 문서를 담으므로, 제한을 두면 큰 배치 조회가 RESOURCE_EXHAUSTED 로 실패합니다.
+FIRESTORE_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", FIRESTORE_KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", FIRESTORE_KEEPALIVE_TIMEOUT_MS),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+# database_id -> Firestore 클라이언트 (프로세스 단위로 하나씩 공유)
+_clients: Dict[str, "Client"] = {}
+_lock = threading.Lock()
+
+
+def get_firestore_client(database_id: str = FIRESTORE_DATABASE_ID) -> "Client":
+    """공유 Firestore 클라이언트를 반환합니다 (없으면 한 번만 생성)
+
+    클라이언트 하나가 gRPC 채널 하나를 재사용하므로 요청마다 만들지 않습니다.
+    채널은 FIRESTORE_CHANNEL_OPTIONS 로 만듭니다. (에뮬레이터는 SDK 기본 채널)
+    Firestore SDK(gRPC)는 무거우므로 처음 필요할 때 불러옵니다.
+    """
+    client = _clients.get(database_id)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(database_id)
+        if client is None:
+            from firebase_admin import firestore
+
+            initialize_firebase()
+            client = firestore.client(database_id=database_id)
+            _configure_channel(client)
+            _clients[database_id] = client
+            logger.info("✅ Firestore 클라이언트 생성: %s", database_id)
+        return client
+
+
+def _configure_channel(client: "Client"):
+    """클라이언트의 gRPC 채널을 FIRESTORE_CHANNEL_OPTIONS 로 미리 만들어 둡니다
+
+    SDK 는 첫 RPC 때 고정 옵션으로 채널을 만들며 옵션을 바꾸는 공개 API 가 없으므로,
+    SDK 와 같은 방식(Client._firestore_api_helper)으로 GAPIC 클라이언트를 먼저 넣어 둡니다.
+    (연결은 첫 RPC 때 맺어짐)
+    """
+    if client._emulator_host is not None:
+        return
+
+    from google.cloud.firestore_v1.services.firestore import client as gapic_client
+    from google.cloud.firestore_v1.services.firestore.transports.grpc import FirestoreGrpcTransport
+
+    channel = FirestoreGrpcTransport.create_channel(
+        client._target, credentials=client._credentials, options=FIRESTORE_CHANNEL_OPTIONS
+    )
+    client._transport = FirestoreGrpcTransport(host=client._target, channel=channel)
+    client._firestore_api_internal = gapic_client.FirestoreClient(
+        transport=client._transport, client_options=client._client_options
+    )
+    gapic_client._client_info = client._client_info
+
+
+def has_firestore_client(database_id: str = FIRESTORE_DATABASE_ID) -> bool:
+    """공유 Firestore 클라이언트가 이미 만들어졌는지 (만들지 않고 확인만)"""
+    return database_id in _clients
+
+
+def close_firestore_clients():
+    """생성한 Firestore 클라이언트의 gRPC 채널을 닫습니다 (앱 종료 시 호출)"""
+    with _lock:
+        clients = list(_clients.items())
+        _clients.clear()
+
+    for database_id, client in clients:
+        # 채널은 첫 RPC 때 만들어지므로, 만들어진 경우에만 닫음
+        api = getattr(client, "_firestore_api_internal", None)
+        if api is None:
+            continue
+        try:
+            api.transport.close()
+            # firebase_admin 도 같은 클라이언트를 캐시하므로, 다시 쓰이면 채널을 새로 만들도록 비움
+            client._firestore_api_internal = None
+            logger.info("🔌 Firestore 채널 종료: %s", database_id)
+        except Exception as e:
+            logger.warning("⚠️ Firestore 채널 종료 실패 (%s): %s", database_id, e)
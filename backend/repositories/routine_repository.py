@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from firebase_admin import firestore
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, get_firestore_client
+from repositories.sync_repository import TOMBSTONE_COLLECTION, build_tombstone, tombstone_id, with_sync_stamp
+from services.metrics import timed_firestore
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 필드 선택 조회에서도 항상 읽는 필드 (time: 페이지 커서, updated_at: ETag)
+ALWAYS_SELECTED_FIELDS = {"time", "updated_at"}
+
 
 class IRoutineRepository(ABC):
     """루틴 저장소 인터페이스 (Dependency Inversion Principle)"""
@@ -13,44 +19,89 @@ class IRoutineRepository(ABC):
     def create(self, uid: str, routine_data: dict) -> str:
         pass
 
+    @abstractmethod
+    def create_many(self, uid: str, routines: List[dict]) -> List[str]:
+        pass
+
     @abstractmethod
     def get_all_by_user(self, uid: str) -> List[dict]:
         pass
 
+    @abstractmethod
+    def get_page(
+        self,
+        uid: str,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[str, str]]]:
+        pass
+
     @abstractmethod
     def get_by_id(self, uid: str, routine_id: str) -> Optional[dict]:
         pass
 
     @abstractmethod
-    def update(self, uid: str, routine_id: str, update_data: dict) -> dict:
+    def update(self, uid: str, routine_id: str, update_data: dict, current: Optional[dict] = None) -> Optional[dict]:
         pass
 
     @abstractmethod
     def delete(self, uid: str, routine_id: str) -> bool:
         pass
 
+    def is_known(self, uid: str, routine_id: str) -> bool:
+        """저장소를 조회하지 않고 루틴이 있다고 알 수 있으면 True (메모리 캐시가 없는 구현은 항상 False)"""
+        return False
+
+    def remember(self, uid: str, routine_id: str):
+        """다른 경로(트랜잭션 등)로 존재가 확인된 루틴을 기억합니다 (캐시가 없는 구현은 무시)"""
+        pass
+
+    def forget(self, uid: str, routine_id: str):
+        """다른 워커에서 삭제된 것으로 확인된 루틴을 잊습니다 (캐시가 없는 구현은 무시)"""
+        pass
+
 
 class FirestoreRoutineRepository(IRoutineRepository):
     """Firestore 기반 루틴 저장소 구현 (Single Responsibility Principle)"""
 
-    def __init__(self, database_id: str = "uphilldb"):
+    def __init__(self, database_id: str = FIRESTORE_DATABASE_ID):
         self.database_id = database_id
         self._db = None
 
     def _get_db(self):
-        """Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
+        """공유 Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
         if self._db is None:
-            self._db = firestore.client(database_id=self.database_id)
+            self._db = get_firestore_client(self.database_id)
         return self._db
 
+    @timed_firestore("routines.create")
     def create(self, uid: str, routine_data: dict) -> str:
         """새로운 루틴을 생성합니다"""
         db = self._get_db()
         doc_ref = db.collection("users").document(uid).collection("routines").document()
-        doc_ref.set(routine_data)
-        logger.info(f"✅ 루틴 생성 성공: {doc_ref.id}")
+        doc_ref.set(with_sync_stamp(routine_data))
+        logger.debug("✅ 루틴 생성 성공: %s", doc_ref.id)
         return doc_ref.id
 
+    @timed_firestore("routines.create_many")
+    def create_many(self, uid: str, routines: List[dict]) -> List[str]:
+        """여러 루틴을 하나의 WriteBatch 로 생성합니다 (최대 500개)"""
+        db = self._get_db()
+        routines_ref = db.collection("users").document(uid).collection("routines")
+
+        batch = db.batch()
+        routine_ids = []
+        for routine_data in routines:
+            doc_ref = routines_ref.document()
+            batch.set(doc_ref, with_sync_stamp(routine_data))
+            routine_ids.append(doc_ref.id)
+        batch.commit()
+
+        logger.debug("✅ 루틴 일괄 생성 성공: %s개", len(routine_ids))
+        return routine_ids
+
+    @timed_firestore("routines.get_all_by_user")
     def get_all_by_user(self, uid: str) -> List[dict]:
         """사용자의 모든 루틴을 조회합니다"""
         db = self._get_db()
@@ -65,6 +116,46 @@ class FirestoreRoutineRepository(IRoutineRepository):
 
         return routines
 
+    @timed_firestore("routines.get_page")
+    def get_page(
+        self,
+        uid: str,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[str, str]]]:
+        """루틴을 (time, 문서 ID) 순으로 한 페이지씩 조회합니다
+
+        Args:
+            limit: 페이지 크기
+            after: 이전 페이지 마지막 항목의 (time, id) 커서
+            fields: 읽을 필드 목록 (None 이면 전체, ALWAYS_SELECTED_FIELDS 는 항상 포함)
+
+        Returns:
+            (루틴 목록, 다음 페이지 커서 또는 None)
+        """
+        db = self._get_db()
+        routines_ref = db.collection("users").document(uid).collection("routines")
+
+        query = routines_ref.order_by("time").order_by("__name__")
+        if fields is not None:
+            query = query.select(sorted(set(fields) | ALWAYS_SELECTED_FIELDS))
+        if after is not None:
+            query = query.start_after({"time": after[0], "__name__": routines_ref.document(after[1])})
+
+        # 한 개를 더 읽어 다음 페이지가 있는지 확인
+        routines = []
+        for doc in query.limit(limit + 1).stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            routines.append(data)
+
+        if len(routines) <= limit:
+            return routines, None
+        routines = routines[:limit]
+        return routines, (routines[-1]["time"], routines[-1]["id"])
+
+    @timed_firestore("routines.get_by_id")
     def get_by_id(self, uid: str, routine_id: str) -> Optional[dict]:
         """특정 루틴의 상세 정보를 조회합니다"""
         db = self._get_db()
@@ -78,31 +169,65 @@ class FirestoreRoutineRepository(IRoutineRepository):
         data['id'] = doc.id
         return data
 
-    def update(self, uid: str, routine_id: str, update_data: dict) -> dict:
-        """루틴을 수정합니다"""
+    @timed_firestore("routines.update")
+    def update(self, uid: str, routine_id: str, update_data: dict, current: Optional[dict] = None) -> Optional[dict]:
+        """루틴을 수정합니다
+
+        update() 는 문서 존재(exists=True) 전제조건을 가진 단일 쓰기이므로 사전 조회를 하지 않습니다.
+        수정 전 상태(current)가 주어지면 패치를 병합해 응답을 만들고, 없을 때만 다시 읽습니다.
+            - current 있음 (목록 캐시 적중): commit 1번
+            - current 없음: commit + get 2번 (update() 는 문서를 돌려주지 않아 응답용으로 다시 읽음)
+            - 루틴 없음: commit 1번 (NotFound)
+
+        Returns:
+            수정된 루틴 딕셔너리, 루틴이 없으면 None
+        """
         db = self._get_db()
         doc_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
 
-        doc_ref.update(update_data)
+        from google.api_core.exceptions import NotFound
 
-        updated_doc = doc_ref.get()
-        if not updated_doc.exists:
+        try:
+            doc_ref.update(with_sync_stamp(update_data))
+        except NotFound:
             return None
 
-        data = updated_doc.to_dict()
-        data['id'] = updated_doc.id
-        logger.info(f"✅ 루틴 수정 성공: {routine_id}")
+        if current is not None:
+            data = {**current, **update_data}
+        else:
+            updated_doc = doc_ref.get()
+            if not updated_doc.exists:
+                return None
+            data = updated_doc.to_dict()
+
+        data['id'] = routine_id
+        logger.debug("✅ 루틴 수정 성공: %s", routine_id)
         return data
 
+    @timed_firestore("routines.delete")
     def delete(self, uid: str, routine_id: str) -> bool:
-        """루틴을 삭제합니다"""
-        db = self._get_db()
-        doc_ref = db.collection("users").document(uid).collection("routines").document(routine_id)
+        """루틴을 삭제합니다
 
-        doc = doc_ref.get()
-        if not doc.exists:
+        exists=True 전제조건을 건 삭제와 증분 동기화용 삭제 기록(tombstone)을 한 배치로 저장하므로,
+        루틴이 없으면 삭제 기록도 남지 않습니다.
+        """
+        db = self._get_db()
+        user_ref = db.collection("users").document(uid)
+        doc_ref = user_ref.collection("routines").document(routine_id)
+        tombstone_ref = user_ref.collection(TOMBSTONE_COLLECTION).document(tombstone_id("routines", routine_id))
+
+        from google.api_core.exceptions import NotFound
+
+        batch = db.batch()
+        batch.delete(doc_ref, option=db.write_option(exists=True))
+        batch.set(
+            tombstone_ref,
+            with_sync_stamp(build_tombstone("routines", routine_id, datetime.now(timezone.utc).isoformat())),
+        )
+        try:
+            batch.commit()
+        except NotFound:
             return False
 
-        doc_ref.delete()
-        logger.info(f"✅ 루틴 삭제 성공: {routine_id}")
+        logger.debug("✅ 루틴 삭제 성공: %s", routine_id)
         return True
@@ -0,0 +1,138 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, get_firestore_client
+from services.metrics import timed_firestore
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 삭제 기록(tombstone) 컬렉션: users/{uid}/tombstones/{collection}_{id}
+TOMBSTONE_COLLECTION = "tombstones"
+
+# 증분 동기화가 정렬 기준으로 쓰는 필드 (쓰기마다 SERVER_TIMESTAMP = 커밋 시각)
+# 앱 서버 시계로 만든 updated_at / created_at 은 커밋 순서와 다를 수 있어 커서로 쓰지 않습니다.
+SYNC_FIELD = "sync_at"
+
+# 동기화 대상 컬렉션 (모두 SYNC_FIELD 순으로 읽음)
+SYNC_CHANGE_FIELDS = {
+    "routines": SYNC_FIELD,
+    "executions": SYNC_FIELD,
+    TOMBSTONE_COLLECTION: SYNC_FIELD,
+}
+
+# 커서를 쿼리 읽기 시각보다 이만큼 뒤에 두어, 읽는 순간 아직 보이지 않던 커밋도 다음 동기화에서 읽힘
+SYNC_SAFETY_LAG_SECONDS = float(os.getenv("SYNC_SAFETY_LAG_SECONDS", "5"))
+
+
+def tombstone_id(collection: str, doc_id: str) -> str:
+    """삭제 기록 문서 ID"""
+    return f"{collection}_{doc_id}"
+
+
+def build_tombstone(collection: str, doc_id: str, deleted_at: str) -> dict:
+    """삭제 기록 문서를 만듭니다 (원본 문서 삭제와 같은 배치로 저장)"""
+    return {"collection": collection, "id": doc_id, "deleted_at": deleted_at}
+
+
+def with_sync_stamp(data: dict) -> dict:
+    """쓰기 데이터에 커밋 시각(SYNC_FIELD)을 붙인 사본을 반환합니다 (응답용 데이터에는 넣지 않음)"""
+    from google.cloud.firestore import SERVER_TIMESTAMP
+
+    return {**data, SYNC_FIELD: SERVER_TIMESTAMP}
+
+
+def parse_sync_time(value: str) -> datetime:
+    """커서에 담긴 ISO 시각을 해석합니다 (시간대가 없으면 UTC)"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class ISyncRepository(ABC):
+    """증분 동기화 저장소 인터페이스 (Dependency Inversion Principle)"""
+
+    @abstractmethod
+    def get_changes(
+        self,
+        uid: str,
+        collection: str,
+        limit: int,
+        after: Optional[Tuple[str, Optional[str]]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[str, Optional[str]]], bool]:
+        """collection 에서 (커밋 시각, 문서 ID) 가 after 이후인 문서를 커밋 순으로 조회합니다
+
+        after 의 문서 ID 가 None 이면 커밋 시각이 그보다 뒤인 문서부터 읽습니다.
+
+        Returns:
+            (문서 목록, 다음에 이어 읽을 (커밋 시각, 문서 ID) 또는 None, 더 남은 문서가 있는지 여부)
+        """
+        pass
+
+
+class FirestoreSyncRepository(ISyncRepository):
+    """Firestore 기반 증분 동기화 저장소 구현
+
+    각 컬렉션을 (sync_at, __name__) 순으로 읽으므로 단일 필드 자동 색인만으로 처리되며,
+    같은 시각에 바뀐 문서가 여러 개여도 문서 ID 로 이어서 읽을 수 있습니다.
+
+    마지막 문서가 쿼리 읽기 시각 - SYNC_SAFETY_LAG_SECONDS 보다 최근이면 커서를 그 시각으로 되돌려,
+    그 사이 문서는 다음 동기화에서 한 번 더 전달합니다. (앱은 upsert 하므로 중복은 무해함)
+    """
+
+    def __init__(self, database_id: str = FIRESTORE_DATABASE_ID):
+        self.database_id = database_id
+        self._db = None
+
+    def _get_db(self):
+        """공유 Firestore 클라이언트를 가져옵니다 (lazy initialization)"""
+        if self._db is None:
+            self._db = get_firestore_client(self.database_id)
+        return self._db
+
+    @timed_firestore("sync.get_changes")
+    def get_changes(
+        self,
+        uid: str,
+        collection: str,
+        limit: int,
+        after: Optional[Tuple[str, Optional[str]]] = None,
+    ) -> Tuple[List[dict], Optional[Tuple[str, Optional[str]]], bool]:
+        field = SYNC_CHANGE_FIELDS[collection]
+        ref = self._get_db().collection("users").document(uid).collection(collection)
+
+        query = ref.order_by(field).order_by("__name__")
+        if after is not None:
+            synced_at = parse_sync_time(after[0])
+            if after[1] is None:
+                query = query.where(field, ">", synced_at)
+            else:
+                query = query.start_after({field: synced_at, "__name__": ref.document(after[1])})
+
+        # 한 개를 더 읽어 남은 문서가 있는지 확인
+        docs = []
+        last = None
+        more = False
+        read_time = None
+        for doc in query.limit(limit + 1).stream():
+            if len(docs) == limit:
+                more = True
+                break
+            data = doc.to_dict()
+            last = (data.pop(field), doc.id)
+            read_time = doc.read_time
+            # tombstone 은 삭제된 원본 문서 ID 를 id 필드에 담고 있음
+            data.setdefault('id', doc.id)
+            docs.append(data)
+
+        if last is None:
+            return docs, None, False
+
+        # 읽기 시각 직전의 커밋은 아직 보이지 않았을 수 있으므로 커서를 안전 구간 앞으로 되돌림
+        horizon = read_time - timedelta(seconds=SYNC_SAFETY_LAG_SECONDS) if read_time is not None else None
+        if horizon is not None and last[0] > horizon:
+            logger.debug("⏪ 동기화 커서를 안전 구간 앞으로 되돌림: %s", collection)
+            return docs, (horizon.isoformat(), None), False
+        return docs, (last[0].isoformat(), last[1]), more
@@ -0,0 +1,106 @@
+"""
+수행 기록 집계(일/주/월 daily_stats, weekly_stats, monthly_stats) 백필 작업
+
+집계 문서는 수행 기록을 저장할 때 같은 배치로 증가시키므로, 집계 도입 이전에 저장된 수행 기록은
+집계 문서에 들어 있지 않습니다. 그래서 GET /executions/range 는 그 기간을 0 으로 보고하고,
+그런 날짜에 새 수행 기록이 저장되면 GET /executions/daily/stats 는 그 이후 기록만 셉니다.
+
+이 작업은 수행 기록이 있는 기간(일/주/월)마다 집계 문서를 수행 기록 전체로 다시 계산합니다.
+(FirestoreExecutionRepository.rebuild_rollup, 트랜잭션이라 서비스 중에도 실행 가능)
+이미 맞는 집계 문서는 다시 쓰지 않으므로 여러 번 실행해도 됩니다.
+모든 사용자의 일 단위 백필이 끝나면 ROLLUPS_COMPLETE_SINCE 를 가장 이른 날짜로 바꿔
+GET /executions/daily 재검증이 모든 날짜에서 일간 집계 문서를 쓰도록 합니다.
+
+사용법 (backend 디렉토리에서, 새 코드 배포 후 한 번):
+    python -m scripts.backfill_execution_rollups
+    python -m scripts.backfill_execution_rollups --uid <uid> --granularity week
+"""
+import argparse
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Sequence, Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from auth.firebase_init import initialize_firebase
+from repositories.execution_repository import FirestoreExecutionRepository, IExecutionRepository
+from repositories.execution_rollups import ROLLUP_COLLECTIONS, period_of
+from repositories.firestore_client import get_firestore_client
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+
+def collect_execution_dates(db, uid: Optional[str] = None) -> Dict[str, Set[str]]:
+    """수행 기록이 있는 사용자별 날짜 집합 (date 필드만 읽음)"""
+    if uid is not None:
+        query = db.collection("users").document(uid).collection("executions")
+    else:
+        query = db.collection_group("executions")
+
+    dates = defaultdict(set)
+    for doc in query.select(["date"]).stream():
+        date = doc.get("date")
+        if date:
+            dates[doc.reference.parent.parent.id].add(date)
+    return dates
+
+
+def backfill_execution_rollups(
+    repo: IExecutionRepository,
+    db,
+    uid: Optional[str] = None,
+    granularities: Sequence[str] = tuple(ROLLUP_COLLECTIONS),
+) -> dict:
+    """기간마다 집계 문서를 한 번씩 다시 계산하고 처리 결과를 반환합니다"""
+    started = time.monotonic()
+    counts = {granularity: {"periods": 0, "rebuilt": 0, "failed": 0} for granularity in granularities}
+
+    dates_by_uid = collect_execution_dates(db, uid)
+    for user_id, dates in dates_by_uid.items():
+        for granularity in granularities:
+            # 기간마다 대표 날짜 하나 (같은 기간을 두 번 계산하지 않도록)
+            periods = {}
+            for date in sorted(dates):
+                periods.setdefault(period_of(date, granularity)[0], date)
+
+            for key, date in periods.items():
+                counts[granularity]["periods"] += 1
+                try:
+                    if repo.rebuild_rollup(user_id, granularity, date):
+                        counts[granularity]["rebuilt"] += 1
+                except Exception as e:
+                    counts[granularity]["failed"] += 1
+                    logger.error("❌ 집계 재계산 실패 (%s, %s): %s", user_id, key, e)
+
+    counts["users"] = len(dates_by_uid)
+    counts["elapsed_seconds"] = round(time.monotonic() - started, 2)
+    logger.info("✅ 집계 백필 완료: %s", counts)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수행 기록 집계 백필")
+    parser.add_argument("--uid", help="한 사용자만 처리")
+    parser.add_argument(
+        "--granularity", choices=list(ROLLUP_COLLECTIONS), action="append",
+        help="처리할 집계 단위 (여러 번 지정 가능, 생략하면 전체)",
+    )
+    args = parser.parse_args()
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    counts = backfill_execution_rollups(
+        FirestoreExecutionRepository(), get_firestore_client(), args.uid,
+        args.granularity or tuple(ROLLUP_COLLECTIONS),
+    )
+    print(json.dumps(counts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+증분 동기화 커밋 시각(sync_at) 백필 작업
+
+GET /sync 는 루틴 / 수행 기록 / 삭제 기록을 sync_at (쓰기마다 SERVER_TIMESTAMP) 순으로 읽으며,
+order_by 필드가 없는 문서는 쿼리 결과에서 빠집니다. sync_at 도입 이전에 저장된 문서에
+지금 커밋 시각을 채워 다음 동기화 때 한 번 전달되도록 합니다.
+
+새 코드를 배포한 뒤 한 번 실행합니다. (배포 이후 쓰기는 이미 sync_at 이 있으므로 건너뜀)
+이전 커서보다 채운 시각이 항상 뒤이므로, 기존 앱은 다음 동기화에서 이 문서들을 한 번 더 받습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.backfill_sync_fields
+    python -m scripts.backfill_sync_fields --dry-run
+"""
+import argparse
+import json
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from google.api_core.exceptions import NotFound
+from google.cloud.firestore import SERVER_TIMESTAMP
+
+from auth.firebase_init import initialize_firebase
+from repositories.execution_repository import WRITE_BATCH_LIMIT
+from repositories.firestore_client import get_firestore_client
+from repositories.sync_repository import SYNC_CHANGE_FIELDS, SYNC_FIELD
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill_sync_fields(db, dry_run: bool = False) -> dict:
+    """sync_at 이 없는 동기화 대상 문서에 커밋 시각을 채우고 컬렉션별 처리 수를 반환합니다"""
+    counts = {}
+    for collection in SYNC_CHANGE_FIELDS:
+        scanned = 0
+        refs = []
+        for doc in db.collection_group(collection).select([SYNC_FIELD]).stream():
+            scanned += 1
+            if (doc.to_dict() or {}).get(SYNC_FIELD) is None:
+                refs.append(doc.reference)
+
+        updated = 0
+        if not dry_run:
+            for start in range(0, len(refs), WRITE_BATCH_LIMIT):
+                chunk = refs[start:start + WRITE_BATCH_LIMIT]
+                batch = db.batch()
+                for ref in chunk:
+                    # update 는 문서가 있어야 하므로 그 사이 삭제된 문서를 되살리지 않음
+                    batch.update(ref, {SYNC_FIELD: SERVER_TIMESTAMP})
+                try:
+                    batch.commit()
+                except NotFound as e:
+                    logger.warning("⚠️ 백필 중 삭제된 문서가 있어 배치를 건너뜀 (다시 실행하세요): %s", e)
+                    continue
+                updated += len(chunk)
+
+        counts[collection] = {"scanned": scanned, "missing": len(refs), "updated": updated}
+        logger.info("✅ %s: 문서 %s개 중 %s개 백필", collection, scanned, updated)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 동기화 sync_at 백필")
+    parser.add_argument("--dry-run", action="store_true", help="쓰지 않고 빠진 문서 수만 셉니다")
+    args = parser.parse_args()
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    counts = backfill_sync_fields(get_firestore_client(), dry_run=args.dry_run)
+    print(json.dumps(counts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
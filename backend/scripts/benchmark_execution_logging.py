@@ -0,0 +1,124 @@
+"""
+수행 기록 저장(POST /executions/{routine_id})의 Firestore RPC 수 측정
+
+Firestore GAPIC 클라이언트의 RPC 메서드를 감싸 요청마다 호출된 RPC 를 셉니다.
+    - cold: 루틴 ID 집합에 없는 루틴 (워커가 막 시작됨) → 트랜잭션으로 루틴 확인 + 저장
+    - warm: 존재가 확인된 루틴 → commit 한 번 (루틴 문서 update 전제조건 포함, 조회 없음)
+    - retry: 같은 요청 재시도 → 메모리 캐시 응답 (RPC 없음)
+    - missing: 없는 루틴 → 트랜잭션 확인 후 404
+warm / retry 가 기대한 RPC 수와 다르면 실패(종료 코드 1)하므로 회귀 확인용으로도 쓸 수 있습니다.
+
+사용법 (backend 디렉토리에서, Firestore 에뮬레이터 권장):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 \\
+        python -m scripts.benchmark_execution_logging --requests 50
+"""
+import argparse
+import json
+import time
+from collections import Counter
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from fastapi.testclient import TestClient
+
+from auth.firebase_init import initialize_firebase
+from auth.middleware import verify_firebase_token
+from api.dependencies import get_routine_repository
+from repositories.cached_routine_repository import CachedRoutineRepository
+from repositories.firestore_client import get_firestore_client
+from repositories.routine_repository import FirestoreRoutineRepository
+from main import app
+
+BENCHMARK_UID = "benchmark-execution-logging"
+
+RPC_METHODS = (
+    "get_document", "batch_get_documents", "run_query", "list_documents",
+    "begin_transaction", "commit", "rollback", "batch_write",
+)
+
+
+class RpcCounter:
+    """Firestore 클라이언트가 보내는 RPC 를 메서드별로 셉니다"""
+
+    def __init__(self, client):
+        self.counts = Counter()
+        api = client._firestore_api
+        for name in RPC_METHODS:
+            if hasattr(api, name):
+                setattr(api, name, self._wrap(name, getattr(api, name)))
+
+    def _wrap(self, name, method):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return method(*args, **kwargs)
+        return counted
+
+    def measure(self, func) -> dict:
+        self.counts.clear()
+        func()
+        return dict(self.counts)
+
+
+def execution_body(routine_id: str, index: int) -> dict:
+    started = f"2026-01-15T{index // 60 % 24:02d}:{index % 60:02d}:00Z"
+    return {
+        "routine_id": routine_id,
+        "routine_title": "벤치마크 루틴",
+        "started_at": started,
+        "ended_at": started,
+        "duration_seconds": 60,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수행 기록 저장 RPC 수 측정")
+    parser.add_argument("--requests", type=int, default=50, help="warm 경로 반복 횟수 (지연 측정용)")
+    args = parser.parse_args()
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    counter = RpcCounter(get_firestore_client())
+
+    app.dependency_overrides[verify_firebase_token] = lambda: BENCHMARK_UID
+    results = {}
+    failures = []
+
+    with TestClient(app) as http:
+        routine_id = http.post(
+            "/routines", json={"title": "벤치마크 루틴", "time": "07:00", "category": "benchmark"}
+        ).json()["id"]
+
+        # 워커가 막 시작되어 루틴 ID 집합이 비어 있는 상태
+        routine_repo = CachedRoutineRepository(FirestoreRoutineRepository())
+        app.dependency_overrides[get_routine_repository] = lambda: routine_repo
+        base = int(time.time()) % 1000 * 100
+
+        def post(index: int, expected: int, routine: str = routine_id):
+            response = http.post(f"/executions/{routine}", json=execution_body(routine, index))
+            if response.status_code != expected:
+                failures.append(f"status {response.status_code} != {expected}")
+
+        results["cold"] = counter.measure(lambda: post(base, 201))
+        results["warm"] = counter.measure(lambda: post(base + 1, 201))
+        results["retry"] = counter.measure(lambda: post(base + 1, 201))
+        results["missing"] = counter.measure(lambda: post(base + 2, 404, "missing-routine"))
+
+        started = time.perf_counter()
+        for i in range(args.requests):
+            post(base + 10 + i, 201)
+        results["warm_ms"] = round((time.perf_counter() - started) / args.requests * 1000, 2)
+
+    if results["warm"] != {"commit": 1}:
+        failures.append(f"warm path RPCs {results['warm']} != {{'commit': 1}}")
+    if results["retry"]:
+        failures.append(f"retry RPCs {results['retry']} != {{}}")
+
+    print(json.dumps(results, indent=2))
+    if failures:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+AI 피드백 프롬프트 크기 / 지연 비교
+
+루틴 기록이 많은 날을 가정한 가상 일간 통계로, 이전 방식(수행 기록 전체를 JSON 으로 덤프)과
+현재 프롬프트의 추정 토큰 수를 비교합니다. --latency 를 주면 generate_ai_feedback 의
+종단 지연도 측정합니다 (OPENAI_BASE_URL 로 scripts/llm_stub_server.py 를 가리키면 로컬에서 가능).
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_feedback_prompt --executions 10 50 200
+    OPENAI_BASE_URL=http://localhost:9000/v1 OPENAI_API_KEY=stub \\
+        python -m scripts.benchmark_feedback_prompt --latency --runs 5
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from api.schemas import DailySummaryResponse, ExecutionResponse
+from services.ai_feedback import generate_ai_feedback
+from services.feedback_prompt import build_feedback_prompt, estimate_tokens
+
+ROUTINE_TITLES = ["아침 스트레칭", "물 마시기", "독서", "명상", "영어 단어 암기", "산책", "일기 쓰기", "코딩 공부"]
+
+
+def make_summary(executions: int, date: str = "2026-01-15") -> DailySummaryResponse:
+    """루틴 8개를 번갈아 수행한 가상 일간 통계를 만듭니다"""
+    day = datetime.fromisoformat(date).replace(hour=6, tzinfo=timezone.utc)
+    items = []
+    for i in range(executions):
+        started = day + timedelta(minutes=7 * i)
+        duration = 60 * (5 + i % 20)
+        items.append(ExecutionResponse(
+            id=f"exec{i:04d}",
+            routine_id=f"routine{i % len(ROUTINE_TITLES)}",
+            routine_title=ROUTINE_TITLES[i % len(ROUTINE_TITLES)],
+            started_at=started.isoformat(),
+            ended_at=(started + timedelta(seconds=duration)).isoformat(),
+            duration_seconds=duration,
+            date=date,
+            created_at=started.isoformat(),
+        ))
+    return DailySummaryResponse(
+        date=date,
+        total_routines=len(items),
+        total_duration_seconds=sum(item.duration_seconds for item in items),
+        executions=items,
+    )
+
+
+def legacy_prompt_tokens(summary: DailySummaryResponse) -> int:
+    """이전 방식처럼 수행 기록을 indent=2 JSON 으로 덤프했을 때의 추정 토큰 수"""
+    detail = [
+        {
+            "title": execution.routine_title,
+            "started_at": execution.started_at,
+            "ended_at": execution.ended_at,
+            "duration_minutes": execution.duration_seconds // 60,
+        }
+        for execution in summary.executions
+    ]
+    # 지시문 부분은 현재 프롬프트와 비슷한 길이로 가정
+    return estimate_tokens(json.dumps(detail, ensure_ascii=False, indent=2)) + 250
+
+
+async def measure_latency(summary: DailySummaryResponse, runs: int) -> dict:
+    elapsed = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await generate_ai_feedback(summary)
+        elapsed.append(time.perf_counter() - started)
+    return {
+        "p50_ms": round(statistics.median(elapsed) * 1000, 1),
+        "max_ms": round(max(elapsed) * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 피드백 프롬프트 크기 / 지연 비교")
+    parser.add_argument("--executions", type=int, nargs="+", default=[10, 50, 200], help="하루 수행 기록 수")
+    parser.add_argument("--latency", action="store_true", help="generate_ai_feedback 종단 지연도 측정")
+    parser.add_argument("--runs", type=int, default=3, help="지연 측정 반복 횟수")
+    args = parser.parse_args()
+
+    for count in args.executions:
+        summary = make_summary(count)
+        result = {
+            "executions": count,
+            "legacy_tokens": legacy_prompt_tokens(summary),
+            "compact_tokens": estimate_tokens(build_feedback_prompt(summary)),
+        }
+        if args.latency:
+            result["latency"] = asyncio.run(measure_latency(summary, args.runs))
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+AI 피드백 첫 바이트까지 시간(TTFB) 비교: 일반 응답 vs NDJSON 스트림
+
+로컬 LLM 스텁 서버(scripts/llm_stub_server.py)와 백엔드를 같은 프로세스의 uvicorn 으로 띄우고
+실제 HTTP 로 두 엔드포인트를 번갈아 호출합니다.
+    - GET /executions/daily/{date}/feedback         : 생성이 끝나야 응답 (TTFB = 전체 시간)
+    - GET /executions/daily/{date}/feedback/stream  : summary → short → full 조각 → done
+스트림은 첫 줄(summary), short, done 도착 시각을 각각 잽니다.
+
+매 반복 전에 수행 기록을 하나 추가해 일간 통계 해시를 바꾸므로 피드백 캐시에 걸리지 않고 매번 생성합니다.
+(httpx 의 ASGI 전송은 응답 본문을 모두 모은 뒤 돌려주므로 TTFB 측정에는 실제 서버가 필요함)
+
+사용법 (backend 디렉토리에서, Firestore 에뮬레이터 권장):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 \\
+        python -m scripts.benchmark_feedback_ttfb --repeat 10 --llm-latency 0.8
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import httpx
+import uvicorn
+
+BENCHMARK_UID = "benchmark-feedback-ttfb"
+BENCHMARK_DATE = "2026-01-15"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app, port: int) -> uvicorn.Server:
+    """uvicorn 을 백그라운드 스레드에서 띄우고 요청을 받을 수 있을 때까지 기다립니다"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def time_blocking(http: httpx.Client, base: str) -> dict:
+    started = time.perf_counter()
+    first_byte = None
+    with http.stream("GET", f"{base}/executions/daily/{BENCHMARK_DATE}/feedback") as response:
+        for _ in response.iter_raw():
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+    return {"ttfb": first_byte, "short": first_byte, "done": time.perf_counter() - started}
+
+
+def time_stream(http: httpx.Client, base: str) -> dict:
+    timings = {}
+    started = time.perf_counter()
+    with http.stream("GET", f"{base}/executions/daily/{BENCHMARK_DATE}/feedback/stream") as response:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            event = json.loads(line)["event"]
+            elapsed = time.perf_counter() - started
+            timings.setdefault("ttfb", elapsed)
+            if event in ("short", "fallback"):
+                timings.setdefault("short", elapsed)
+            elif event == "done":
+                timings["done"] = elapsed
+    return timings
+
+
+def summarize(samples: list) -> dict:
+    return {
+        key: round(statistics.median(sample[key] for sample in samples) * 1000, 1)
+        for key in ("ttfb", "short", "done")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 피드백 TTFB 비교")
+    parser.add_argument("--repeat", type=int, default=10, help="엔드포인트별 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="스텁 LLM 의 첫 응답 지연 (초)")
+    args = parser.parse_args()
+
+    # 스텁 / LLM 클라이언트는 환경 변수를 처음 불러올 때 읽으므로 먼저 설정
+    stub_port = free_port()
+    os.environ["STUB_LATENCY_SECONDS"] = str(args.llm_latency)
+    os.environ["STUB_FAILURE_RATE"] = "0"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{stub_port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+    from auth.firebase_init import initialize_firebase
+    from auth.middleware import verify_firebase_token
+    from main import app
+    from scripts.benchmark_execution_logging import execution_body
+    from scripts.llm_stub_server import app as stub_app
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    app.dependency_overrides[verify_firebase_token] = lambda: BENCHMARK_UID
+
+    start_server(stub_app, stub_port)
+    backend_port = free_port()
+    start_server(app, backend_port)
+    base = f"http://127.0.0.1:{backend_port}"
+
+    results = {"blocking": [], "stream": []}
+    with httpx.Client(timeout=60) as http:
+        routine_id = http.post(
+            f"{base}/routines", json={"title": "벤치마크 루틴", "time": "07:00", "category": "benchmark"}
+        ).json()["id"]
+        index = int(time.time()) % 1000
+
+        for _ in range(args.repeat):
+            for mode, measure in (("blocking", time_blocking), ("stream", time_stream)):
+                # 통계가 바뀌어 피드백 캐시를 건너뜀
+                index += 1
+                http.post(f"{base}/executions/{routine_id}", json=execution_body(routine_id, index))
+                results[mode].append(measure(http, base))
+
+    report = {mode: summarize(samples) for mode, samples in results.items()}
+    report["config"] = {"repeat": args.repeat, "llm_latency_seconds": args.llm_latency}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Firestore 클라이언트 준비 비용 측정
+
+- 시작 비용: Firebase 초기화 + 공유 클라이언트 생성 + 첫 RPC(gRPC 채널 연결)
+- 요청당 비용: 공유 클라이언트 조회 vs 요청마다 새 클라이언트를 만드는 경우
+
+사용법 (backend 디렉토리에서, 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 필요):
+    python -m scripts.benchmark_firestore_client --calls 10000
+"""
+import argparse
+import json
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from firebase_admin import get_app
+from google.cloud import firestore
+
+from auth.firebase_init import initialize_firebase
+from repositories.firestore_client import FIRESTORE_DATABASE_ID, close_firestore_clients, get_firestore_client
+
+
+def per_call_us(func, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return round((time.perf_counter() - started) / calls * 1_000_000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Firestore 클라이언트 준비 비용 측정")
+    parser.add_argument("--calls", type=int, default=10000, help="공유 클라이언트 조회 반복 횟수")
+    parser.add_argument("--fresh-calls", type=int, default=20, help="새 클라이언트 생성 반복 횟수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키가 필요합니다")
+    client = get_firestore_client()
+    startup_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    client.collection("benchmark").document("ping").get()
+    first_rpc_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    client.collection("benchmark").document("ping").get()
+    warm_rpc_ms = (time.perf_counter() - started) * 1000
+
+    app = get_app()
+
+    def fresh_client_rpc():
+        fresh = firestore.Client(
+            credentials=app.credential.get_credential(),
+            project=app.project_id,
+            database=FIRESTORE_DATABASE_ID,
+        )
+        fresh.collection("benchmark").document("ping").get()
+        fresh._firestore_api.transport.close()
+
+    print(json.dumps({
+        "startup_ms": round(startup_ms, 1),
+        "first_rpc_ms": round(first_rpc_ms, 1),
+        "warm_rpc_ms": round(warm_rpc_ms, 1),
+        "shared_lookup_us": per_call_us(get_firestore_client, args.calls),
+        "fresh_client_rpc_us": per_call_us(fresh_client_rpc, args.fresh_calls),
+    }, ensure_ascii=False))
+
+    close_firestore_clients()
+
+
+if __name__ == "__main__":
+    main()
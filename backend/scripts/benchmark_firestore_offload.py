@@ -0,0 +1,143 @@
+"""
+Firestore 호출 스레드 풀 오프로드(run_blocking) 전후 동시 요청 처리량 비교
+
+한 워커(이벤트 루프 하나)에 동시 요청을 보내 처리량과 지연을 잽니다.
+    - inline:  Firestore 호출을 이벤트 루프에서 직접 실행 (run_blocking 도입 이전 동작)
+    - offload: run_blocking 으로 Firestore 전용 스레드 풀에서 실행 (현재 동작)
+inline 에서는 RPC 하나가 끝날 때까지 루프가 멈춰 요청이 사실상 한 줄로 처리되므로,
+처리량이 대략 1 / RPC 왕복 시간에 묶입니다.
+
+에뮬레이터는 같은 머신에 있어 왕복 시간이 실제 Cloud Firestore 보다 훨씬 짧으므로,
+--rtt-ms 로 RPC 마다 지연을 더해 운영 환경의 네트워크 왕복을 흉내 낼 수 있습니다.
+
+사용법 (backend 디렉토리에서, Firestore 에뮬레이터 권장):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 \\
+        python -m scripts.benchmark_firestore_offload --requests 500 --concurrency 100 --rtt-ms 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import httpx
+
+import api.executions
+import api.routines
+import api.sync
+import services.feedback_cache
+from auth.firebase_init import initialize_firebase
+from auth.middleware import verify_firebase_token
+from repositories.executor import FIRESTORE_MAX_WORKERS, run_blocking
+from repositories.firestore_client import get_firestore_client
+from scripts.benchmark_execution_logging import RPC_METHODS, execution_body
+from main import app
+
+BENCHMARK_UID = "benchmark-firestore-offload"
+BENCHMARK_DATE = "2026-01-15"
+
+# run_blocking 을 이름으로 가져다 쓰는 모듈 (inline 모드에서 바꿔 끼움)
+RUN_BLOCKING_MODULES = (api.executions, api.routines, api.sync, services.feedback_cache)
+
+
+async def run_inline(func, *args, **kwargs):
+    """run_blocking 도입 이전처럼 이벤트 루프 스레드에서 바로 호출"""
+    return func(*args, **kwargs)
+
+
+def add_rpc_latency(client, rtt_ms: float):
+    """Firestore 클라이언트의 RPC 메서드마다 네트워크 왕복 지연을 더합니다"""
+    api = client._firestore_api
+
+    def delayed(method):
+        def call(*args, **kwargs):
+            time.sleep(rtt_ms / 1000)
+            return method(*args, **kwargs)
+        return call
+
+    for name in RPC_METHODS:
+        if hasattr(api, name):
+            setattr(api, name, delayed(getattr(api, name)))
+
+
+async def measure(http: httpx.AsyncClient, requests: int, concurrency: int) -> dict:
+    """동시 concurrency 개로 GET /executions/daily 를 requests 번 보내고 처리량과 지연을 반환합니다"""
+    latencies = []
+    failures = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            response = await http.get("/executions/daily", params={"date": BENCHMARK_DATE})
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 1),
+        "failures": failures,
+    }
+
+
+async def run(args) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+        # 조회할 수행 기록 몇 개 (routine 생성 / 수행 기록 저장은 측정하지 않음)
+        routine = await http.post("/routines", json={"title": "벤치마크 루틴", "time": "07:00", "category": "benchmark"})
+        routine_id = routine.json()["id"]
+        for index in range(3):
+            await http.post(f"/executions/{routine_id}", json=execution_body(routine_id, 420 + index))
+
+        # 워밍업 (gRPC 채널 연결 / 스레드 풀 생성)
+        await measure(http, min(args.concurrency, 20), args.concurrency)
+
+        results = {}
+        for mode, runner in (("inline", run_inline), ("offload", run_blocking)):
+            for module in RUN_BLOCKING_MODULES:
+                module.run_blocking = runner
+            results[mode] = await measure(http, args.requests, args.concurrency)
+        for module in RUN_BLOCKING_MODULES:
+            module.run_blocking = run_blocking
+
+    results["speedup"] = round(results["offload"]["requests_per_second"] / results["inline"]["requests_per_second"], 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Firestore 오프로드 전후 동시 요청 처리량 비교")
+    parser.add_argument("--requests", type=int, default=500, help="모드별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시 요청 수")
+    parser.add_argument("--rtt-ms", type=float, default=0, help="RPC 마다 더할 네트워크 왕복 지연 (ms)")
+    args = parser.parse_args()
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    if args.rtt_ms > 0:
+        add_rpc_latency(get_firestore_client(), args.rtt_ms)
+
+    app.dependency_overrides[verify_firebase_token] = lambda: BENCHMARK_UID
+    results = asyncio.run(run(args))
+    results["config"] = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "rtt_ms": args.rtt_ms,
+        "firestore_max_workers": FIRESTORE_MAX_WORKERS,
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
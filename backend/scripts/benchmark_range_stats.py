@@ -0,0 +1,130 @@
+"""
+기간 통계(GET /executions/range) vs 날짜별 요청(GET /executions/daily) 비교 벤치마크
+
+1년치 합성 수행 기록을 저장한 뒤 주간 / 월간 / 연간 화면을 만드는 두 방법의 지연과 Firestore RPC 수를 잽니다.
+    - daily: 화면의 날짜마다 GET /executions/daily (7 / 31 / 365번, 날짜마다 쿼리 하나)
+    - range: GET /executions/range 한 번 (일/주/월 집계 문서만 읽음)
+수행 기록은 create_many 로 저장하므로 집계 문서도 서비스와 같은 경로로 만들어지며,
+마지막에 집계 백필을 돌려 증분으로 쌓인 집계가 수행 기록 전체로 다시 계산한 값과 같은지도 확인합니다.
+
+사용법 (backend 디렉토리에서, Firestore 에뮬레이터 권장):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 \\
+        python -m scripts.benchmark_range_stats --per-day 3 --routines 5 --repeat 5
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import date as date_cls, timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from fastapi.testclient import TestClient
+
+from auth.firebase_init import initialize_firebase
+from auth.middleware import verify_firebase_token
+from api.dependencies import get_execution_repository
+from repositories.execution_repository import FirestoreExecutionRepository
+from repositories.firestore_client import get_firestore_client
+from scripts.backfill_execution_rollups import backfill_execution_rollups
+from scripts.benchmark_execution_logging import RpcCounter
+from main import app
+
+YEAR_START = date_cls(2025, 1, 1)
+YEAR_DAYS = 365
+
+# (화면, 시작일, 종료일, /range 집계 단위)
+VIEWS = [
+    ("week", "2025-06-02", "2025-06-08", "day"),
+    ("month", "2025-06-01", "2025-06-30", "day"),
+    ("year", "2025-01-01", "2025-12-31", "month"),
+]
+
+
+def synthetic_year(routines: int, per_day: int):
+    """1년 동안 매일 per_day 개씩 루틴을 돌아가며 수행한 기록 (일부 날짜는 건너뜀)"""
+    execution_ids, executions = [], []
+    for day_index in range(YEAR_DAYS):
+        day = YEAR_START + timedelta(days=day_index)
+        # 연속 수행 계산이 의미 있도록 열흘에 하루는 쉼
+        if day_index % 10 == 9:
+            continue
+        for slot in range(per_day):
+            routine = (day_index + slot) % routines
+            started = f"{day.isoformat()}T{6 + slot:02d}:00:00"
+            execution_ids.append(f"{day.isoformat()}-{slot}")
+            executions.append({
+                "routine_id": f"routine{routine}",
+                "routine_title": f"루틴 {routine}",
+                "started_at": started,
+                "ended_at": started,
+                "duration_seconds": 600 + 60 * routine,
+                "date": day.isoformat(),
+                "created_at": started,
+            })
+    return execution_ids, executions
+
+
+def dates_between(start: str, end: str):
+    day = date_cls.fromisoformat(start)
+    while day <= date_cls.fromisoformat(end):
+        yield day.isoformat()
+        day += timedelta(days=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기간 통계 vs 날짜별 요청 벤치마크")
+    parser.add_argument("--routines", type=int, default=5, help="루틴 수")
+    parser.add_argument("--per-day", type=int, default=3, help="하루 수행 기록 수")
+    parser.add_argument("--repeat", type=int, default=5, help="화면마다 반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    if initialize_firebase() is None:
+        raise SystemExit("Firebase 서비스 계정 키 또는 FIRESTORE_EMULATOR_HOST 가 필요합니다")
+    db = get_firestore_client()
+    counter = RpcCounter(db)
+
+    uid = f"benchmark-range-{int(time.time())}"
+    execution_repo = FirestoreExecutionRepository()
+    app.dependency_overrides[verify_firebase_token] = lambda: uid
+    app.dependency_overrides[get_execution_repository] = lambda: execution_repo
+
+    execution_ids, executions = synthetic_year(args.routines, args.per_day)
+    seeded = time.perf_counter()
+    execution_repo.create_many(uid, execution_ids, executions)
+    results = {
+        "executions": len(executions),
+        "seed_seconds": round(time.perf_counter() - seeded, 2),
+        "views": {},
+    }
+
+    with TestClient(app) as http:
+        for view, start, end, granularity in VIEWS:
+            def by_day():
+                for date in dates_between(start, end):
+                    http.get("/executions/daily", params={"date": date})
+
+            def by_range():
+                http.get("/executions/range", params={"from": start, "to": end, "granularity": granularity})
+
+            view_results = {}
+            for name, func in (("daily", by_day), ("range", by_range)):
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    rpcs = counter.measure(func)
+                    timings.append((time.perf_counter() - started) * 1000)
+                view_results[name] = {"median_ms": round(statistics.median(timings), 1), "rpcs": rpcs}
+            results["views"][view] = view_results
+
+        # 증분으로 쌓인 집계가 전체 재계산과 같으면 백필이 아무것도 고치지 않음
+        backfill = backfill_execution_rollups(execution_repo, db, uid)
+        results["backfill_rebuilt"] = {g: backfill[g]["rebuilt"] for g in ("day", "week", "month")}
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
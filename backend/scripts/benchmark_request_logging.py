@@ -0,0 +1,110 @@
+"""
+요청 로깅 오버헤드 비교
+
+아무 일도 하지 않는 ASGI 앱을 직접 호출해 요청당 로깅 비용(µs)을 잽니다.
+    - none: 로그 없음 (기준)
+    - legacy: 이전 방식 (요청마다 배너 포함 info 7줄, f-string, StreamHandler 에 동기 출력)
+    - structured: RequestLoggingMiddleware (한 줄 JSON, QueueHandler 로 비동기 출력)
+      --sample-rate 로 성공 요청 샘플링 비율을 바꿔 가며 비교할 수 있습니다.
+출력은 모두 os.devnull 로 보내므로 터미널 속도와 무관합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_request_logging --requests 20000
+    python -m scripts.benchmark_request_logging --sample-rate 1.0 0.1 0.01
+"""
+import argparse
+import asyncio
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import time
+
+from api.request_logging import JsonFormatter, RequestLoggingMiddleware, _LocalQueueHandler
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/routines/abc123",
+    "headers": [],
+    "query_string": b"",
+}
+
+legacy_logger = logging.getLogger("benchmark.legacy")
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def plain_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"[]"})
+
+
+async def legacy_app(scope, receive, send):
+    uid = "user-1234"
+    logger = legacy_logger
+    logger.info("=" * 60)
+    logger.info("📋 루틴 조회 요청 수신")
+    logger.info(f"   - UID: {uid}")
+    logger.info("=" * 60)
+    await plain_app(scope, receive, send)
+    logger.info(f"✅ 루틴 조회 성공: {0}개")
+
+
+def use_handler(handler: logging.Handler):
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+async def run(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 로깅 오버헤드 비교")
+    parser.add_argument("--requests", type=int, default=20000, help="측정할 요청 수")
+    parser.add_argument("--sample-rate", type=float, nargs="+", default=[1.0, 0.1], help="성공 요청 샘플링 비율")
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    results = {}
+
+    use_handler(logging.NullHandler())
+    results["none_us"] = asyncio.run(run(plain_app, args.requests))
+
+    # 이전 방식: basicConfig 과 같은 형식으로 요청 스레드에서 바로 출력
+    legacy_handler = logging.StreamHandler(devnull)
+    legacy_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    use_handler(legacy_handler)
+    results["legacy_us"] = asyncio.run(run(legacy_app, args.requests))
+
+    # 현재 방식: 큐에 넣기만 하고 포맷 / 출력은 리스너 스레드에서
+    json_handler = logging.StreamHandler(devnull)
+    json_handler.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, json_handler)
+    listener.start()
+    use_handler(_LocalQueueHandler(log_queue))
+    for rate in args.sample_rate:
+        app = RequestLoggingMiddleware(plain_app, sample_rate=rate)
+        results[f"structured_sample_{rate}_us"] = asyncio.run(run(app, args.requests))
+    listener.stop()
+
+    print(json.dumps({key: round(value, 2) for key, value in results.items()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+루틴 자동 조정(plan_reschedule) 성능 측정
+
+무작위로 만든 루틴 N개(겹침 포함)에 대해 재배치 계획 계산 시간을 측정합니다.
+Firestore 없이 순수 계산만 측정합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_reschedule --routines 100 300 1000
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+from services.scheduler import plan_reschedule
+
+
+def make_routines(count: int, seed: int = 42) -> list:
+    """하루 05:00 ~ 23:00 사이에 흩어진, 일부가 서로 겹치는 가상 루틴을 만듭니다"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"routine{i:04d}",
+            "title": f"루틴 {i}",
+            "time": f"{rng.randrange(5, 23):02d}:{rng.randrange(0, 60, 5):02d}",
+            "days": sorted(rng.sample(range(7), rng.randint(1, 3))),
+            "duration_minutes": rng.choice([5, 10, 15, 20, 30]),
+            "flexibility_minutes": rng.choice([0, 15, 30, 60, 120]),
+            "created_at": f"2026-01-01T00:00:{i % 60:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="루틴 자동 조정 성능 측정")
+    parser.add_argument("--routines", type=int, nargs="+", default=[100, 300, 1000], help="사용자당 루틴 수")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    for count in args.routines:
+        routines = make_routines(count)
+        elapsed = []
+        plan = None
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            plan = plan_reschedule(routines)
+            elapsed.append(time.perf_counter() - started)
+
+        print(json.dumps({
+            "routines": count,
+            "p50_ms": round(statistics.median(elapsed) * 1000, 2),
+            "max_ms": round(max(elapsed) * 1000, 2),
+            "changes": len(plan.changes),
+            "unresolved": len(plan.unresolved),
+            "conflicts_before": plan.conflicts_before,
+            "conflicts_after": plan.conflicts_after,
+        }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
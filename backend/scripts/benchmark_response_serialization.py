@@ -0,0 +1,117 @@
+"""
+목록 응답 직렬화 비교 (루틴 / 수행 기록)
+
+Firestore 에서 읽은 것과 같은 dict 목록을 응답 바이트로 만드는 데 걸리는 시간을 비교합니다.
+    - response_model: 모델 생성 → FastAPI 응답 검증 / 직렬화 → json.dumps (기존 경로)
+    - fast: 응답 dict 생성 → strict 검증 한 번 → orjson (api/fast_json.ValidatedJSON)
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_response_serialization --items 1000 --runs 50
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from api.executions import DAILY_SUMMARY_JSON, build_daily_summary, daily_summary_row
+from api.fast_json import orjson
+from api.routines import ROUTINE_LIST_JSON, routine_row, to_routine_response
+from api.schemas import DailySummaryResponse, RoutineResponse
+
+UID = "benchmark-user"
+
+
+def make_routines(count: int) -> List[dict]:
+    return [
+        {
+            "id": f"routine{i:05d}",
+            "uid": UID,
+            "title": f"루틴 {i}",
+            "time": f"{(i // 60) % 24:02d}:{i % 60:02d}",
+            "category": "health",
+            "color": "#4caf50",
+            "days": [0, 2, 4],
+            "duration_minutes": 30,
+            "flexibility_minutes": 15,
+            "created_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-02T00:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def make_executions(count: int) -> List[dict]:
+    return [
+        {
+            "id": f"exec{i:05d}",
+            "routine_id": f"routine{i % 20:05d}",
+            "routine_title": f"루틴 {i % 20}",
+            "started_at": f"2026-01-15T{(i // 60) % 24:02d}:{i % 60:02d}:00+00:00",
+            "ended_at": f"2026-01-15T{(i // 60) % 24:02d}:{i % 60:02d}:30+00:00",
+            "duration_seconds": 30,
+            "date": "2026-01-15",
+            "created_at": "2026-01-15T23:59:00",
+        }
+        for i in range(count)
+    ]
+
+
+def response_model_bytes(field, content) -> bytes:
+    """FastAPI 가 response_model 이 있는 핸들러의 반환값을 처리하는 것과 같은 단계"""
+    serialized = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(serialized).body
+
+
+def measure(func, runs: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return round((time.perf_counter() - started) / runs * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 비교")
+    parser.add_argument("--items", type=int, default=1000, help="루틴 / 수행 기록 수")
+    parser.add_argument("--runs", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    routines = make_routines(args.items)
+    executions = make_executions(args.items)
+    routine_field = create_model_field(name="Response", type_=List[RoutineResponse], mode="serialization")
+    summary_field = create_model_field(name="Response", type_=DailySummaryResponse, mode="serialization")
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    assert json.loads(ROUTINE_LIST_JSON.dump([routine_row(d, UID) for d in routines])) == json.loads(
+        response_model_bytes(routine_field, [to_routine_response(d, UID) for d in routines])
+    )
+    assert json.loads(DAILY_SUMMARY_JSON.dump(daily_summary_row("2026-01-15", executions))) == json.loads(
+        response_model_bytes(summary_field, build_daily_summary("2026-01-15", executions))
+    )
+
+    results = {
+        "items": args.items,
+        "orjson": orjson is not None,
+        "routines_response_model_ms": measure(
+            lambda: response_model_bytes(routine_field, [to_routine_response(d, UID) for d in routines]), args.runs
+        ),
+        "routines_fast_ms": measure(
+            lambda: ROUTINE_LIST_JSON.dump([routine_row(d, UID) for d in routines]), args.runs
+        ),
+        "executions_response_model_ms": measure(
+            lambda: response_model_bytes(summary_field, build_daily_summary("2026-01-15", executions)), args.runs
+        ),
+        "executions_fast_ms": measure(
+            lambda: DAILY_SUMMARY_JSON.dump(daily_summary_row("2026-01-15", executions)), args.runs
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
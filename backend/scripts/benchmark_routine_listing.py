@@ -0,0 +1,94 @@
+"""
+루틴 목록 조회 비교: 전체 조회 vs 커서 페이지 조회 (+ 필드 선택)
+
+테스트용 사용자에게 루틴 N개를 만든 뒤, 전체 목록을 읽는 경우와 첫 페이지만 읽는 경우의
+읽은 문서 수, 응답 크기, 지연을 비교합니다. 실제 데이터와 섞이지 않도록
+Firestore 에뮬레이터(FIRESTORE_EMULATOR_HOST)에서 실행하는 것을 권장합니다.
+
+사용법 (backend 디렉토리에서):
+    FIRESTORE_EMULATOR_HOST=localhost:8080 \\
+        python -m scripts.benchmark_routine_listing --routines 1000 5000 --page-size 50
+"""
+import argparse
+import json
+import statistics
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from auth.firebase_init import initialize_firebase
+
+from repositories.routine_repository import FirestoreRoutineRepository
+
+BENCHMARK_UID = "benchmark-routine-listing"
+LIST_FIELDS = ["id", "title", "time"]
+
+
+def seed(repo: FirestoreRoutineRepository, uid: str, count: int):
+    """기존 루틴을 지우고 count 개를 새로 만듭니다"""
+    for routine in repo.get_all_by_user(uid):
+        repo.delete(uid, routine["id"])
+
+    now_str = "2026-01-01T00:00:00"
+    routines = [
+        {
+            "uid": uid,
+            "title": f"루틴 {i}",
+            "time": f"{(i // 60) % 24:02d}:{i % 60:02d}",
+            "category": "benchmark",
+            "color": "#FF5722",
+            "days": [0, 1, 2, 3, 4],
+            "created_at": now_str,
+            "updated_at": now_str,
+        }
+        for i in range(count)
+    ]
+    for start in range(0, len(routines), 500):
+        repo.create_many(uid, routines[start:start + 500])
+
+
+def measure(func, runs: int) -> tuple:
+    elapsed = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func()
+        elapsed.append(time.perf_counter() - started)
+    return result, round(statistics.median(elapsed) * 1000, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="루틴 목록 조회 비교")
+    parser.add_argument("--routines", type=int, nargs="+", default=[1000, 5000], help="사용자당 루틴 수")
+    parser.add_argument("--page-size", type=int, default=50, help="페이지 크기")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    initialize_firebase()
+    repo = FirestoreRoutineRepository()
+
+    for count in args.routines:
+        seed(repo, BENCHMARK_UID, count)
+
+        full, full_ms = measure(lambda: repo.get_all_by_user(BENCHMARK_UID), args.runs)
+        (page, _), page_ms = measure(lambda: repo.get_page(BENCHMARK_UID, args.page_size), args.runs)
+        (projected, _), projected_ms = measure(
+            lambda: repo.get_page(BENCHMARK_UID, args.page_size, fields=LIST_FIELDS), args.runs
+        )
+
+        print(json.dumps({
+            "routines": count,
+            "full": {"docs": len(full), "bytes": len(json.dumps(full, ensure_ascii=False)), "p50_ms": full_ms},
+            "page": {"docs": len(page), "bytes": len(json.dumps(page, ensure_ascii=False)), "p50_ms": page_ms},
+            "page_projected": {
+                "docs": len(projected),
+                "bytes": len(json.dumps(projected, ensure_ascii=False)),
+                "p50_ms": projected_ms,
+            },
+        }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
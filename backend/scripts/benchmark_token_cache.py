@@ -0,0 +1,148 @@
+"""
+Firebase ID Token 검증 캐시(TokenCache) 유무에 따른 인증 처리량 비교
+
+verify_firebase_token 을 동시에 여러 번 호출해 초당 인증 수를 잽니다.
+    - uncached: 크기 0 캐시 → 요청마다 auth.verify_id_token (JWT 해석 + RS256 서명 검증)
+    - cached:   기본 TokenCache → 처음 한 번만 검증하고 이후는 메모리 조회
+
+토큰 준비 방법:
+    - 기본(자체 서명): 벤치마크용 RSA 키로 Firebase ID Token 과 같은 모양의 토큰을 만들고,
+      google-auth 의 공개키 조회가 그 인증서를 돌려주게 합니다. 공개키가 이미 캐시된 상태와 같으므로
+      uncached 수치는 서명 검증 비용만 포함한 하한입니다. (네트워크 / Firebase 프로젝트 불필요)
+    - --token: 실제 앱에서 받은 ID Token 으로 측정 (서비스 계정 키 필요, 공개키 조회 포함)
+서명 공개키의 백그라운드 갱신은 구현하지 않았으므로 측정 대상이 아닙니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.benchmark_token_cache --requests 2000 --concurrency 50
+    python -m scripts.benchmark_token_cache --token "$ID_TOKEN"
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import auth.middleware
+from auth.firebase_init import initialize_firebase
+from auth.middleware import TokenCache, verify_firebase_token
+
+BENCHMARK_PROJECT_ID = "uphill-benchmark"
+BENCHMARK_UID = "benchmark-token-cache"
+BENCHMARK_KEY_ID = "benchmark-key"
+
+
+def self_signed_token() -> str:
+    """벤치마크용 키로 서명한 ID Token 을 만들고, 검증 시 그 인증서를 쓰도록 설정합니다"""
+    import firebase_admin
+    import google.auth.credentials
+    import google.oauth2.id_token
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+    from firebase_admin import credentials
+    from google.auth import crypt, jwt
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, BENCHMARK_PROJECT_ID)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode("ascii")
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+    # 공개키 조회(https://www.googleapis.com/robot/v1/metadata/x509/...)가 벤치마크 인증서를 돌려줌
+    google.oauth2.id_token._fetch_certs = lambda request, certs_url: {BENCHMARK_KEY_ID: cert_pem}
+
+    class BenchmarkCredential(credentials.Base):
+        def get_credential(self):
+            return google.auth.credentials.AnonymousCredentials()
+
+    firebase_admin.initialize_app(BenchmarkCredential(), {"projectId": BENCHMARK_PROJECT_ID})
+
+    issued_at = int(time.time())
+    payload = {
+        "iss": f"https://securetoken.google.com/{BENCHMARK_PROJECT_ID}",
+        "aud": BENCHMARK_PROJECT_ID,
+        "auth_time": issued_at,
+        "iat": issued_at,
+        "exp": issued_at + 3600,
+        "sub": BENCHMARK_UID,
+        "user_id": BENCHMARK_UID,
+    }
+    signer = crypt.RSASigner.from_string(key_pem, key_id=BENCHMARK_KEY_ID)
+    return jwt.encode(signer, payload).decode("ascii")
+
+
+async def measure(authorization: str, requests: int, concurrency: int) -> dict:
+    """verify_firebase_token 을 동시 concurrency 개로 requests 번 호출합니다"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await verify_firebase_token(authorization)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "mean_us": round(elapsed / requests * 1_000_000, 1),
+    }
+
+
+async def run(token: str, requests: int, concurrency: int) -> dict:
+    authorization = f"Bearer {token}"
+    # 첫 검증 (firebase_admin.auth 불러오기 / 공개키 조회)
+    await verify_firebase_token(authorization)
+
+    results = {}
+    for mode, cache in (("uncached", TokenCache(max_size=0)), ("cached", TokenCache())):
+        auth.middleware.token_cache = cache
+        results[mode] = await measure(authorization, requests, concurrency)
+        results[mode]["cache"] = cache.stats()
+
+    results["speedup"] = round(
+        results["cached"]["requests_per_second"] / results["uncached"]["requests_per_second"], 1
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ID Token 검증 캐시 유무 처리량 비교")
+    parser.add_argument("--requests", type=int, default=2000, help="모드별 인증 횟수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--token", help="실제 Firebase ID Token (생략하면 자체 서명 토큰)")
+    args = parser.parse_args()
+
+    if args.token:
+        if initialize_firebase() is None:
+            raise SystemExit("--token 으로 측정하려면 Firebase 서비스 계정 키가 필요합니다")
+        token = args.token
+    else:
+        token = self_signed_token()
+
+    results = asyncio.run(run(token, args.requests, args.concurrency))
+    results["config"] = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "token": "real" if args.token else "self-signed",
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+OpenAI Chat Completions 호환 로컬 스텁 서버
+
+실제 OpenAI 없이 AI 피드백 경로(타임아웃, 재시도, 서킷 브레이커)를 확인할 때 사용합니다.
+
+사용법:
+    STUB_LATENCY_SECONDS=0.5 STUB_FAILURE_RATE=0.2 \\
+        uvicorn scripts.llm_stub_server:app --port 9000
+
+    # 백엔드 쪽
+    OPENAI_BASE_URL=http://localhost:9000/v1 OPENAI_API_KEY=stub uvicorn main:app
+"""
+import asyncio
+import json
+import os
+import random
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+# 응답 지연(초)과 500 오류 비율 (0.0 ~ 1.0)
+STUB_LATENCY_SECONDS = float(os.getenv("STUB_LATENCY_SECONDS", "0.3"))
+STUB_FAILURE_RATE = float(os.getenv("STUB_FAILURE_RATE", "0.0"))
+
+app = FastAPI()
+
+STUB_FEEDBACK = {
+    "short": "오늘도 잘 해냈어요!",
+    "full": "계획한 루틴을 꾸준히 이어가고 있네요. 내일은 가벼운 스트레칭으로 하루를 시작해보세요.",
+    "recommendations": ["5분 스트레칭", "물 마시기", "저녁 산책"],
+}
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+
+    await asyncio.sleep(STUB_LATENCY_SECONDS)
+    if random.random() < STUB_FAILURE_RATE:
+        raise HTTPException(status_code=500, detail="stub failure")
+
+    prompt_chars = sum(len(message.get("content", "")) for message in body.get("messages", []))
+    content = json.dumps(STUB_FEEDBACK, ensure_ascii=False)
+    usage = {
+        # 대략적인 토큰 수 (문자 4개 ≈ 1토큰)
+        "prompt_tokens": prompt_chars // 4,
+        "completion_tokens": len(content) // 4,
+        "total_tokens": (prompt_chars + len(content)) // 4,
+    }
+
+    if body.get("stream"):
+        return StreamingResponse(stream_chunks(body, content, usage), media_type="text/event-stream")
+
+    return {
+        "id": f"chatcmpl-stub-{int(time.time() * 1000)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": usage,
+    }
+
+
+async def stream_chunks(body: dict, content: str, usage: dict):
+    """stream=True 요청에 SSE 형식으로 몇 글자씩 나눠 응답합니다"""
+    base = {
+        "id": f"chatcmpl-stub-{int(time.time() * 1000)}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+    }
+
+    for i in range(0, len(content), 8):
+        chunk = {**base, "choices": [{"index": 0, "delta": {"content": content[i:i + 8]}, "finish_reason": None}]}
+        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        await asyncio.sleep(0.01)
+
+    yield f"data: {json.dumps({**base, 'choices': [], 'usage': usage})}\n\n"
+    yield "data: [DONE]\n\n"
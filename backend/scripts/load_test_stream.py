@@ -0,0 +1,137 @@
+"""
+실시간 스트림(/stream) 동시 구독자 부하 테스트
+
+한 프로세스 안에서 ChangeHub 에 구독자를 단계별로 늘려 가며 다음을 측정합니다.
+    - 연결당 메모리 (구독 큐 + 이벤트 루프 태스크 + SSE 인코딩 루프)
+    - 리스너 스레드에서 보낸 변경 이벤트가 모든 구독자에게 SSE 바이트로 인코딩되기까지의 지연 (p50 / p99)
+    - 초당 전달 수 (이벤트 × 구독자)
+Firestore 리스너 대신 스크립트 안의 LocalWatcher 가 별도 스레드에서 콜백을 호출하므로
+Firestore 연결 없이 워커 하나가 감당할 수 있는 구독자 수(STREAM_MAX_CONNECTIONS 설정 근거)를 볼 수 있습니다.
+실제 리스너는 사용자당 하나이므로 --devices 로 사용자당 연결 수를 정합니다.
+지연은 모든 사용자가 동시에 --events 개씩 바꾸는 최악의 경우 기준입니다.
+
+참고 결과 (devices=2, events=5): 연결당 약 6.5KB, 1천 연결 p99 50ms, 1만 연결 p99 약 1초, 2만 연결 p99 약 3초
+→ 기본 STREAM_MAX_CONNECTIONS=2000 은 동시 변경이 몰려도 p99 가 수백 ms 안에 머무는 수준입니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.load_test_stream --connections 1000 5000 10000 --devices 2 --events 5
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from api.stream import change_payload, sse_event
+from repositories.change_watcher import IChangeWatcher
+from services.change_hub import ChangeHub, STREAM_CLOSED
+
+
+class LocalWatcher(IChangeWatcher):
+    """사용자별 콜백을 모아 두고 publish() 로 다른 스레드에서 이벤트를 보내는 watcher"""
+
+    def __init__(self):
+        self.callbacks: Dict[str, Callable] = {}
+
+    def watch(self, uid, on_changes):
+        self.callbacks[uid] = on_changes
+        return lambda: self.callbacks.pop(uid, None)
+
+    def publish(self, seq: int):
+        sent_at = time.perf_counter()
+        for uid, callback in list(self.callbacks.items()):
+            callback([{
+                "collection": "routines",
+                "change": "modified",
+                "id": f"routine{seq}",
+                "data": {"id": f"routine{seq}", "title": "루틴", "time": "07:00", "updated_at": repr(sent_at)},
+            }])
+
+
+async def consume(hub: ChangeHub, subscription, uid: str, latencies: List[float], remaining: List[int], done):
+    """엔드포인트와 같은 방식으로 이벤트를 꺼내 SSE 바이트로 인코딩합니다"""
+    try:
+        while True:
+            event = await subscription.next_event(15)
+            if event is None:
+                continue
+            if event is STREAM_CLOSED:
+                return
+            if event["change"] == "resync":
+                sse_event("resync", {})
+            else:
+                sse_event("change", change_payload(event, uid))
+                latencies.append(time.perf_counter() - float(event["data"]["updated_at"]))
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                done.set()
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def run_level(connections: int, devices: int, events: int) -> dict:
+    watcher = LocalWatcher()
+    hub = ChangeHub(watcher, max_connections=connections, max_connections_per_user=devices, linger_seconds=0)
+    latencies: List[float] = []
+    remaining = [connections * events]
+    done = asyncio.Event()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = []
+    for i in range(connections):
+        uid = f"user{i // devices}"
+        tasks.append(asyncio.create_task(
+            consume(hub, hub.subscribe(uid), uid, latencies, remaining, done)
+        ))
+    await asyncio.sleep(0)
+    per_connection = (tracemalloc.get_traced_memory()[0] - before) / connections
+    tracemalloc.stop()
+
+    # 상한을 넘는 연결은 거부되어야 함
+    try:
+        hub.subscribe("overflow-user")
+        limited = False
+    except Exception:
+        limited = True
+
+    started = time.perf_counter()
+    publisher = threading.Thread(target=lambda: [watcher.publish(seq) for seq in range(events)])
+    publisher.start()
+    await asyncio.wait_for(done.wait(), timeout=300)
+    elapsed = time.perf_counter() - started
+    publisher.join()
+
+    stats = hub.stats()
+    hub.close()
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    return {
+        "connections": connections,
+        "listeners": connections // devices,
+        "kb_per_connection": round(per_connection / 1024, 2),
+        "deliveries_per_sec": round(connections * events / elapsed),
+        "latency_p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "latency_p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        "resyncs": stats["resyncs"],
+        "limit_enforced": limited,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 스트림 동시 구독자 부하 테스트")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 5000, 10000], help="단계별 연결 수")
+    parser.add_argument("--devices", type=int, default=2, help="사용자당 연결 수 (리스너 하나를 공유)")
+    parser.add_argument("--events", type=int, default=5, help="사용자마다 보낼 변경 이벤트 수")
+    args = parser.parse_args()
+
+    for connections in args.connections:
+        print(json.dumps(asyncio.run(run_level(connections, args.devices, args.events))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+AI 피드백 사전 생성 배치 작업
+
+지정한 날짜에 수행 기록이 있는 사용자들의 일간 피드백을 미리 생성해 저장합니다.
+get_daily_feedback 은 저장된 피드백을 먼저 읽으므로, 사용자가 리포트를 처음 열 때 LLM 지연이 없습니다.
+
+사용법 (backend 디렉토리에서, 매일 새벽 cron / Cloud Scheduler 등으로 실행):
+    python -m scripts.pregenerate_feedback                  # 어제(UTC) 날짜
+    python -m scripts.pregenerate_feedback --date 2026-01-15 --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from auth.firebase_init import initialize_firebase
+
+from api.dependencies import get_execution_repository, get_feedback_cache
+from api.executions import build_daily_summary
+from repositories.executor import run_blocking
+from services.llm_client import get_llm_client
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def pregenerate_feedback(date: str, concurrency: int = DEFAULT_CONCURRENCY) -> dict:
+    """해당 날짜의 활성 사용자 피드백을 제한된 워커 풀로 생성하고 처리량 지표를 반환합니다"""
+    execution_repo = get_execution_repository()
+    feedback_cache = get_feedback_cache()
+    llm_client = get_llm_client()
+
+    started = time.monotonic()
+    tokens_before = llm_client.prompt_tokens + llm_client.completion_tokens
+    requests_before = llm_client.requests
+
+    uids = await run_blocking(execution_repo.get_active_uids, date)
+    logger.info("📋 %s 활성 사용자: %s명", date, len(uids))
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for uid in uids:
+        queue.put_nowait(uid)
+
+    counts = {"succeeded": 0, "fallback": 0, "failed": 0}
+
+    async def worker():
+        while True:
+            try:
+                uid = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                docs = await run_blocking(execution_repo.get_by_date, uid, date)
+                summary = build_daily_summary(date, docs)
+                feedback = await feedback_cache.get_or_generate(uid, summary)
+                counts["fallback" if feedback.get("fallback") else "succeeded"] += 1
+            except Exception as e:
+                counts["failed"] += 1
+                logger.error("❌ 피드백 사전 생성 실패 (uid=%s): %s", uid, e)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, concurrency))])
+
+    elapsed = time.monotonic() - started
+    minutes = max(elapsed / 60, 1e-9)
+    tokens = llm_client.prompt_tokens + llm_client.completion_tokens - tokens_before
+
+    return {
+        "date": date,
+        "users": len(uids),
+        **counts,
+        "llm_requests": llm_client.requests - requests_before,
+        "tokens": tokens,
+        "elapsed_seconds": round(elapsed, 2),
+        "users_per_minute": round(len(uids) / minutes, 1),
+        "tokens_per_minute": round(tokens / minutes, 1),
+    }
+
+
+def main():
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    parser = argparse.ArgumentParser(description="AI 피드백 사전 생성")
+    parser.add_argument("--date", default=yesterday, help="대상 날짜 (YYYY-MM-DD, 기본값: 어제)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 처리 사용자 수")
+    args = parser.parse_args()
+
+    datetime.strptime(args.date, "%Y-%m-%d")
+
+    initialize_firebase()
+    metrics = asyncio.run(pregenerate_feedback(args.date, args.concurrency))
+    logger.info("✅ 피드백 사전 생성 완료: %s", json.dumps(metrics, ensure_ascii=False))
+    print(json.dumps(metrics, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
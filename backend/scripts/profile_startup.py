@@ -0,0 +1,76 @@
+"""
+앱 시작(import main) 시간 프로파일
+
+`python -X importtime -c "import main"` 을 새 프로세스에서 실행해 모듈별 누적 import 시간을 모으고,
+전체 시간과 가장 오래 걸린 모듈을 출력합니다. 전체 시간이 예산(--budget)을 넘으면 종료 코드 1 을 반환하므로
+무거운 의존성이 다시 import 시점으로 들어오는 것을 배포 전에 확인할 수 있습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m scripts.profile_startup
+    python -m scripts.profile_startup --budget 800 --top 15 --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# import main 에 허용하는 시간 (ms). 무거운 SDK 는 워밍업에서 불러오므로 대부분 fastapi 몫
+STARTUP_BUDGET_MS = int(os.getenv("STARTUP_BUDGET_MS", "1000"))
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_once() -> dict:
+    """새 프로세스에서 import main 을 실행하고 모듈별 누적 시간(µs)을 반환합니다"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import main 실패:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import main 시간 프로파일")
+    parser.add_argument("--budget", type=int, default=STARTUP_BUDGET_MS, help="허용 시간 (ms)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 최상위 모듈 수")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    runs = [profile_once() for _ in range(args.runs)]
+    total_ms = statistics.median(run["main"] for run in runs) / 1000
+
+    # 최상위 패키지(점 없는 이름) 기준으로 가장 오래 걸린 것만 보여 줌
+    last = runs[-1]
+    top = sorted(
+        ((name, us) for name, us in last.items() if "." not in name and name != "main"),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:args.top]
+
+    print(json.dumps({
+        "import_main_ms": round(total_ms, 1),
+        "budget_ms": args.budget,
+        "top_modules_ms": {name: round(us / 1000, 1) for name, us in top},
+    }, ensure_ascii=False, indent=2))
+
+    if total_ms > args.budget:
+        print(f"❌ 시작 시간 예산 초과: {total_ms:.1f}ms > {args.budget}ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
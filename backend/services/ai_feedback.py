@@ -1,114 +1,185 @@
-import os
 import json
 import logging
-from dotenv import load_dotenv
-from openai import OpenAI
+import re
+import time
+from typing import AsyncIterator, List, Tuple
 from api.schemas import DailySummaryResponse
-
-# 환경 변수 로드
-load_dotenv()
+from services.feedback_prompt import build_feedback_prompt
+from services.llm_client import get_llm_client
+from services.metrics import LLM_FEEDBACK_LATENCY
 
 logger = logging.getLogger(__name__)
 
-# OpenAI 클라이언트 초기화
-_openai_client = None
+SYSTEM_PROMPT = "당신은 친근하고 따뜻한 루틴 코치입니다. 항상 긍정적이고 격려하는 톤으로 말합니다. JSON 형식으로만 응답하세요."
+
+
+def parse_feedback(result_text: str) -> dict:
+    """모델 응답(JSON)을 피드백 딕셔너리로 변환합니다"""
+    result_text = result_text.strip()
+
+    # JSON 파싱 (```json 블록 제거)
+    if result_text.startswith("```"):
+        result_text = result_text.split("```")[1]
+        if result_text.startswith("json"):
+            result_text = result_text[4:]
+    result_text = result_text.strip()
 
+    feedback = json.loads(result_text)
 
-def get_openai_client() -> OpenAI:
-    """OpenAI 클라이언트를 반환합니다 (lazy initialization)"""
-    global _openai_client
-    if _openai_client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
-        _openai_client = OpenAI(api_key=api_key)
-    return _openai_client
+    return {
+        "short": feedback.get("short", "오늘도 수고했어요!"),
+        "full": feedback.get("full", "루틴을 꾸준히 수행하고 있네요. 계속 파이팅!"),
+        "recommendations": feedback.get("recommendations", ["스트레칭", "물 마시기", "명상"])
+    }
 
 
-def generate_ai_feedback(summary: DailySummaryResponse) -> dict:
+async def generate_ai_feedback(summary: DailySummaryResponse) -> dict:
     """
     OpenAI API를 사용하여 수행 기록 기반 AI 피드백을 생성합니다.
 
+    LLM 호출은 마감 시간, 동시성 제한, 재시도, 서킷 브레이커가 적용된 비동기 클라이언트를 거치며,
+    실패하거나 서킷이 열려 있으면 즉시 기본 피드백으로 대체합니다.
+
     Args:
         summary: 일간 수행 통계
 
     Returns:
         dict: short, full, recommendations 키를 가진 피드백 딕셔너리
     """
-    total_mins = summary.total_duration_seconds // 60
-    count = summary.total_routines
-
-    # 수행 기록 상세 정보 구성
-    executions_detail = []
-    for exec in summary.executions:
-        exec_mins = exec.duration_seconds // 60
-        executions_detail.append({
-            "title": exec.routine_title,
-            "started_at": exec.started_at,
-            "ended_at": exec.ended_at,
-            "duration_minutes": exec_mins
-        })
-
-    # OpenAI API 호출
+    started = time.perf_counter()
     try:
-        client = get_openai_client()
+        response = await get_llm_client().chat(
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_feedback_prompt(summary)}
+            ],
+            temperature=0.7,
+            max_tokens=500
+        )
 
-        prompt = f"""당신은 사용자의 일간 루틴 수행을 분석하고 따뜻하고 격려하는 피드백을 제공하는 AI 코치입니다.
+        feedback = parse_feedback(response.content)
 
-오늘 날짜: {summary.date}
-완료한 루틴 수: {count}개
-총 수행 시간: {total_mins}분
+        logger.debug("✅ OpenAI 피드백 생성 성공: %s", feedback['short'])
+        LLM_FEEDBACK_LATENCY.observe(time.perf_counter() - started, "chat", "ok")
 
-수행한 루틴 상세:
-{json.dumps(executions_detail, ensure_ascii=False, indent=2) if executions_detail else "없음"}
+        return feedback
 
-위 정보를 바탕으로 다음 JSON 형식으로 피드백을 작성해주세요:
-{{
-    "short": "한 줄 요약 피드백 (20자 이내, 핵심 메시지)",
-    "full": "상세 피드백 (2-3문장, 격려와 구체적인 조언 포함)",
-    "recommendations": ["추천 루틴 1", "추천 루틴 2", "추천 루틴 3"]
-}}
+    except Exception as e:
+        logger.error("❌ OpenAI API 호출 실패: %s", e)
+        LLM_FEEDBACK_LATENCY.observe(time.perf_counter() - started, "chat", "fallback")
+        # 폴백: 기본 피드백 반환 (캐시에 저장되지 않도록 표시)
+        feedback = generate_fallback_feedback(summary)
+        feedback["fallback"] = True
+        return feedback
 
-규칙:
-1. short는 감정을 담아 짧고 임팩트 있게 작성
-2. full은 오늘 수행한 루틴을 언급하며 구체적으로 격려
-3. recommendations는 수행한 루틴의 카테고리나 시간대를 고려하여 보완할 수 있는 루틴 추천
-4. 루틴이 없으면 시작하기 쉬운 간단한 루틴을 추천
-5. 반드시 유효한 JSON만 출력하세요."""
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+class FeedbackStreamParser:
+    """스트리밍 중인 JSON 응답에서 short / full 문자열 값을 점진적으로 꺼냅니다
+
+    short 는 값이 끝났을 때 한 번, full 은 도착하는 대로 조각 단위로 내보냅니다.
+    """
+
+    _FIELD_START = {
+        "short": re.compile(r'"short"\s*:\s*"'),
+        "full": re.compile(r'"full"\s*:\s*"'),
+    }
+
+    def __init__(self):
+        self.buffer = ""
+        # 필드 이름 -> 값 안에서 다음에 읽을 위치 (값 시작 전이면 None)
+        self._cursor = {"short": None, "full": None}
+        self._done = {"short": False, "full": False}
+        self._short_value = ""
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """응답 조각을 추가하고 ("short", 값) / ("full", 조각) 이벤트 목록을 반환합니다"""
+        self.buffer += chunk
+        events = []
+        for field in ("short", "full"):
+            if self._done[field]:
+                continue
+            if self._cursor[field] is None:
+                match = self._FIELD_START[field].search(self.buffer)
+                if match is None:
+                    continue
+                self._cursor[field] = match.end()
+
+            text, self._cursor[field], self._done[field] = self._read_string(self._cursor[field])
+            if field == "full":
+                if text:
+                    events.append(("full", text))
+            else:
+                self._short_value += text
+                if self._done["short"]:
+                    events.append(("short", self._short_value))
+        return events
+
+    def _read_string(self, pos: int) -> Tuple[str, int, bool]:
+        """pos 부터 JSON 문자열 값을 읽어 (디코딩된 텍스트, 다음 위치, 값 종료 여부)를 반환합니다"""
+        buffer = self.buffer
+        out = []
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                return "".join(out), pos + 1, True
+            if char == "\\":
+                # 이스케이프 시퀀스가 다 도착할 때까지 대기 (서로게이트 쌍은 12자)
+                length = 6 if buffer[pos + 1:pos + 2] == "u" else 2
+                if length == 6 and buffer[pos + 2:pos + 3].lower() == "d" and buffer[pos + 3:pos + 4].lower() in "89ab":
+                    length = 12
+                if pos + length > len(buffer):
+                    break
+                out.append(json.loads(f'"{buffer[pos:pos + length]}"'))
+                pos += length
+                continue
+            out.append(char)
+            pos += 1
+        return "".join(out), pos, False
+
+
+async def stream_ai_feedback(summary: DailySummaryResponse) -> AsyncIterator[Tuple[str, object]]:
+    """
+    AI 피드백을 스트리밍으로 생성합니다.
+
+    ("short", 문자열) → ("full", 조각)... → ("recommendations", 목록) 순으로 내보내고,
+    마지막에 ("feedback", 완성된 피드백 딕셔너리)를 내보냅니다.
+    도중에 실패하면 ("fallback", 기본 피드백)을 내보낸 뒤 ("feedback", 기본 피드백)으로 끝냅니다.
+    """
+    parser = FeedbackStreamParser()
+    short_sent = False
+    started = time.perf_counter()
+
+    try:
+        stream = get_llm_client().chat_stream(
             messages=[
-                {"role": "system", "content": "당신은 친근하고 따뜻한 루틴 코치입니다. 항상 긍정적이고 격려하는 톤으로 말합니다. JSON 형식으로만 응답하세요."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_feedback_prompt(summary)}
             ],
             temperature=0.7,
             max_tokens=500
         )
+        async for chunk in stream:
+            for event, value in parser.feed(chunk):
+                if event == "short":
+                    short_sent = True
+                yield event, value
 
-        result_text = response.choices[0].message.content.strip()
-
-        # JSON 파싱 (```json 블록 제거)
-        if result_text.startswith("```"):
-            result_text = result_text.split("```")[1]
-            if result_text.startswith("json"):
-                result_text = result_text[4:]
-        result_text = result_text.strip()
-
-        feedback = json.loads(result_text)
+        feedback = parse_feedback(parser.buffer)
+        if not short_sent:
+            yield "short", feedback["short"]
+        yield "recommendations", feedback["recommendations"]
 
-        logger.info(f"✅ OpenAI 피드백 생성 성공: {feedback['short']}")
-
-        return {
-            "short": feedback.get("short", "오늘도 수고했어요!"),
-            "full": feedback.get("full", "루틴을 꾸준히 수행하고 있네요. 계속 파이팅!"),
-            "recommendations": feedback.get("recommendations", ["스트레칭", "물 마시기", "명상"])
-        }
+        logger.debug("✅ OpenAI 피드백 스트리밍 성공: %s", feedback['short'])
+        LLM_FEEDBACK_LATENCY.observe(time.perf_counter() - started, "stream", "ok")
+        yield "feedback", feedback
 
     except Exception as e:
-        logger.error(f"❌ OpenAI API 호출 실패: {e}")
-        # 폴백: 기본 피드백 반환
-        return generate_fallback_feedback(summary)
+        logger.error("❌ OpenAI 스트리밍 실패: %s", e)
+        LLM_FEEDBACK_LATENCY.observe(time.perf_counter() - started, "stream", "fallback")
+        feedback = generate_fallback_feedback(summary)
+        feedback["fallback"] = True
+        yield "fallback", feedback
+        yield "feedback", feedback
 
 
 def generate_fallback_feedback(summary: DailySummaryResponse) -> dict:
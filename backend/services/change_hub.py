@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, List, Optional, Set
+
+from repositories.change_watcher import IChangeWatcher
+
+logger = logging.getLogger(__name__)
+
+# 워커(프로세스)당 동시 스트림 연결 수 상한
+STREAM_MAX_CONNECTIONS = int(os.getenv("STREAM_MAX_CONNECTIONS", "2000"))
+# 사용자당 동시 스트림 연결 수 상한 (기기 수 기준)
+STREAM_MAX_CONNECTIONS_PER_USER = int(os.getenv("STREAM_MAX_CONNECTIONS_PER_USER", "5"))
+# 구독자별로 쌓아 둘 수 있는 이벤트 수 (넘치면 비우고 resync 를 보냄)
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "100"))
+# 마지막 구독자가 나간 뒤 리스너를 유지하는 시간 (재연결마다 리스너를 다시 만들지 않도록)
+STREAM_WATCH_LINGER_SECONDS = float(os.getenv("STREAM_WATCH_LINGER_SECONDS", "30"))
+
+# 구독자가 놓친 이벤트가 있으니 GET /sync 로 다시 맞추라는 이벤트
+RESYNC_EVENT = {"collection": None, "change": "resync", "id": None, "data": None}
+# 허브가 닫혀 스트림을 끝내야 함을 알리는 표시
+STREAM_CLOSED = object()
+
+
+class StreamLimitError(Exception):
+    """연결 수 상한을 넘었을 때 발생 (per_user 면 사용자 상한, 아니면 워커 상한)"""
+
+    def __init__(self, message: str, per_user: bool):
+        super().__init__(message)
+        self.per_user = per_user
+
+
+class Subscription:
+    """스트림 연결 하나의 이벤트 큐
+
+    느린 구독자가 다른 구독자나 리스너를 막지 않도록 큐는 크기가 정해져 있으며,
+    가득 차면 쌓인 이벤트를 버리고 RESYNC_EVENT 하나만 남깁니다.
+    """
+
+    __slots__ = ("uid", "_queue")
+
+    def __init__(self, uid: str, queue_size: int):
+        self.uid = uid
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, event) -> bool:
+        """이벤트를 넣습니다 (이벤트 루프에서만 호출). 넘쳐서 resync 로 바뀌면 False"""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self._drain()
+            self._queue.put_nowait(event if event is STREAM_CLOSED else RESYNC_EVENT)
+            return False
+
+    def close(self):
+        self._drain()
+        self._queue.put_nowait(STREAM_CLOSED)
+
+    def _drain(self):
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def next_event(self, timeout: float):
+        """다음 이벤트 (timeout 안에 없으면 None, 허브가 닫히면 STREAM_CLOSED)"""
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _UserChannel:
+    """사용자 한 명의 공유 리스너와 구독자 목록"""
+
+    __slots__ = ("subscribers", "unsubscribe", "linger")
+
+    def __init__(self):
+        self.subscribers: Set[Subscription] = set()
+        self.unsubscribe: Optional[Callable[[], None]] = None
+        self.linger: Optional[asyncio.TimerHandle] = None
+
+
+class ChangeHub:
+    """사용자별 변경 리스너 하나를 여러 스트림 연결에 나눠 주는 허브
+
+    - 같은 사용자의 연결(여러 기기 / 탭)은 Firestore 리스너 하나를 공유합니다.
+    - 리스너 콜백은 Firestore 스레드에서 호출되므로 call_soon_threadsafe 로 이벤트 루프에 넘겨
+      구독자 큐에 넣습니다. 큐는 크기가 정해져 있어 느린 구독자는 resync 를 받습니다.
+    - 워커 / 사용자별 연결 수 상한을 넘으면 StreamLimitError 를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        watcher: IChangeWatcher,
+        max_connections: int = STREAM_MAX_CONNECTIONS,
+        max_connections_per_user: int = STREAM_MAX_CONNECTIONS_PER_USER,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        linger_seconds: float = STREAM_WATCH_LINGER_SECONDS,
+    ):
+        self.watcher = watcher
+        self.max_connections = max_connections
+        self.max_connections_per_user = max_connections_per_user
+        self.queue_size = queue_size
+        self.linger_seconds = linger_seconds
+        self._channels: Dict[str, _UserChannel] = {}
+        self._connections = 0
+        self.events = 0
+        self.resyncs = 0
+
+    def subscribe(self, uid: str) -> Subscription:
+        """uid 의 변경 스트림을 구독합니다 (이벤트 루프에서 호출)"""
+        if self._connections >= self.max_connections:
+            raise StreamLimitError("Too many stream connections on this worker", per_user=False)
+
+        channel = self._channels.get(uid)
+        if channel is not None and len(channel.subscribers) >= self.max_connections_per_user:
+            raise StreamLimitError("Too many stream connections for this user", per_user=True)
+
+        if channel is None:
+            channel = self._channels[uid] = _UserChannel()
+        if channel.linger is not None:
+            channel.linger.cancel()
+            channel.linger = None
+        if channel.unsubscribe is None:
+            loop = asyncio.get_running_loop()
+            try:
+                channel.unsubscribe = self.watcher.watch(
+                    uid, lambda events: loop.call_soon_threadsafe(self._publish, uid, events)
+                )
+            except Exception:
+                if not channel.subscribers:
+                    del self._channels[uid]
+                raise
+            logger.debug("👂 변경 리스너 시작 (users=%s)", len(self._channels))
+
+        subscription = Subscription(uid, self.queue_size)
+        channel.subscribers.add(subscription)
+        self._connections += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """연결이 끝난 구독을 정리합니다. 마지막 구독자면 잠시 뒤 리스너를 해제합니다"""
+        channel = self._channels.get(subscription.uid)
+        if channel is None or subscription not in channel.subscribers:
+            return
+        channel.subscribers.discard(subscription)
+        self._connections -= 1
+        if channel.subscribers:
+            return
+
+        if self.linger_seconds > 0:
+            channel.linger = asyncio.get_running_loop().call_later(
+                self.linger_seconds, self._release, subscription.uid
+            )
+        else:
+            self._release(subscription.uid)
+
+    def _release(self, uid: str):
+        channel = self._channels.get(uid)
+        if channel is None or channel.subscribers:
+            return
+        del self._channels[uid]
+        if channel.unsubscribe is not None:
+            channel.unsubscribe()
+        logger.debug("🔕 변경 리스너 해제 (users=%s)", len(self._channels))
+
+    def _publish(self, uid: str, events: List[dict]):
+        channel = self._channels.get(uid)
+        if channel is None:
+            return
+        self.events += len(events)
+        for subscription in channel.subscribers:
+            for event in events:
+                if not subscription.offer(event):
+                    self.resyncs += 1
+                    break
+
+    def close(self):
+        """모든 리스너를 해제하고 열린 스트림을 끝냅니다 (앱 종료 시 호출)"""
+        channels, self._channels = self._channels, {}
+        for channel in channels.values():
+            if channel.linger is not None:
+                channel.linger.cancel()
+            for subscription in channel.subscribers:
+                subscription.close()
+            if channel.unsubscribe is not None:
+                channel.unsubscribe()
+        self._connections = 0
+
+    def stats(self) -> dict:
+        return {
+            "connections": self._connections,
+            "users": len(self._channels),
+            "events": self.events,
+            "resyncs": self.resyncs,
+        }
@@ -0,0 +1,109 @@
+from datetime import date as date_cls
+from typing import Dict, Iterable, List, Tuple
+
+
+def compute_streaks(days: Iterable[str], until: str) -> Tuple[int, int]:
+    """수행일 목록에서 (현재 연속 일수, 최장 연속 일수)를 계산합니다
+
+    현재 연속 일수는 until 당일 또는 전날까지 이어지는 연속 수행일 수입니다.
+    """
+    ordinals = sorted({date_cls.fromisoformat(day).toordinal() for day in days})
+    if not ordinals:
+        return 0, 0
+
+    longest = run = 1
+    for prev, cur in zip(ordinals, ordinals[1:]):
+        run = run + 1 if cur == prev + 1 else 1
+        longest = max(longest, run)
+
+    until_ordinal = date_cls.fromisoformat(until).toordinal()
+    present = set(ordinals)
+    cursor = until_ordinal if until_ordinal in present else until_ordinal - 1
+    current = 0
+    while cursor in present:
+        current += 1
+        cursor -= 1
+
+    return current, longest
+
+
+def build_range_stats(rollups: List[dict], granularity: str, start: str, end: str, until: str) -> dict:
+    """집계 문서 목록을 기간별 통계와 루틴별 요약(연속 수행 포함)으로 합칩니다
+
+    Args:
+        rollups: start 순으로 정렬된 일/주/월 집계 문서
+        granularity: "day" | "week" | "month"
+        start, end: 기간 경계에 맞춘 조회 범위
+        until: 현재 연속 일수 계산 기준일 (요청한 종료일)
+    """
+    periods = []
+    routines: Dict[str, dict] = {}
+    total_routines = 0
+    total_duration = 0
+
+    for rollup in rollups:
+        period_routines = []
+        for routine_id, routine in rollup.get("routines", {}).items():
+            count = routine.get("count", 0)
+            duration = routine.get("duration_seconds", 0)
+            period_routines.append({
+                "routine_id": routine_id,
+                "routine_title": routine.get("routine_title", ""),
+                "count": count,
+                "duration_seconds": duration,
+            })
+
+            summary = routines.setdefault(routine_id, {
+                "routine_id": routine_id,
+                "routine_title": routine.get("routine_title", ""),
+                "count": 0,
+                "duration_seconds": 0,
+                "days": set(),
+            })
+            summary["routine_title"] = routine.get("routine_title", summary["routine_title"])
+            summary["count"] += count
+            summary["duration_seconds"] += duration
+            if granularity == "day":
+                summary["days"].add(rollup["start"])
+            else:
+                summary["days"].update(routine.get("days", []))
+
+        period_routines.sort(key=lambda x: x["duration_seconds"], reverse=True)
+        periods.append({
+            "period": rollup.get("period", rollup["start"]),
+            "start": rollup["start"],
+            "end": rollup.get("end", rollup["start"]),
+            "total_routines": rollup.get("total_routines", 0),
+            "total_duration_seconds": rollup.get("total_duration_seconds", 0),
+            "routines": period_routines,
+        })
+        total_routines += rollup.get("total_routines", 0)
+        total_duration += rollup.get("total_duration_seconds", 0)
+
+    routine_summaries = []
+    for summary in routines.values():
+        days = [day for day in summary.pop("days") if start <= day <= end]
+        current_streak, longest_streak = compute_streaks(days, until)
+        routine_summaries.append({
+            **summary,
+            "active_days": len(days),
+            "current_streak": current_streak,
+            "longest_streak": longest_streak,
+        })
+    routine_summaries.sort(key=lambda x: x["duration_seconds"], reverse=True)
+
+    return {
+        "granularity": granularity,
+        "start": start,
+        "end": end,
+        "total_routines": total_routines,
+        "total_duration_seconds": total_duration,
+        "periods": periods,
+        "routines": routine_summaries,
+    }
+
+
+def days_between(start: str, end: str) -> int:
+    """두 날짜(YYYY-MM-DD) 사이의 일수 (양 끝 포함)"""
+    return (date_cls.fromisoformat(end) - date_cls.fromisoformat(start)).days + 1
+
@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+from api.schemas import DailySummaryResponse
+from repositories.executor import run_blocking
+from repositories.feedback_repository import IFeedbackRepository
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK_CACHE_MAX_ENTRIES = int(os.getenv("FEEDBACK_CACHE_MAX_ENTRIES", "10000"))
+
+FeedbackGenerator = Callable[[DailySummaryResponse], Awaitable[dict]]
+
+
+def summary_hash(summary: DailySummaryResponse) -> str:
+    """일간 통계 내용의 해시 (수행 기록이 바뀌면 달라짐)"""
+    payload = summary.model_dump()
+    payload["executions"] = sorted(payload["executions"], key=lambda x: x["id"])
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class FeedbackCache:
+    """(uid, 날짜, 통계 해시) 단위 AI 피드백 캐시
+
+    - 메모리(LRU) → 영구 저장소 → 생성 순으로 조회합니다.
+    - 같은 키에 대한 동시 요청은 하나의 생성 작업을 공유합니다 (single-flight).
+    - 수행 기록이 추가되면 해시가 바뀌므로 이전 피드백은 자연히 무효화되며,
+      invalidate() 로 메모리 항목을 즉시 비울 수도 있습니다.
+    """
+
+    def __init__(
+        self,
+        repository: IFeedbackRepository,
+        generate: FeedbackGenerator,
+        max_entries: int = FEEDBACK_CACHE_MAX_ENTRIES,
+    ):
+        self.repository = repository
+        self.generate = generate
+        self.max_entries = max_entries
+        # (uid, date) -> (summary_hash, feedback)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get_memory(self, uid: str, date: str, content_hash: str) -> Optional[dict]:
+        entry = self._entries.get((uid, date))
+        if entry is None or entry[0] != content_hash:
+            return None
+        self._entries.move_to_end((uid, date))
+        return entry[1]
+
+    def _put_memory(self, uid: str, date: str, content_hash: str, feedback: dict):
+        self._entries[(uid, date)] = (content_hash, feedback)
+        self._entries.move_to_end((uid, date))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, uid: str, date: str):
+        """해당 날짜의 메모리 캐시를 비웁니다 (새 수행 기록 저장 시 호출)"""
+        self._entries.pop((uid, date), None)
+
+    async def get_or_generate(self, uid: str, summary: DailySummaryResponse) -> dict:
+        """캐시된 피드백을 반환하거나, 없으면 한 번만 생성해 저장합니다"""
+        content_hash = summary_hash(summary)
+
+        feedback = self._get_memory(uid, summary.date, content_hash)
+        if feedback is not None:
+            self.hits += 1
+            return feedback
+
+        key = (uid, summary.date, content_hash)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            feedback = await self._load_or_generate(uid, summary, content_hash)
+            future.set_result(feedback)
+            return feedback
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 호출자가 없으면 예외가 기록되지 않은 채 남지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get_cached(self, uid: str, summary: DailySummaryResponse) -> Optional[dict]:
+        """메모리 또는 영구 저장소에 있는 같은 통계의 피드백을 반환합니다 (없으면 None)"""
+        content_hash = summary_hash(summary)
+
+        feedback = self._get_memory(uid, summary.date, content_hash)
+        if feedback is not None:
+            return feedback
+
+        return await self._load(uid, summary.date, content_hash)
+
+    async def store(self, uid: str, summary: DailySummaryResponse, feedback: dict):
+        """생성한 피드백을 메모리와 영구 저장소에 저장합니다 (폴백 피드백은 저장하지 않음)"""
+        if feedback.get("fallback"):
+            return
+
+        content_hash = summary_hash(summary)
+        self._put_memory(uid, summary.date, content_hash, feedback)
+        await run_blocking(self.repository.save, uid, summary.date, {
+            **feedback,
+            "summary_hash": content_hash,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    async def _load(self, uid: str, date: str, content_hash: str) -> Optional[dict]:
+        stored = await run_blocking(self.repository.get, uid, date)
+        if stored is None or stored.get("summary_hash") != content_hash:
+            return None
+
+        feedback = {
+            "short": stored["short"],
+            "full": stored["full"],
+            "recommendations": stored.get("recommendations", []),
+        }
+        self._put_memory(uid, date, content_hash, feedback)
+        return feedback
+
+    async def _load_or_generate(self, uid: str, summary: DailySummaryResponse, content_hash: str) -> dict:
+        feedback = await self._load(uid, summary.date, content_hash)
+        if feedback is not None:
+            return feedback
+
+        feedback = await self.generate(summary)
+
+        # 폴백 피드백은 저장하지 않고 다음 요청에서 다시 생성을 시도
+        await self.store(uid, summary, feedback)
+        return feedback
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
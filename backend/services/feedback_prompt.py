@@ -0,0 +1,112 @@
+import math
+import os
+from datetime import datetime
+from typing import List
+
+from api.schemas import DailySummaryResponse
+
+# 사용자 프롬프트에 허용하는 최대 토큰 수 (추정치 기준)
+FEEDBACK_PROMPT_TOKEN_BUDGET = int(os.getenv("FEEDBACK_PROMPT_TOKEN_BUDGET", "600"))
+# 루틴 한 줄에 적는 수행 시각 수 (나머지는 "외 N회" 로 줄임)
+MAX_TIMES_PER_ROUTINE = 4
+
+PROMPT_HEADER = "사용자의 하루 루틴 수행 기록입니다. 따뜻하게 격려하는 코치로서 피드백하세요."
+
+PROMPT_FOOTER = """다음 JSON만 출력:
+{"short": "20자 이내 한 줄 요약", "full": "수행한 루틴을 언급하며 격려와 조언 2-3문장", "recommendations": ["추천 루틴", "추천 루틴", "추천 루틴"]}
+추천은 수행한 루틴의 종류와 시간대를 보완하도록, 기록이 없으면 시작하기 쉬운 루틴으로."""
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수를 보수적으로 추정합니다
+
+    ASCII 는 약 4글자당 1토큰, 한글 등 그 밖의 문자는 글자당 1토큰으로 셉니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _clock(value: str) -> str:
+    """ISO 시각 문자열을 HH:MM 으로 줄입니다 (해석할 수 없으면 빈 문자열)"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%H:%M")
+    except (AttributeError, ValueError):
+        return ""
+
+
+def _routine_lines(summary: DailySummaryResponse) -> List[tuple]:
+    """루틴별로 묶은 (정렬 키, 한 줄 요약, 시각을 뺀 요약, 분) 목록을 수행 시간이 긴 순서로 반환합니다"""
+    routines = {}
+    for execution in summary.executions:
+        routine = routines.setdefault(execution.routine_id, {
+            "title": execution.routine_title,
+            "count": 0,
+            "seconds": 0,
+            "times": [],
+        })
+        routine["count"] += 1
+        routine["seconds"] += execution.duration_seconds
+        start = _clock(execution.started_at)
+        if start:
+            end = _clock(execution.ended_at)
+            routine["times"].append(f"{start}-{end}" if end else start)
+
+    lines = []
+    for routine_id, routine in routines.items():
+        mins = routine["seconds"] // 60
+        short_line = f"- {routine['title']}: {routine['count']}회 {mins}분"
+        line = short_line
+        if routine["times"]:
+            times = sorted(routine["times"])
+            shown = ", ".join(times[:MAX_TIMES_PER_ROUTINE])
+            if len(times) > MAX_TIMES_PER_ROUTINE:
+                shown += f" 외 {len(times) - MAX_TIMES_PER_ROUTINE}회"
+            line += f" ({shown})"
+        # 수행 시간 내림차순 → 제목 → id 순으로 정렬해 잘라내는 결과가 항상 같도록 함
+        lines.append(((-routine["seconds"], routine["title"], routine_id), line, short_line, mins))
+
+    lines.sort(key=lambda item: item[0])
+    return lines
+
+
+def _omitted_line(omitted: List[tuple]) -> str:
+    return f"- 외 {len(omitted)}개 루틴 {sum(item[-1] for item in omitted)}분"
+
+
+def build_feedback_prompt(summary: DailySummaryResponse, token_budget: int = FEEDBACK_PROMPT_TOKEN_BUDGET) -> str:
+    """일간 통계로 피드백 요청 프롬프트를 만듭니다
+
+    수행 기록을 루틴별로 묶고 시각은 HH:MM 으로만 적습니다.
+    예산을 넘으면 시각을 빼고, 그래도 넘으면 수행 시간이 짧은 루틴부터 빼고 "외 N개" 한 줄로 합칩니다.
+    """
+    total_mins = summary.total_duration_seconds // 60
+    head = (
+        f"{PROMPT_HEADER}\n"
+        f"날짜: {summary.date} / 완료 {summary.total_routines}개 / 총 {total_mins}분\n"
+        f"루틴별 (횟수, 시간, 시각):"
+    )
+
+    lines = _routine_lines(summary)
+    if not lines:
+        return f"{head}\n없음\n{PROMPT_FOOTER}"
+
+    used = estimate_tokens(head) + estimate_tokens(PROMPT_FOOTER) + 2
+    included = []
+    for index, (_, line, short_line, _) in enumerate(lines):
+        rest = lines[index + 1:]
+        # 뒤에 남는 루틴이 있으면 "외 N개" 줄이 들어갈 자리를 남겨 둠
+        reserve = estimate_tokens(_omitted_line(rest)) + 1 if rest else 0
+        if used + estimate_tokens(line) + 1 + reserve > token_budget:
+            line = short_line
+        cost = estimate_tokens(line) + 1
+        if used + cost + reserve > token_budget:
+            break
+        included.append(line)
+        used += cost
+
+    omitted = lines[len(included):]
+    if omitted:
+        included.append(_omitted_line(omitted))
+
+    body = "\n".join(included)
+    return f"{head}\n{body}\n{PROMPT_FOOTER}"
@@ -0,0 +1,55 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+IDEMPOTENCY_CACHE_MAX_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_MAX_SIZE", "10000"))
+# 모바일 재시도는 보통 수 초 ~ 수 분 안에 오므로 짧게 유지 (이후 재시도는 create 전제조건이 처리)
+IDEMPOTENCY_CACHE_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_CACHE_TTL_SECONDS", "600"))
+
+
+class IdempotencyCache:
+    """(uid, 수행 기록 ID) 단위로 최근 생성 응답을 보관하는 LRU + TTL 캐시
+
+    같은 요청이 다시 오면 Firestore 를 거치지 않고 메모리 조회 한 번으로 처음 응답을 돌려줍니다.
+    """
+
+    def __init__(self, max_size: int = IDEMPOTENCY_CACHE_MAX_SIZE, ttl_seconds: int = IDEMPOTENCY_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, uid: str, execution_id: str) -> Optional[dict]:
+        """캐시된 수행 기록을 반환합니다 (없거나 만료되었으면 None)"""
+        key = (uid, execution_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        execution, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return execution
+
+    def put(self, uid: str, execution_id: str, execution: dict):
+        """저장된 수행 기록을 캐시에 넣습니다"""
+        key = (uid, execution_id)
+        self._entries[key] = (execution, time.time() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
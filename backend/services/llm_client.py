@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# 환경 변수 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
+# 한 번의 호출(재시도 포함)에 허용하는 전체 시간과 시도별 시간 (초)
+LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "20"))
+LLM_ATTEMPT_TIMEOUT_SECONDS = float(os.getenv("LLM_ATTEMPT_TIMEOUT_SECONDS", "10"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_RETRY_BASE_DELAY_SECONDS = float(os.getenv("LLM_RETRY_BASE_DELAY_SECONDS", "0.5"))
+# 프로세스 전체에서 동시에 진행 중인 LLM 요청 수 상한
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+# 연속 실패가 임계치를 넘으면 일정 시간 동안 호출하지 않고 바로 폴백
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+
+
+
+@lru_cache(maxsize=None)
+def retryable_errors() -> tuple:
+    """일시적인 장애로 보고 재시도하는 예외 (openai SDK 는 무거우므로 처음 필요할 때 불러옴)"""
+    import openai
+
+    return (
+        asyncio.TimeoutError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+class LLMUnavailableError(Exception):
+    """LLM 업스트림을 사용할 수 없음 (서킷 오픈, 마감 시간 초과, 재시도 소진)"""
+
+
+@dataclass
+class LLMResponse:
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커
+
+    closed → (연속 실패 >= 임계치) → open → (reset_seconds 경과) → half-open
+    half-open 에서는 한 번의 시험 호출만 허용하고, 성공하면 closed 로 돌아갑니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = LLM_BREAKER_RESET_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def abort_probe(self):
+        self._probing = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._probing:
+                logger.warning("⚠️ LLM 서킷 오픈 (연속 실패 %s회)", self.failures)
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class LLMClient:
+    """마감 시간, 동시성 제한, 지터 재시도, 서킷 브레이커를 갖춘 비동기 LLM 클라이언트"""
+
+    def __init__(
+        self,
+        model: str = LLM_MODEL,
+        deadline_seconds: float = LLM_DEADLINE_SECONDS,
+        attempt_timeout_seconds: float = LLM_ATTEMPT_TIMEOUT_SECONDS,
+        max_retries: int = LLM_MAX_RETRIES,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.model = model
+        self.deadline_seconds = deadline_seconds
+        self.attempt_timeout_seconds = attempt_timeout_seconds
+        self.max_retries = max_retries
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional["AsyncOpenAI"] = None
+        # 누적 사용량 (배치 작업 처리량 측정용)
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def _get_client(self) -> "AsyncOpenAI":
+        """OpenAI 비동기 클라이언트를 반환합니다 (lazy initialization)
+
+        OPENAI_BASE_URL 을 지정하면 로컬 스텁 서버(scripts/llm_stub_server.py) 등으로 보낼 수 있습니다.
+        """
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
+            self._client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=os.getenv("OPENAI_BASE_URL") or None,
+                # 재시도와 타임아웃은 이 클래스에서 직접 관리
+                max_retries=0,
+                timeout=self.attempt_timeout_seconds,
+            )
+        return self._client
+
+    async def _acquire_slot(self, deadline: float):
+        """마감 시간 안에 동시 요청 자리를 얻습니다
+
+        자리를 기다리다 마감 시간을 넘긴 것은 프로세스 안의 과부하이지 업스트림 장애가 아니므로,
+        재시도하지 않고 서킷 브레이커에도 실패로 세지 않습니다.
+
+        Raises:
+            LLMUnavailableError: 마감 시간 안에 자리를 얻지 못한 경우
+        """
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=remaining)
+        except asyncio.TimeoutError:
+            self.breaker.abort_probe()
+            logger.warning("⚠️ LLM 동시 요청 대기 시간 초과")
+            raise LLMUnavailableError("LLM concurrency limit reached before deadline") from None
+        except asyncio.CancelledError:
+            self.breaker.abort_probe()
+            raise
+
+    async def chat(self, messages: List[dict], temperature: float = 0.7, max_tokens: int = 500) -> LLMResponse:
+        """채팅 완성을 요청합니다
+
+        Raises:
+            LLMUnavailableError: 서킷이 열려 있거나 마감 시간/재시도 한도를 넘긴 경우
+        """
+        client = self._get_client()
+        if not self.breaker.allow():
+            raise LLMUnavailableError("LLM circuit is open")
+
+        deadline = time.monotonic() + self.deadline_seconds
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(self.max_retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await self._acquire_slot(deadline)
+            try:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=min(self.attempt_timeout_seconds, max(0.0, deadline - time.monotonic())),
+                )
+            except asyncio.CancelledError:
+                # 요청이 취소되면 시험 호출 자격만 반납하고 실패로 세지 않음
+                self.breaker.abort_probe()
+                raise
+            except retryable_errors() as e:
+                last_error = e
+                logger.warning("⚠️ LLM 호출 실패 (시도 %s/%s): %r", attempt + 1, self.max_retries + 1, e)
+                if attempt < self.max_retries:
+                    # 지수 백오프 + full jitter
+                    delay = random.uniform(0, LLM_RETRY_BASE_DELAY_SECONDS * (2 ** attempt))
+                    await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                continue
+            except Exception:
+                # 인증 오류 등 재시도해도 소용없는 오류
+                self.breaker.record_failure()
+                raise
+            finally:
+                self._semaphore.release()
+
+            self.breaker.record_success()
+            usage = response.usage
+            result = LLMResponse(
+                content=response.choices[0].message.content or "",
+                prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+                completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            )
+            self.requests += 1
+            self.prompt_tokens += result.prompt_tokens
+            self.completion_tokens += result.completion_tokens
+            return result
+
+        self.breaker.record_failure()
+        raise LLMUnavailableError(f"LLM call failed after retries: {last_error!r}")
+
+    async def chat_stream(self, messages: List[dict], temperature: float = 0.7, max_tokens: int = 500) -> AsyncIterator[str]:
+        """채팅 완성을 스트리밍으로 요청하고 텍스트 조각을 순서대로 내보냅니다
+
+        이미 일부를 내보낸 뒤에는 재시도할 수 없으므로 재시도 없이 한 번만 시도하며,
+        조각 사이 대기 시간과 전체 마감 시간을 모두 적용합니다.
+
+        Raises:
+            LLMUnavailableError: 서킷이 열려 있거나 시간 초과/일시적 장애가 발생한 경우
+        """
+        client = self._get_client()
+        if not self.breaker.allow():
+            raise LLMUnavailableError("LLM circuit is open")
+
+        deadline = time.monotonic() + self.deadline_seconds
+        stream = None
+        usage = None
+
+        def next_timeout() -> float:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            return min(self.attempt_timeout_seconds, remaining)
+
+        await self._acquire_slot(deadline)
+        try:
+            stream = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                ),
+                timeout=next_timeout(),
+            )
+            chunks = stream.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=next_timeout())
+                except StopAsyncIteration:
+                    break
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트가 연결을 끊은 경우: 실패로 세지 않음
+            self.breaker.abort_probe()
+            raise
+        except retryable_errors() as e:
+            self.breaker.record_failure()
+            raise LLMUnavailableError(f"LLM stream failed: {e!r}") from e
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            try:
+                if stream is not None:
+                    await stream.close()
+            finally:
+                self._semaphore.release()
+
+        self.breaker.record_success()
+        self.requests += 1
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+
+# 프로세스 단위 공유 클라이언트
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """공유 LLM 클라이언트를 반환합니다 (lazy initialization)"""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
@@ -0,0 +1,237 @@
+import functools
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Prometheus 기본값과 같은 지연 시간 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """라벨 값 조합별로 값을 보관하는 지표 (Prometheus 텍스트 형식으로 출력)"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가하는 누적 값"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def set_total(self, *labels: str, value: float):
+        """다른 곳에서 이미 누적한 값을 그대로 옮겨 옵니다 (수집 훅에서 사용)"""
+        with self._lock:
+            self._values[labels] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self._header()
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """현재 값 (늘거나 줄 수 있음)"""
+
+    type = "gauge"
+
+    def set(self, *labels: str, value: float):
+        self.set_total(*labels, value=value)
+
+
+class Histogram(_Metric):
+    """버킷별 관측 횟수와 합계를 보관하는 분포
+
+    관측은 이분 탐색으로 버킷 하나만 올리고, 누적 합은 출력할 때 계산합니다.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 조합 -> [버킷별 횟수..., +Inf 횟수], 합계
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items())
+        lines = self._header()
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+            label_str = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 목록과 수집 훅 (수집 훅은 출력 직전에 캐시 통계 등을 지표로 옮김)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collect_hooks: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def on_collect(self, hook: Callable[[], None]):
+        self._collect_hooks.append(hook)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 모든 지표를 출력합니다"""
+        for hook in self._collect_hooks:
+            hook()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "uphill_http_request_duration_seconds",
+    "HTTP request latency by route template (streaming responses: time to response start)",
+    ("method", "route", "status"),
+))
+TOKEN_VERIFY_LATENCY = REGISTRY.register(Histogram(
+    "uphill_token_verify_duration_seconds",
+    "Firebase ID token verification latency (cache misses only)",
+    ("outcome",),
+))
+FIRESTORE_LATENCY = REGISTRY.register(Histogram(
+    "uphill_firestore_operation_duration_seconds",
+    "Firestore repository operation latency (one or more RPCs)",
+    ("operation", "outcome"),
+))
+LLM_FEEDBACK_LATENCY = REGISTRY.register(Histogram(
+    "uphill_llm_feedback_duration_seconds",
+    "AI feedback generation latency",
+    ("mode", "outcome"),
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0),
+))
+LLM_REQUESTS = REGISTRY.register(Counter(
+    "uphill_llm_requests_total",
+    "Successful LLM requests",
+))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "uphill_llm_tokens_total",
+    "LLM tokens used",
+    ("type",),
+))
+LLM_CIRCUIT_OPEN = REGISTRY.register(Gauge(
+    "uphill_llm_circuit_open",
+    "1 if the LLM circuit breaker is open or half-open",
+))
+CACHE_HITS = REGISTRY.register(Counter(
+    "uphill_cache_hits_total",
+    "In-process cache hits",
+    ("cache",),
+))
+CACHE_MISSES = REGISTRY.register(Counter(
+    "uphill_cache_misses_total",
+    "In-process cache misses",
+    ("cache",),
+))
+CACHE_ENTRIES = REGISTRY.register(Gauge(
+    "uphill_cache_entries",
+    "Entries currently held by an in-process cache",
+    ("cache",),
+))
+STREAM_CONNECTIONS = REGISTRY.register(Gauge(
+    "uphill_stream_connections",
+    "Open /stream connections on this worker",
+))
+STREAM_LISTENERS = REGISTRY.register(Gauge(
+    "uphill_stream_listeners",
+    "Users with a shared change listener on this worker",
+))
+STREAM_EVENTS = REGISTRY.register(Counter(
+    "uphill_stream_events_total",
+    "Change events received from snapshot listeners",
+))
+STREAM_RESYNCS = REGISTRY.register(Counter(
+    "uphill_stream_resyncs_total",
+    "Times a slow subscriber's queue overflowed and was told to resync",
+))
+
+
+def timed_firestore(operation: str) -> Callable:
+    """Firestore 저장소 메서드의 지연 시간을 operation 라벨로 기록하는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                FIRESTORE_LATENCY.observe(time.perf_counter() - started, operation, outcome)
+        return wrapper
+    return decorator
@@ -0,0 +1,162 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from services.timetable import DAY_MINUTES, WEEK_MINUTES, DEFAULT_ROUTINE_DURATION_MINUTES, parse_minutes, format_minutes
+
+
+@dataclass
+class RoutineShift:
+    routine_id: str
+    title: str
+    from_time: str
+    to_time: str
+    shift_minutes: int
+
+
+@dataclass
+class ReschedulePlan:
+    changes: List[RoutineShift] = field(default_factory=list)
+    unresolved: List[str] = field(default_factory=list)
+    conflicts_before: int = 0
+    conflicts_after: int = 0
+
+
+class _WeekIntervals:
+    """이미 배치한 구간 [start, end) 를 시작/끝 시각 정렬 배열로 보관 (주 단위 반복)
+
+    [a, b) 와 겹치는 구간 수 = (start < b 인 구간 수) - (end <= a 인 구간 수) 이므로
+    겹침 여부와 개수는 이분 탐색 두 번(O(log n))으로 구합니다.
+    """
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._intervals: List[tuple] = []
+        self._max_length = 0
+
+    def add(self, start: int, end: int):
+        insort(self._starts, start)
+        insort(self._ends, end)
+        insort(self._intervals, (start, end))
+        self._max_length = max(self._max_length, end - start)
+
+    def count(self, start: int, end: int) -> int:
+        total = 0
+        for shift in (-WEEK_MINUTES, 0, WEEK_MINUTES):
+            total += bisect_left(self._starts, end + shift) - bisect_right(self._ends, start + shift)
+        return total
+
+    def overlapping(self, start: int, end: int) -> List[tuple]:
+        found = []
+        for shift in (-WEEK_MINUTES, 0, WEEK_MINUTES):
+            lo = bisect_right(self._intervals, (start + shift - self._max_length, WEEK_MINUTES * 2))
+            hi = bisect_left(self._intervals, (end + shift, -1))
+            found.extend(
+                (s - shift, e - shift) for s, e in self._intervals[lo:hi] if e > start + shift
+            )
+        return found
+
+
+def _placements(routine: dict, start: int) -> List[tuple]:
+    duration = routine["duration"]
+    return [(day * DAY_MINUTES + start, day * DAY_MINUTES + start + duration) for day in routine["days"]]
+
+
+def _count_conflicts(routines: List[dict], starts: Dict[str, int]) -> int:
+    """서로 겹치는 (루틴, 루틴, 요일) 칸 쌍의 수"""
+    placed = _WeekIntervals()
+    conflicts = 0
+    for routine in routines:
+        for start, end in _placements(routine, starts[routine["id"]]):
+            conflicts += placed.count(start, end)
+            placed.add(start, end)
+    return conflicts
+
+
+def plan_reschedule(routines: List[dict]) -> ReschedulePlan:
+    """겹치는 루틴을 가능한 한 적게 옮기는 재배치 계획을 계산합니다 (그리디)
+
+    - 유연성(flexibility_minutes)이 작은 루틴, 먼저 만든 루틴 순으로 자리를 확정합니다.
+    - 각 루틴은 자기 요일 전체에서 겹치지 않는, 원래 시각과 가장 가까운 시각으로 옮깁니다.
+      후보는 원래 시각과 주변 칸의 경계(앞 칸 끝 / 뒤 칸 시작 - 소요 시간)뿐이며,
+      |이동량| <= 유연성이고 같은 날(00:00 ~ 23:59) 안에 시작해야 합니다.
+    - 자리를 찾지 못한 루틴은 원래 시각에 두고 unresolved 에 담습니다.
+
+    배치된 구간은 정렬 배열로 관리해 겹침 확인이 O(log n) 입니다.
+    """
+    prepared = []
+    for routine in routines:
+        start = parse_minutes(routine.get("time", ""))
+        days = sorted({day for day in routine.get("days") or [] if 0 <= day < 7})
+        if start is None or not days:
+            continue
+        prepared.append({
+            "id": routine["id"],
+            "title": routine.get("title", ""),
+            "start": start,
+            "days": days,
+            "duration": routine.get("duration_minutes") or DEFAULT_ROUTINE_DURATION_MINUTES,
+            "flexibility": routine.get("flexibility_minutes") or 0,
+            "created_at": str(routine.get("created_at", "")),
+        })
+
+    prepared.sort(key=lambda r: (r["flexibility"], r["created_at"], r["start"], r["id"]))
+
+    plan = ReschedulePlan()
+    plan.conflicts_before = _count_conflicts(prepared, {r["id"]: r["start"] for r in prepared})
+
+    placed = _WeekIntervals()
+    new_starts: Dict[str, int] = {}
+
+    for routine in prepared:
+        chosen = _find_slot(routine, placed)
+        if chosen is None:
+            chosen = routine["start"]
+            plan.unresolved.append(routine["id"])
+
+        new_starts[routine["id"]] = chosen
+        for start, end in _placements(routine, chosen):
+            placed.add(start, end)
+
+        if chosen != routine["start"]:
+            plan.changes.append(RoutineShift(
+                routine_id=routine["id"],
+                title=routine["title"],
+                from_time=format_minutes(routine["start"]),
+                to_time=format_minutes(chosen),
+                shift_minutes=chosen - routine["start"],
+            ))
+
+    plan.conflicts_after = _count_conflicts(prepared, new_starts)
+    plan.changes.sort(key=lambda change: change.routine_id)
+    return plan
+
+
+def _find_slot(routine: dict, placed: _WeekIntervals) -> Optional[int]:
+    """원래 시각에서 가장 적게 움직여 모든 요일에서 비는 시작 시각 (없으면 None)"""
+    original, duration, flexibility = routine["start"], routine["duration"], routine["flexibility"]
+
+    def fits(start: int) -> bool:
+        return all(placed.count(s, e) == 0 for s, e in _placements(routine, start))
+
+    if fits(original):
+        return original
+    if flexibility <= 0:
+        return None
+
+    # 유연성 범위 안에 있는 칸들의 경계가 최소 이동 후보
+    candidates = set()
+    for day in routine["days"]:
+        base = day * DAY_MINUTES + original
+        for start, end in placed.overlapping(base - flexibility - duration, base + flexibility + duration):
+            candidates.add(end - base)
+            candidates.add(start - duration - base)
+
+    lowest, highest = -original, DAY_MINUTES - 1 - original
+    for shift in sorted(candidates, key=lambda d: (abs(d), d)):
+        if abs(shift) > flexibility or not lowest <= shift <= highest:
+            continue
+        if fits(original + shift):
+            return original + shift
+    return None
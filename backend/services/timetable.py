@@ -0,0 +1,200 @@
+import hashlib
+import os
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+# 소요 시간이 없는 루틴은 앱과 같이 30분으로 간주
+DEFAULT_ROUTINE_DURATION_MINUTES = 30
+
+TIMETABLE_CACHE_MAX_USERS = int(os.getenv("TIMETABLE_CACHE_MAX_USERS", "10000"))
+
+
+def parse_minutes(time_str: str) -> Optional[int]:
+    """HH:MM 을 하루 중 분(0 ~ 1439)으로 바꿉니다 (잘못된 형식이면 None)"""
+    try:
+        hour, minute = (int(part) for part in time_str.split(":"))
+    except (AttributeError, ValueError):
+        return None
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return hour * 60 + minute
+
+
+def format_minutes(minutes: int) -> str:
+    """분(하루 또는 주 기준)을 HH:MM 으로 바꿉니다"""
+    minutes %= DAY_MINUTES
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class TimetableEntry:
+    """주간 시간표의 한 칸 (월요일 00:00 기준 분 단위 [start, end))
+
+    일요일 밤에 시작해 다음 주로 넘어가는 칸은 end 가 WEEK_MINUTES 보다 큽니다.
+    """
+
+    __slots__ = ("start", "end", "routine_id", "title", "category", "color")
+
+    def __init__(self, start: int, end: int, routine_id: str, title: str, category: str, color: Optional[str]):
+        self.start = start
+        self.end = end
+        self.routine_id = routine_id
+        self.title = title
+        self.category = category
+        self.color = color
+
+    @property
+    def day(self) -> int:
+        """요일 (0=월, ..., 6=일)"""
+        return self.start // DAY_MINUTES
+
+    def __repr__(self) -> str:
+        return f"TimetableEntry({self.routine_id!r}, day={self.day}, {format_minutes(self.start)}-{format_minutes(self.end)})"
+
+
+class WeeklyTimetable:
+    """시작 시각 순으로 정렬한 주간 구간 색인
+
+    모든 조회는 시작 시각 배열에 대한 이분 탐색으로 후보 범위를 좁히므로
+    O(log n + 결과 수) 입니다. (가장 긴 구간 길이를 기억해 탐색 하한으로 사용)
+    """
+
+    __slots__ = ("entries", "_starts", "_max_length")
+
+    def __init__(self, entries: Iterable[TimetableEntry]):
+        self.entries: List[TimetableEntry] = sorted(entries, key=lambda e: (e.start, e.end, e.routine_id))
+        self._starts = [entry.start for entry in self.entries]
+        self._max_length = max((entry.end - entry.start for entry in self.entries), default=0)
+
+    @classmethod
+    def from_routines(cls, routines: Iterable[dict]) -> "WeeklyTimetable":
+        """루틴 목록(time, days, duration_minutes)을 요일별 구간으로 펼칩니다
+
+        요일이 지정되지 않은 루틴은 앱과 같이 시간표에 넣지 않습니다.
+        """
+        entries = []
+        for routine in routines:
+            start = parse_minutes(routine.get("time", ""))
+            if start is None:
+                continue
+            duration = routine.get("duration_minutes") or DEFAULT_ROUTINE_DURATION_MINUTES
+            for day in sorted(set(routine.get("days") or [])):
+                if not 0 <= day < 7:
+                    continue
+                week_start = day * DAY_MINUTES + start
+                entries.append(TimetableEntry(
+                    start=week_start,
+                    end=week_start + duration,
+                    routine_id=routine["id"],
+                    title=routine.get("title", ""),
+                    category=routine.get("category", ""),
+                    color=routine.get("color"),
+                ))
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _candidates(self, start: int, end: int) -> List[TimetableEntry]:
+        """[start, end) 와 겹치는 구간 (주 경계 보정 없음)"""
+        lo = bisect_right(self._starts, start - self._max_length)
+        hi = bisect_left(self._starts, end)
+        return [entry for entry in self.entries[lo:hi] if entry.end > start]
+
+    def overlapping(self, start: int, end: int) -> List[TimetableEntry]:
+        """주 단위로 반복되는 [start, end) 구간과 겹치는 칸 목록 (시작 시각 순)"""
+        found: Dict[int, TimetableEntry] = {}
+        # 일요일 밤 → 월요일 새벽으로 넘어가는 경우를 위해 앞뒤 주로 옮겨서도 확인
+        for shift in (-WEEK_MINUTES, 0, WEEK_MINUTES):
+            for entry in self._candidates(start + shift, end + shift):
+                found[id(entry)] = entry
+        return sorted(found.values(), key=lambda e: (e.start, e.end, e.routine_id))
+
+    def at(self, minute_of_week: int) -> List[TimetableEntry]:
+        """해당 시각(월요일 00:00 기준 분)에 진행 중인 칸 목록"""
+        return self.overlapping(minute_of_week, minute_of_week + 1)
+
+    def next_after(self, minute_of_week: int) -> Optional[TimetableEntry]:
+        """해당 시각 이후 처음 시작하는 칸 (이번 주에 없으면 다음 주 첫 칸)"""
+        if not self.entries:
+            return None
+        index = bisect_right(self._starts, minute_of_week)
+        return self.entries[index] if index < len(self.entries) else self.entries[0]
+
+    def on_day(self, day: int) -> List[TimetableEntry]:
+        """해당 요일에 시작하는 칸 목록 (시작 시각 순)"""
+        lo = bisect_left(self._starts, day * DAY_MINUTES)
+        hi = bisect_left(self._starts, (day + 1) * DAY_MINUTES)
+        return self.entries[lo:hi]
+
+    def conflicts_of(self, entry: TimetableEntry) -> List[TimetableEntry]:
+        """같은 시간대에 겹치는 다른 루틴의 칸 목록"""
+        return [
+            other for other in self.overlapping(entry.start, entry.end)
+            if other.routine_id != entry.routine_id
+        ]
+
+    def conflicts(self) -> List[Tuple[TimetableEntry, TimetableEntry]]:
+        """겹치는 칸 쌍 목록 (각 쌍은 한 번씩, 시작 시각 순)"""
+        pairs = []
+        seen = set()
+        for entry in self.entries:
+            for other in self.conflicts_of(entry):
+                key = frozenset((id(entry), id(other)))
+                if key not in seen:
+                    seen.add(key)
+                    pairs.append((entry, other))
+        return pairs
+
+
+def routines_fingerprint(routines: Iterable[dict]) -> str:
+    """시간표에 영향을 주는 루틴 상태의 해시 (id, updated_at)"""
+    digest = hashlib.sha256()
+    for routine_id, updated_at in sorted((r["id"], str(r.get("updated_at", ""))) for r in routines):
+        digest.update(f"{routine_id}\0{updated_at}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TimetableCache:
+    """사용자별 WeeklyTimetable 캐시 (LRU)
+
+    루틴 목록의 지문이 같으면 색인을 다시 만들지 않습니다. 루틴이 바뀌면 지문이 달라지므로
+    다른 인스턴스에서의 수정도 반영되며, 쓰기 요청에서는 invalidate() 로 바로 비웁니다.
+    """
+
+    def __init__(self, max_users: int = TIMETABLE_CACHE_MAX_USERS):
+        self.max_users = max_users
+        # uid -> (지문, WeeklyTimetable)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, uid: str, routines: List[dict]) -> WeeklyTimetable:
+        """루틴 목록에 맞는 시간표 색인을 반환합니다 (필요할 때만 새로 만듦)"""
+        fingerprint = routines_fingerprint(routines)
+        entry = self._entries.get(uid)
+        if entry is not None and entry[0] == fingerprint:
+            self._entries.move_to_end(uid)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        timetable = WeeklyTimetable.from_routines(routines)
+        self._entries[uid] = (fingerprint, timetable)
+        self._entries.move_to_end(uid)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+        return timetable
+
+    def invalidate(self, uid: str):
+        """사용자의 시간표 색인을 비웁니다 (루틴 생성/수정/삭제 시 호출)"""
+        self._entries.pop(uid, None)
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_execution_repository, get_routine_repository, get_sync_repository
+from auth.middleware import verify_firebase_token
+from main import app
+from repositories.cached_routine_repository import CachedRoutineRepository
+from repositories.execution_repository import FirestoreExecutionRepository
+from repositories.routine_repository import FirestoreRoutineRepository
+from repositories.sync_repository import FirestoreSyncRepository
+from tests.fake_firestore import FakeFirestore
+
+
+class FakeBackend:
+    """앱의 인증 / 루틴 / 수행 기록 / 동기화 저장소 의존성을 메모리 Firestore 로 바꾼 테스트 클라이언트
+
+    tearDown 에서 close() 를 호출해 의존성 교체를 되돌립니다.
+    """
+
+    def __init__(self, uid: str):
+        self.uid = uid
+        self.db = FakeFirestore()
+
+        routine_backend = FirestoreRoutineRepository()
+        routine_backend._db = self.db
+        self.routine_repo = CachedRoutineRepository(routine_backend)
+        self.execution_repo = FirestoreExecutionRepository()
+        self.execution_repo._db = self.db
+        self.sync_repo = FirestoreSyncRepository()
+        self.sync_repo._db = self.db
+
+        app.dependency_overrides[verify_firebase_token] = lambda: uid
+        app.dependency_overrides[get_routine_repository] = lambda: self.routine_repo
+        app.dependency_overrides[get_execution_repository] = lambda: self.execution_repo
+        app.dependency_overrides[get_sync_repository] = lambda: self.sync_repo
+        self.client = TestClient(app)
+
+    def create_routine(self, title: str = "아침 운동", time: str = "07:00") -> str:
+        return self.client.post("/routines", json={"title": title, "time": time, "category": "health"}).json()["id"]
+
+    def execution_body(self, routine_id: str, started_at: str, duration_seconds: int = 600) -> dict:
+        return {
+            "routine_id": routine_id,
+            "routine_title": "아침 운동",
+            "started_at": started_at,
+            "ended_at": started_at,
+            "duration_seconds": duration_seconds,
+        }
+
+    def close(self):
+        app.dependency_overrides.clear()
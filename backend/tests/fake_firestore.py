@@ -0,0 +1,354 @@
+"""
+테스트용 메모리 Firestore 클라이언트
+
+저장소가 사용하는 Firestore API(문서 / 쿼리 / WriteBatch / 트랜잭션 / get_all)만 흉내 내며,
+클라이언트가 보내는 RPC 를 rpcs 목록에 (종류, 대상) 으로 기록합니다.
+SERVER_TIMESTAMP / Increment / ArrayUnion 을 반영하며, SERVER_TIMESTAMP 는 커밋마다 하나씩 증가하는 커밋 시각으로 채워지고 (commit_time 으로 지정 가능),
+쿼리 결과 문서에는 쿼리 시점의 read_time 이 붙습니다.
+"""
+import copy
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from google.api_core.exceptions import AlreadyExists, NotFound
+from google.cloud.firestore_v1 import transforms
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data, read_time=None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.exists = data is not None
+        self.read_time = read_time
+
+    def to_dict(self):
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field):
+        # 실제 DocumentSnapshot 과 같이 없는 필드는 KeyError
+        if field not in self._data:
+            raise KeyError(field)
+        return self._data[field]
+
+
+class FakeWriteOption:
+    def __init__(self, exists):
+        self.exists = exists
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self._db = db
+        self._path = path
+        self.id = path[-1]
+        self.path = "/".join(path)
+
+    def collection(self, name):
+        return FakeCollection(self._db, self._path + (name,))
+
+    @property
+    def parent(self):
+        return FakeCollection(self._db, self._path[:-1])
+
+    def get(self, field_paths=None, transaction=None, **kwargs):
+        self._db.record("get", self.path)
+        return FakeSnapshot(self, copy.deepcopy(self._db.docs.get(self._path)), self._db.now())
+
+    def set(self, data, merge=False, **kwargs):
+        batch = self._db.batch()
+        batch.set(self, data, merge=merge)
+        batch.commit()
+
+    def create(self, data, **kwargs):
+        batch = self._db.batch()
+        batch.create(self, data)
+        batch.commit()
+
+    def update(self, data, option=None, **kwargs):
+        batch = self._db.batch()
+        batch.update(self, data, option=option)
+        batch.commit()
+
+    def delete(self, option=None, **kwargs):
+        batch = self._db.batch()
+        batch.delete(self, option=option)
+        batch.commit()
+
+    def __eq__(self, other):
+        return isinstance(other, FakeDocument) and other._path == self._path
+
+    def __hash__(self):
+        return hash(self._path)
+
+
+class FakeQuery:
+    def __init__(self, db, path, filters=(), orders=(), limit=None, after=None, fields=None, group=False):
+        self._db = db
+        self._path = path
+        self._filters = list(filters)
+        self._orders = list(orders)
+        self._limit = limit
+        self._after = after
+        self._fields = fields
+        self._group = group
+
+    def _copy(self, **changes):
+        query = FakeQuery(
+            self._db, self._path, self._filters, self._orders, self._limit, self._after, self._fields, self._group
+        )
+        for key, value in changes.items():
+            setattr(query, key, value)
+        return query
+
+    def where(self, field=None, op=None, value=None, filter=None):
+        if filter is not None:
+            field, op, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(_filters=self._filters + [(field, op, value)])
+
+    def order_by(self, field, direction="ASCENDING"):
+        return self._copy(_orders=self._orders + [(field, direction)])
+
+    def limit(self, count):
+        return self._copy(_limit=count)
+
+    def start_after(self, values):
+        return self._copy(_after=values)
+
+    def select(self, fields):
+        return self._copy(_fields=list(fields))
+
+    def _matches(self, data):
+        for field, op, value in self._filters:
+            current = data.get(field)
+            if current is None:
+                return False
+            if op == "==" and not current == value:
+                return False
+            if op == ">" and not current > value:
+                return False
+            if op == ">=" and not current >= value:
+                return False
+            if op == "<" and not current < value:
+                return False
+            if op == "<=" and not current <= value:
+                return False
+        return True
+
+    def _key(self, snapshot):
+        return [snapshot.id if field == "__name__" else snapshot._data.get(field) for field, _ in self._orders]
+
+    def stream(self, transaction=None, **kwargs):
+        self._db.record("query", "/".join(self._path))
+        read_time = self._db.now()
+        results = []
+        for path, data in list(self._db.docs.items()):
+            if self._group:
+                if len(path) < 2 or path[-2] != self._path[-1]:
+                    continue
+            elif path[:-1] != self._path:
+                continue
+            # order_by 필드가 없는 문서는 Firestore 와 같이 결과에서 빠짐
+            if any(field != "__name__" and field not in data for field, _ in self._orders):
+                continue
+            if self._matches(data):
+                results.append(FakeSnapshot(FakeDocument(self._db, path), copy.deepcopy(data), read_time))
+
+        for field, direction in reversed(self._orders):
+            results.sort(
+                key=lambda s: s.id if field == "__name__" else s._data.get(field),
+                reverse=(direction == "DESCENDING"),
+            )
+        if self._after is not None:
+            after = [
+                value.id if isinstance(value, FakeDocument) else value
+                for value in (self._after[field] for field, _ in self._orders)
+            ]
+            results = [snapshot for snapshot in results if self._key(snapshot) > after]
+        if self._limit is not None:
+            results = results[:self._limit]
+        if self._fields is not None:
+            for snapshot in results:
+                snapshot._data = {key: value for key, value in snapshot._data.items() if key in self._fields}
+        return iter(results)
+
+    def get(self, **kwargs):
+        return list(self.stream())
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, db, path):
+        super().__init__(db, path)
+        self.id = path[-1]
+
+    @property
+    def parent(self):
+        return FakeDocument(self._db, self._path[:-1]) if len(self._path) > 1 else None
+
+    def document(self, doc_id=None):
+        return FakeDocument(self._db, self._path + (doc_id or uuid.uuid4().hex[:20],))
+
+
+class FakeWriteBatch:
+    def __init__(self, db):
+        self._db = db
+        self._writes = []
+
+    def set(self, reference, data, merge=False):
+        self._writes.append(lambda now: self._db._set(reference._path, data, merge, now))
+
+    def create(self, reference, data):
+        def write(now):
+            if reference._path in self._db.docs:
+                raise AlreadyExists(reference.path)
+            self._db._set(reference._path, data, False, now)
+        self._writes.append(write)
+
+    def update(self, reference, data, option=None):
+        def write(now):
+            if reference._path not in self._db.docs:
+                raise NotFound(reference.path)
+            self._db._update(reference._path, data, now)
+        self._writes.append(write)
+
+    def delete(self, reference, option=None):
+        def write(now):
+            if option is not None and option.exists and reference._path not in self._db.docs:
+                raise NotFound(reference.path)
+            self._db.docs.pop(reference._path, None)
+        self._writes.append(write)
+
+    def commit(self, **kwargs):
+        self._db.record("commit", len(self._writes))
+        now = self._db.next_commit_time()
+        before = copy.deepcopy(self._db.docs)
+        try:
+            for write in self._writes:
+                write(now)
+        except Exception:
+            # 배치는 원자적이므로 실패하면 아무것도 반영되지 않음
+            self._db.docs = before
+            raise
+        return [None] * len(self._writes)
+
+    def __len__(self):
+        return len(self._writes)
+
+
+class FakeTransaction(FakeWriteBatch):
+    """google.cloud.firestore.transactional 이 사용하는 트랜잭션 인터페이스"""
+
+    _id = None
+    _max_attempts = 5
+    _read_only = False
+    in_progress = False
+
+    def _begin(self, retry_id=None):
+        self._db.record("begin_transaction", None)
+        self.in_progress = True
+
+    def _commit(self):
+        self.commit()
+        self.in_progress = False
+        return []
+
+    def _rollback(self):
+        self.in_progress = False
+
+    def _clean_up(self):
+        self._writes = []
+
+
+class FakeFirestore:
+    """저장소의 _db 자리에 넣어 쓰는 메모리 Firestore"""
+
+    def __init__(self):
+        self.docs = {}
+        self.rpcs = []
+        self._clock = EPOCH
+        # 다음 커밋에 쓸 시각 (테스트에서 늦게 도착한 커밋을 흉내 낼 때 지정)
+        self.commit_time = None
+
+    def record(self, kind, target):
+        self.rpcs.append((kind, target))
+
+    def rpc_counts(self) -> dict:
+        return dict(Counter(kind for kind, _ in self.rpcs))
+
+    def now(self) -> datetime:
+        return self._clock
+
+    def advance(self, seconds: float):
+        self._clock += timedelta(seconds=seconds)
+
+    def next_commit_time(self) -> datetime:
+        if self.commit_time is not None:
+            commit_time, self.commit_time = self.commit_time, None
+            return commit_time
+        self._clock += timedelta(milliseconds=1)
+        return self._clock
+
+    def collection(self, name):
+        return FakeCollection(self, (name,))
+
+    def collection_group(self, name):
+        return FakeQuery(self, (name,), group=True)
+
+    def batch(self):
+        return FakeWriteBatch(self)
+
+    def transaction(self, **kwargs):
+        return FakeTransaction(self)
+
+    def write_option(self, exists=None, **kwargs):
+        return FakeWriteOption(exists)
+
+    def get_all(self, references, field_paths=None, transaction=None, **kwargs):
+        self.record("batch_get", len(references))
+        read_time = self.now()
+        for reference in references:
+            yield FakeSnapshot(reference, copy.deepcopy(self.docs.get(reference._path)), read_time)
+
+    def close(self):
+        pass
+
+    def _resolve(self, value, current, now):
+        if value is transforms.SERVER_TIMESTAMP:
+            return now
+        if isinstance(value, transforms.Increment):
+            return (current or 0) + value.value
+        if isinstance(value, transforms.ArrayUnion):
+            merged = list(current) if isinstance(current, list) else []
+            return merged + [item for item in value.values if item not in merged]
+        if value is transforms.DELETE_FIELD:
+            return transforms.DELETE_FIELD
+        if isinstance(value, dict):
+            merged = dict(current) if isinstance(current, dict) else {}
+            for key, item in value.items():
+                resolved = self._resolve(item, merged.get(key), now)
+                if resolved is transforms.DELETE_FIELD:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = resolved
+            return merged
+        return copy.deepcopy(value)
+
+    def _set(self, path, data, merge, now):
+        current = self.docs.get(path, {}) if merge else {}
+        self.docs[path] = self._resolve(data, current, now)
+
+    def _update(self, path, data, now):
+        document = self.docs[path]
+        for key, value in data.items():
+            parts = key.split(".")
+            target = document
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            resolved = self._resolve(value, target.get(parts[-1]), now)
+            if resolved is transforms.DELETE_FIELD:
+                target.pop(parts[-1], None)
+            else:
+                target[parts[-1]] = resolved
@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+import repositories.execution_rollups as execution_rollups
+from tests.api_client import FakeBackend
+
+DATE = "2026-01-15"
+
+
+class DailyExecutionsETagTest(unittest.TestCase):
+    """GET /executions/daily 는 If-None-Match 가 있을 때만 일간 집계 문서를 읽음"""
+
+    def setUp(self):
+        # 집계가 처음부터 함께 저장된 날짜
+        patch = mock.patch.object(execution_rollups, "ROLLUPS_COMPLETE_SINCE", "2026-01-01")
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.backend = FakeBackend("daily-etag-user")
+        self.client = self.backend.client
+        self.routine_id = self.backend.create_routine()
+        self.client.post(
+            f"/executions/{self.routine_id}", json=self.backend.execution_body(self.routine_id, f"{DATE}T07:00:00Z")
+        )
+
+    def tearDown(self):
+        self.backend.close()
+
+    def get_daily(self, headers=None):
+        self.backend.db.rpcs.clear()
+        response = self.client.get("/executions/daily", params={"date": DATE}, headers=headers or {})
+        return response, self.backend.db.rpc_counts()
+
+    def test_plain_request_reads_only_executions(self):
+        response, rpcs = self.get_daily()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rpcs, {"query": 1})
+        self.assertIn("ETag", response.headers)
+
+    def test_revalidation_reads_only_stats_doc(self):
+        etag = self.get_daily()[0].headers["ETag"]
+
+        response, rpcs = self.get_daily({"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(rpcs, {"get": 1})
+
+    def test_new_execution_changes_etag(self):
+        etag = self.get_daily()[0].headers["ETag"]
+        self.client.post(
+            f"/executions/{self.routine_id}", json=self.backend.execution_body(self.routine_id, f"{DATE}T08:00:00Z")
+        )
+
+        response, rpcs = self.get_daily({"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total_routines"], 2)
+        self.assertEqual(rpcs, {"get": 1, "query": 1})
+        # 집계 문서로 계산한 ETag 와 수행 기록으로 계산한 ETag 가 같음
+        self.assertEqual(self.get_daily({"If-None-Match": response.headers["ETag"]})[0].status_code, 304)
+
+    def test_incomplete_rollup_is_not_used(self):
+        # 집계 도입 이전에 저장된 수행 기록이 있어 집계가 모자란 날짜
+        self.backend.db.docs[("users", "daily-etag-user", "executions", "legacy")] = {
+            **self.backend.execution_body(self.routine_id, f"{DATE}T06:00:00Z"),
+            "date": DATE,
+            "created_at": f"{DATE}T06:00:00Z",
+        }
+        # 집계 문서 수(1)로 만든 ETag 가 수행 기록 수(2)로 만든 ETag 와 맞지 않도록 ETag 는 수행 기록 기준
+        with mock.patch.object(execution_rollups, "ROLLUPS_COMPLETE_SINCE", "2026-02-01"):
+            response, _ = self.get_daily()
+            self.assertEqual(response.json()["total_routines"], 2)
+            etag = response.headers["ETag"]
+
+            response, rpcs = self.get_daily({"If-None-Match": etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(rpcs, {"query": 1})
+
+            self.client.post(
+                f"/executions/{self.routine_id}",
+                json=self.backend.execution_body(self.routine_id, f"{DATE}T08:00:00Z"),
+            )
+            response, rpcs = self.get_daily({"If-None-Match": etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["total_routines"], 3)
+            self.assertEqual(rpcs, {"query": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from tests.api_client import FakeBackend
+
+UID = "execution-batch-user"
+STARTED_AT = "2026-01-15T07:00:00Z"
+
+
+class ExecutionBatchTest(unittest.TestCase):
+    """POST /executions:batch 는 이미 저장된 항목을 단건 저장과 같은 기준으로 200 / 409 로 표시"""
+
+    def setUp(self):
+        self.backend = FakeBackend(UID)
+        self.client = self.backend.client
+        self.routine_id = self.backend.create_routine()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def body(self, duration_seconds: int = 600) -> dict:
+        return self.backend.execution_body(self.routine_id, STARTED_AT, duration_seconds)
+
+    def post_batch(self, *executions):
+        response = self.client.post("/executions:batch", json={"executions": list(executions)})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def statuses(self, result) -> list:
+        return [item["status"] for item in result["results"]]
+
+    def test_resent_items(self):
+        self.post_batch(self.body())
+        self.assertEqual(self.statuses(self.post_batch(self.body())), [200])
+
+        result = self.post_batch(self.body(duration_seconds=900))
+        self.assertEqual(self.statuses(result), [409])
+        self.assertEqual(result["created"], 0)
+        self.assertEqual(result["failed"], 1)
+
+    def test_duplicates_in_one_request(self):
+        result = self.post_batch(self.body(), self.body(), self.body(duration_seconds=900))
+        self.assertEqual(self.statuses(result), [201, 200, 409])
+        self.assertEqual(result["created"], 1)
+
+    def test_agrees_with_single_create(self):
+        single = self.client.post(f"/executions/{self.routine_id}", json=self.body())
+        self.assertEqual(single.status_code, 201)
+
+        conflict = self.client.post(f"/executions/{self.routine_id}", json=self.body(duration_seconds=900))
+        self.assertEqual(conflict.status_code, 409)
+        self.assertEqual(self.statuses(self.post_batch(self.body(duration_seconds=900))), [409])
+        # 기존 항목과 같은 내용 + 이미 저장된 항목과 다른 중복
+        self.assertEqual(self.statuses(self.post_batch(self.body(), self.body(duration_seconds=900))), [200, 409])
+
+    def test_routine_deleted_by_another_worker(self):
+        other_id = self.backend.create_routine("저녁 독서", "21:00")
+        # 루틴 목록 캐시에는 남아 있지만 다른 워커에서 삭제됨
+        self.client.get("/routines")
+        del self.backend.db.docs[("users", UID, "routines", self.routine_id)]
+
+        result = self.post_batch(
+            self.body(),
+            self.backend.execution_body(other_id, STARTED_AT),
+            self.body(duration_seconds=900),
+            self.body(),
+        )
+        self.assertEqual(self.statuses(result), [404, 201, 404, 404])
+        self.assertEqual(result["created"], 1)
+
+        executions = [data for path, data in self.backend.db.docs.items() if path[2] == "executions"]
+        self.assertEqual([data["routine_id"] for data in executions], [other_id])
+        daily = self.backend.db.docs[("users", UID, "daily_stats", "2026-01-15")]
+        self.assertEqual(daily["total_routines"], 1)
+        self.assertEqual(list(daily["routines"]), [other_id])
+        self.assertFalse(self.backend.routine_repo.is_known(UID, self.routine_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
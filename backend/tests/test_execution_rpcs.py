@@ -0,0 +1,102 @@
+import unittest
+from types import SimpleNamespace
+
+from repositories.cached_routine_repository import CachedRoutineRepository
+from repositories.change_watcher import FirestoreChangeWatcher
+from tests.api_client import FakeBackend
+
+UID = "execution-rpc-user"
+STARTED_AT = "2026-01-15T07:00:00Z"
+
+
+class ExecutionLoggingRpcTest(unittest.TestCase):
+    """POST /executions/{routine_id} 가 경로별로 보내는 Firestore RPC"""
+
+    def setUp(self):
+        self.backend = FakeBackend(UID)
+        self.client = self.backend.client
+        self.db = self.backend.db
+        self.routine_id = self.backend.create_routine()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def post(self, started_at: str = STARTED_AT):
+        self.db.rpcs.clear()
+        response = self.client.post(
+            f"/executions/{self.routine_id}", json=self.backend.execution_body(self.routine_id, started_at)
+        )
+        return response, self.db.rpc_counts()
+
+    def executions(self):
+        return [path for path in self.db.docs if path[2] == "executions"]
+
+    def test_warm_path_is_one_commit(self):
+        response, rpcs = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(rpcs, {"commit": 1})
+        self.assertEqual(len(self.executions()), 1)
+
+    def test_retry_is_served_from_memory(self):
+        self.post()
+        response, rpcs = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(rpcs, {})
+
+    def test_cold_path_uses_transaction(self):
+        # 워커가 막 시작되어 루틴 ID 집합이 비어 있는 상태
+        self.backend.routine_repo = CachedRoutineRepository(self.backend.routine_repo.backend)
+        response, rpcs = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(rpcs, {"begin_transaction": 1, "batch_get": 1, "commit": 1})
+
+        # 확인된 루틴은 다음부터 빠른 경로
+        self.assertEqual(self.post("2026-01-15T08:00:00Z")[1], {"commit": 1})
+
+    def test_routine_deleted_by_another_worker(self):
+        # 이 워커는 루틴을 기억하고 있지만 다른 워커에서 삭제됨
+        del self.db.docs[("users", UID, "routines", self.routine_id)]
+
+        response, rpcs = self.post()
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(rpcs, {"commit": 1})
+        self.assertEqual(self.executions(), [])
+        self.assertFalse(any(path[2].endswith("_stats") for path in self.db.docs))
+
+        # 잊은 루틴은 트랜잭션 경로로 확인
+        response, rpcs = self.post("2026-01-15T08:00:00Z")
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("begin_transaction", rpcs)
+
+    def test_logging_does_not_touch_sync_fields(self):
+        before = dict(self.db.docs[("users", UID, "routines", self.routine_id)])
+        self.post()
+        after = self.db.docs[("users", UID, "routines", self.routine_id)]
+        self.assertIn("last_logged_at", after)
+        self.assertEqual((after["sync_at"], after["updated_at"]), (before["sync_at"], before["updated_at"]))
+
+
+class RoutineWatcherTest(unittest.TestCase):
+    """루틴 문서의 last_logged_at 만 바뀐 스냅샷 변경은 스트림으로 보내지 않음"""
+
+    @staticmethod
+    def change(kind: str, doc_id: str, data: dict):
+        document = SimpleNamespace(id=doc_id, to_dict=lambda: dict(data))
+        return SimpleNamespace(type=SimpleNamespace(name=kind), document=document)
+
+    def test_skips_unchanged_sync_at(self):
+        received = []
+        callback = FirestoreChangeWatcher._callback("routines", received.extend)
+        initial = {"title": "A", "sync_at": 1}
+        callback([SimpleNamespace(id="r1", to_dict=lambda: dict(initial))], [], None)
+
+        callback([], [self.change("MODIFIED", "r1", {**initial, "last_logged_at": 2})], None)
+        self.assertEqual(received, [])
+
+        callback([], [self.change("MODIFIED", "r1", {"title": "B", "sync_at": 3})], None)
+        self.assertEqual([(e["change"], e["data"]["title"]) for e in received], [("modified", "B")])
+
+
+if __name__ == "__main__":
+    unittest.main()
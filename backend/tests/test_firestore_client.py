@@ -0,0 +1,82 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import firestore
+from google.cloud.firestore_v1.services.firestore.transports.grpc import FirestoreGrpcTransport
+
+import repositories.executor as executor
+from repositories.firestore_client import FIRESTORE_CHANNEL_OPTIONS, _configure_channel
+
+
+class ChannelOptionsTest(unittest.TestCase):
+    """공유 클라이언트의 gRPC 채널은 FIRESTORE_CHANNEL_OPTIONS 로 만들어짐"""
+
+    def client(self):
+        return firestore.Client(project="uphill-test", credentials=AnonymousCredentials(), database="uphilldb")
+
+    def test_channel_uses_tuned_options(self):
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("FIRESTORE_EMULATOR_HOST", None)
+            client = self.client()
+            with mock.patch.object(
+                FirestoreGrpcTransport, "create_channel", wraps=FirestoreGrpcTransport.create_channel
+            ) as create_channel:
+                _configure_channel(client)
+                # 첫 RPC 때 SDK 가 채널을 다시 만들지 않음
+                api = client._firestore_api
+
+        self.assertEqual(create_channel.call_args.kwargs["options"], FIRESTORE_CHANNEL_OPTIONS)
+        self.assertEqual(create_channel.call_count, 1)
+        self.assertIs(api.transport, client._transport)
+        api.transport.close()
+
+    def test_emulator_keeps_sdk_channel(self):
+        with mock.patch.dict(os.environ, {"FIRESTORE_EMULATOR_HOST": "localhost:8080"}):
+            client = self.client()
+            _configure_channel(client)
+        self.assertIsNone(client._firestore_api_internal)
+
+
+class DrainExecutorTest(unittest.IsolatedAsyncioTestCase):
+    """앱 종료 시 스레드 풀 정리가 이벤트 루프를 막지 않고 정해진 시간 안에 끝남"""
+
+    async def test_drain_is_bounded_and_non_blocking(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        stuck = asyncio.ensure_future(executor.run_blocking(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        started = time.monotonic()
+        drained = await executor.drain_executor(timeout=0.2)
+        elapsed = time.monotonic() - started
+        ticker.cancel()
+
+        self.assertFalse(drained)
+        self.assertLess(elapsed, 1)
+        # 기다리는 동안에도 다른 코루틴이 실행됨
+        self.assertGreater(ticks, 5)
+
+        release.set()
+        self.assertTrue(await stuck)
+
+    async def test_drain_waits_for_quick_calls(self):
+        self.assertEqual(await executor.run_blocking(sum, [1, 2]), 3)
+        self.assertTrue(await executor.drain_executor(timeout=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.health as health
+import repositories.firestore_client as firestore_client
+
+
+class WarmUpTest(unittest.TestCase):
+    """워밍업 실패는 재시도하고, 이후 지연 초기화가 성공하면 ready 로 바뀜"""
+
+    def setUp(self):
+        self.initial_state = dict(health._state)
+        health._state.update(status="starting", warm_up_seconds=None, firebase=None, error=None, attempts=0)
+        health._stop.clear()
+        patches = [
+            mock.patch.object(health, "WARM_UP_MODULES", ()),
+            mock.patch.object(health, "WARM_UP_RETRY_SECONDS", 0.01),
+            mock.patch.object(health, "get_firestore_client"),
+            mock.patch.dict(firestore_client._clients, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        app = FastAPI()
+        app.include_router(health.router)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        health._state.clear()
+        health._state.update(self.initial_state)
+        health._stop.clear()
+
+    def test_retries_until_success(self):
+        attempts = [RuntimeError("credential"), RuntimeError("credential"), object()]
+        with mock.patch.object(health, "initialize_firebase", side_effect=attempts):
+            health.warm_up()
+
+        self.assertEqual(health._state["status"], "ready")
+        self.assertEqual(health._state["attempts"], 3)
+        self.assertIsNone(health._state["error"])
+        self.assertEqual(self.client.get("/ready").status_code, 200)
+
+    def test_lazy_init_flips_failed_to_ready(self):
+        with mock.patch.object(health, "WARM_UP_MAX_ATTEMPTS", 2), \
+                mock.patch.object(health, "initialize_firebase", side_effect=RuntimeError("credential")):
+            health.warm_up()
+
+        self.assertEqual(health._state["status"], "failed")
+        self.assertEqual(self.client.get("/ready").status_code, 503)
+
+        # 이후 요청이 지연 초기화로 클라이언트를 만든 경우
+        firestore_client._clients[firestore_client.FIRESTORE_DATABASE_ID] = object()
+        self.assertEqual(self.client.get("/ready").status_code, 200)
+        self.assertEqual(health._state["status"], "ready")
+
+    def test_stop_ends_retry_wait(self):
+        with mock.patch.object(health, "WARM_UP_RETRY_SECONDS", 60), \
+                mock.patch.object(health, "initialize_firebase", side_effect=RuntimeError("credential")):
+            health.stop_warm_up()
+            health.warm_up()
+
+        self.assertEqual(health._state["attempts"], 1)
+        self.assertEqual(health._state["status"], "retrying")
+
+    def test_liveness_ignores_warm_up(self):
+        health._state["status"] = "failed"
+        self.assertEqual(self.client.get("/health").status_code, 200)
+        self.assertEqual(self.client.get("/ready").status_code, 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+
+from services.llm_client import CircuitBreaker, LLMClient, LLMUnavailableError
+
+QUEUE_DEADLINE_SECONDS = 0.2
+
+
+class GatedCompletions:
+    """gate 가 열릴 때까지 응답을 붙잡는 업스트림 (느린 LLM 흉내)"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await self.gate.wait()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))], usage=None)
+
+
+class ConcurrencyDeadlineTest(unittest.IsolatedAsyncioTestCase):
+    """동시 요청 자리를 기다리다 마감 시간을 넘기면 바로 실패하고 서킷은 닫힌 채로 유지"""
+
+    async def asyncSetUp(self):
+        self.completions = GatedCompletions()
+        self.client = LLMClient(
+            deadline_seconds=5,
+            max_concurrency=1,
+            breaker=CircuitBreaker(failure_threshold=1),
+        )
+        self.client._client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+        # 느린 호출 하나가 유일한 자리를 차지
+        self.in_flight = asyncio.create_task(self.client.chat([{"role": "user", "content": "first"}]))
+        while self.completions.calls == 0:
+            await asyncio.sleep(0.01)
+        self.client.deadline_seconds = QUEUE_DEADLINE_SECONDS
+
+    async def assert_queue_timeout(self, call):
+        started = time.monotonic()
+        with self.assertRaises(LLMUnavailableError):
+            await call()
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, QUEUE_DEADLINE_SECONDS + 0.15)
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual(self.client.breaker.state, "closed")
+        self.assertEqual(self.client.breaker.failures, 0)
+
+        # 자리를 차지한 호출은 그대로 끝나고 자리를 돌려줌
+        self.completions.gate.set()
+        self.assertEqual((await self.in_flight).content, "ok")
+        self.assertFalse(self.client._semaphore.locked())
+
+    async def test_chat_queue_timeout(self):
+        await self.assert_queue_timeout(lambda: self.client.chat([{"role": "user", "content": "queued"}]))
+
+    async def test_stream_queue_timeout(self):
+        async def consume():
+            async for _ in self.client.chat_stream([{"role": "user", "content": "queued"}]):
+                pass
+
+        await self.assert_queue_timeout(consume)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.request_logging import UNMATCHED_ROUTE, RequestLoggingMiddleware
+from services.metrics import REQUEST_LATENCY
+
+STREAM_SECONDS = 0.3
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware, sample_rate=0)
+
+    @app.get("/latency-test/stream")
+    async def stream():
+        async def chunks():
+            yield b"data: first\n\n"
+            await asyncio.sleep(STREAM_SECONDS)
+            yield b"data: last\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/latency-test/slow")
+    async def slow():
+        await asyncio.sleep(STREAM_SECONDS)
+        return {"ok": True}
+
+    return app
+
+
+class RequestLatencyTest(unittest.TestCase):
+    """스트리밍 응답은 연결 유지 시간이 아니라 응답 시작까지의 시간을 기록"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(build_app())
+
+    def test_streaming_response_records_time_to_start(self):
+        before = REQUEST_LATENCY._sums.get(("GET", "/latency-test/stream", "200"), 0.0)
+        self.assertEqual(self.client.get("/latency-test/stream").status_code, 200)
+        recorded = REQUEST_LATENCY._sums[("GET", "/latency-test/stream", "200")] - before
+        self.assertLess(recorded, STREAM_SECONDS / 2)
+        self.assertEqual(sum(REQUEST_LATENCY._counts[("GET", "/latency-test/stream", "200")]), 1)
+
+    def test_regular_response_records_full_duration(self):
+        self.assertEqual(self.client.get("/latency-test/slow").status_code, 200)
+        self.assertGreaterEqual(REQUEST_LATENCY._sums[("GET", "/latency-test/slow", "200")], STREAM_SECONDS)
+
+
+class UnmatchedPathLogTest(unittest.TestCase):
+    """매칭되지 않은 경로는 실제 URL 대신 "unmatched" 로 기록"""
+
+    def test_raw_path_is_not_logged(self):
+        client = TestClient(build_app())
+        with self.assertLogs("uphill.access", level="INFO") as logs:
+            self.assertEqual(client.get("/latency-test/reset/secret-token-123").status_code, 404)
+
+        fields = logs.records[-1].fields
+        self.assertEqual(fields["path"], UNMATCHED_ROUTE)
+        self.assertNotIn("secret-token-123", repr(fields))
+        self.assertIn(("GET", UNMATCHED_ROUTE, "404"), REQUEST_LATENCY._counts)
+
+
+if __name__ == "__main__":
+    unittest.main()
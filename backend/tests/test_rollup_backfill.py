@@ -0,0 +1,107 @@
+import unittest
+
+from scripts.backfill_execution_rollups import backfill_execution_rollups
+from tests.api_client import FakeBackend
+
+UID = "rollup-user"
+DATE = "2026-01-15"
+
+
+class RollupBackfillTest(unittest.TestCase):
+    """집계 도입 이전 수행 기록이 있는 기간의 집계를 백필로 바로잡는지"""
+
+    def setUp(self):
+        self.backend = FakeBackend(UID)
+        self.client = self.backend.client
+        self.db = self.backend.db
+        self.routine_id = self.backend.create_routine()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def add_legacy_execution(self, execution_id: str, date: str, hour: int = 0):
+        """집계 문서 없이 저장된 (집계 도입 이전) 수행 기록"""
+        started_at = f"{date}T{hour:02d}:00:00Z"
+        self.db.docs[("users", UID, "executions", execution_id)] = {
+            **self.backend.execution_body(self.routine_id, started_at, 300),
+            "date": date,
+            "created_at": started_at,
+        }
+
+    def post_execution(self, started_at: str):
+        response = self.client.post(
+            f"/executions/{self.routine_id}", json=self.backend.execution_body(self.routine_id, started_at)
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def daily_stats(self):
+        return self.client.get("/executions/daily/stats", params={"date": DATE}).json()
+
+    def range_stats(self, granularity: str):
+        return self.client.get(
+            "/executions/range", params={"from": "2026-01-01", "to": "2026-01-31", "granularity": granularity}
+        ).json()
+
+    def backfill(self):
+        return backfill_execution_rollups(self.backend.execution_repo, self.db)
+
+    def test_backfill_counts_legacy_executions(self):
+        self.add_legacy_execution("legacy0", DATE, 0)
+        self.add_legacy_execution("legacy1", DATE, 1)
+        self.post_execution(f"{DATE}T07:00:00Z")
+        # 배포 이후 기록만 집계된 상태
+        self.assertEqual(self.daily_stats()["total_routines"], 1)
+
+        counts = self.backfill()
+        self.assertEqual(counts["day"]["rebuilt"], 1)
+
+        stats = self.daily_stats()
+        self.assertEqual(stats["total_routines"], 3)
+        self.assertEqual(stats["total_duration_seconds"], 1200)
+        self.assertEqual(stats["routines"][0]["count"], 3)
+
+        # 이후 증분도 백필한 값 위에 누적됨
+        self.post_execution(f"{DATE}T08:00:00Z")
+        self.assertEqual(self.daily_stats()["total_routines"], 4)
+
+    def test_backfill_range_history(self):
+        for i, date in enumerate(["2026-01-05", "2026-01-06", "2026-01-07", "2026-01-20"]):
+            self.add_legacy_execution(f"legacy{i}", date)
+        # 집계 도입 이전 기간은 0 으로 보고됨
+        self.assertEqual(self.range_stats("week")["total_routines"], 0)
+
+        self.backfill()
+
+        weeks = self.range_stats("week")
+        self.assertEqual(weeks["total_routines"], 4)
+        self.assertEqual(
+            [(p["period"], p["total_routines"]) for p in weeks["periods"]], [("2026-W02", 3), ("2026-W04", 1)]
+        )
+        self.assertEqual(weeks["routines"][0]["active_days"], 4)
+        self.assertEqual(weeks["routines"][0]["longest_streak"], 3)
+
+        months = self.range_stats("month")
+        self.assertEqual([(p["period"], p["total_routines"]) for p in months["periods"]], [("2026-01", 4)])
+        self.assertEqual(self.range_stats("day")["total_routines"], 4)
+
+        # 백필한 문서와 증분으로 쌓은 문서의 모양이 같아 다음 백필은 다시 쓰지 않음
+        self.post_execution("2026-01-21T07:00:00Z")
+        counts = self.backfill()
+        self.assertEqual([counts[g]["rebuilt"] for g in ("day", "week", "month")], [0, 0, 0])
+        self.assertEqual(self.range_stats("month")["total_routines"], 5)
+
+    def test_backfill_is_idempotent(self):
+        self.add_legacy_execution("legacy0", DATE)
+        self.backfill()
+        self.db.rpcs.clear()
+
+        counts = self.backfill()
+        for granularity in ("day", "week", "month"):
+            self.assertEqual(counts[granularity], {"periods": 1, "rebuilt": 0, "failed": 0})
+        # 트랜잭션은 쓰기 없이 커밋됨
+        self.assertEqual([writes for kind, writes in self.db.rpcs if kind == "commit"], [0, 0, 0])
+        self.assertEqual(self.daily_stats()["total_routines"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
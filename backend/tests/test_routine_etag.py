@@ -0,0 +1,52 @@
+import unittest
+
+from tests.api_client import FakeBackend
+
+UID = "etag-user"
+
+
+class RoutineListETagTest(unittest.TestCase):
+    """GET /routines 의 ETag 가 필드 선택 여부와 관계없이 루틴 수정을 반영하는지"""
+
+    def setUp(self):
+        self.backend = FakeBackend(UID)
+        self.client = self.backend.client
+        self.routine_id = self.backend.create_routine()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def assert_rename_changes_etag(self, params):
+        first = self.client.get("/routines", params=params)
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["ETag"]
+        self.assertEqual(
+            self.client.get("/routines", params=params, headers={"If-None-Match": etag}).status_code, 304
+        )
+
+        renamed = self.client.put(f"/routines/{self.routine_id}", json={"title": "저녁 운동"})
+        self.assertEqual(renamed.status_code, 200)
+
+        second = self.client.get("/routines", params=params, headers={"If-None-Match": etag})
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.headers["ETag"], etag)
+        self.assertEqual(second.json()[0]["title"], "저녁 운동")
+        return second.json()[0]
+
+    def test_projected_page_from_firestore(self):
+        routine = self.assert_rename_changes_etag({"fields": "id,title", "limit": 10})
+        # ETag 용으로 읽은 updated_at 은 응답에 섞이지 않음
+        self.assertEqual(set(routine), {"id", "title"})
+
+    def test_projected_page_from_cache(self):
+        # 목록 캐시를 채워 두면 페이지 조회도 메모리에서 잘라 줌
+        self.client.get("/routines")
+        routine = self.assert_rename_changes_etag({"fields": "id,title", "limit": 10})
+        self.assertEqual(set(routine), {"id", "title"})
+
+    def test_full_list(self):
+        self.assert_rename_changes_etag({})
+
+
+if __name__ == "__main__":
+    unittest.main()
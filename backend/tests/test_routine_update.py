@@ -0,0 +1,55 @@
+import unittest
+
+from repositories.cached_routine_repository import CachedRoutineRepository
+from tests.api_client import FakeBackend
+
+UID = "routine-update-user"
+
+
+class RoutineUpdateRpcTest(unittest.TestCase):
+    """PUT /routines/{routine_id} 가 목록 캐시 적중 여부에 따라 보내는 Firestore RPC"""
+
+    def setUp(self):
+        self.backend = FakeBackend(UID)
+        self.client = self.backend.client
+        self.db = self.backend.db
+        self.routine_id = self.backend.create_routine("아침 운동", "07:00")
+
+    def tearDown(self):
+        self.backend.close()
+
+    def put(self, routine_id: str, body: dict):
+        self.db.rpcs.clear()
+        response = self.client.put(f"/routines/{routine_id}", json=body)
+        return response, self.db.rpc_counts()
+
+    def test_warm_edit_is_one_commit(self):
+        # 목록 캐시에 수정 전 상태가 있음
+        self.client.get("/routines")
+        response, rpcs = self.put(self.routine_id, {"title": "저녁 운동"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rpcs, {"commit": 1})
+        self.assertEqual((response.json()["title"], response.json()["time"]), ("저녁 운동", "07:00"))
+
+    def test_cold_edit_rereads_document(self):
+        self.backend.routine_repo = CachedRoutineRepository(self.backend.routine_repo.backend)
+        response, rpcs = self.put(self.routine_id, {"time": "08:00"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rpcs, {"commit": 1, "get": 1})
+        self.assertEqual((response.json()["title"], response.json()["time"]), ("아침 운동", "08:00"))
+
+    def test_missing_routine_is_one_commit(self):
+        response, rpcs = self.put("missing", {"title": "저녁 운동"})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(rpcs, {"commit": 1})
+
+    def test_warm_and_cold_responses_match(self):
+        self.client.get("/routines")
+        warm = self.put(self.routine_id, {"title": "저녁 운동"})[0].json()
+        self.backend.routine_repo = CachedRoutineRepository(self.backend.routine_repo.backend)
+        cold = self.client.get(f"/routines/{self.routine_id}").json()
+        self.assertEqual(warm, cold)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+
+from starlette.requests import ClientDisconnect
+
+from api.stream import stream_changes
+from repositories.change_watcher import IChangeWatcher
+from services.change_hub import ChangeHub
+
+UID = "stream-user"
+
+
+class CountingWatcher(IChangeWatcher):
+    """리스너 등록 / 해제 수만 세는 변경 구독"""
+
+    def __init__(self):
+        self.active = 0
+
+    def watch(self, uid, on_changes):
+        self.active += 1
+
+        def unsubscribe():
+            self.active -= 1
+        return unsubscribe
+
+
+class StreamSubscriptionTest(unittest.IsolatedAsyncioTestCase):
+    """응답 본문을 읽기 전에 연결이 끊겨도 구독과 리스너가 해제됨"""
+
+    async def asyncSetUp(self):
+        self.watcher = CountingWatcher()
+        self.hub = ChangeHub(self.watcher, linger_seconds=0)
+        self.response = await stream_changes(uid=UID, hub=self.hub)
+        self.assertEqual(self.hub.stats()["connections"], 1)
+        self.assertEqual(self.watcher.active, 1)
+
+    def assert_released(self):
+        self.assertEqual(self.hub.stats()["connections"], 0)
+        self.assertEqual(self.watcher.active, 0)
+
+    async def test_disconnect_before_response_start(self):
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            raise OSError("client disconnected")
+
+        with self.assertRaises(ClientDisconnect):
+            await self.response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+        self.assert_released()
+
+    async def test_client_disconnect_while_streaming(self):
+        sent = []
+
+        async def receive():
+            # 응답 시작 뒤 연결 끊김
+            while not sent:
+                await asyncio.sleep(0.01)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        await self.response({"type": "http", "asgi": {"spec_version": "2.0"}}, receive, send)
+        self.assertEqual(sent[0]["type"], "http.response.start")
+        self.assert_released()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from datetime import timedelta
+
+from repositories.sync_repository import SYNC_SAFETY_LAG_SECONDS
+from scripts.backfill_sync_fields import backfill_sync_fields
+from tests.api_client import FakeBackend
+
+
+class SyncCursorTest(unittest.TestCase):
+    """GET /sync 커서가 커밋 순서를 따르고, 늦게 보인 커밋을 놓치지 않는지"""
+
+    def setUp(self):
+        self.backend = FakeBackend("sync-user")
+        self.client = self.backend.client
+        self.db = self.backend.db
+
+    def tearDown(self):
+        self.backend.close()
+
+    def sync(self, cursor=None, limit=None):
+        params = {}
+        if cursor is not None:
+            params["since"] = cursor
+        if limit is not None:
+            params["limit"] = limit
+        response = self.client.get("/sync", params=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def titles(self, body):
+        return [routine["title"] for routine in body["routines"]]
+
+    def test_late_commit_is_delivered_on_next_sync(self):
+        self.backend.create_routine("A")
+        self.db.advance(60)
+        first = self.sync()
+        self.assertEqual(self.titles(first), ["A"])
+
+        self.backend.create_routine("B")
+        read_at = self.db.now()
+        second = self.sync(first["cursor"])
+        self.assertEqual(self.titles(second), ["B"])
+        self.assertFalse(second["has_more"])
+
+        # 두 번째 동기화 직전에 커밋되었지만 그 읽기에는 아직 보이지 않던 쓰기
+        self.db.commit_time = read_at - timedelta(seconds=SYNC_SAFETY_LAG_SECONDS / 2)
+        self.backend.create_routine("C")
+        self.db.advance(60)
+
+        third = self.sync(second["cursor"])
+        self.assertIn("C", self.titles(third))
+        # 안전 구간 밖으로 나간 뒤에는 같은 문서를 다시 보내지 않음
+        self.assertEqual(self.titles(self.sync(third["cursor"])), [])
+
+    def test_commit_order_not_app_clock(self):
+        # 앱 시계로는 B 가 먼저지만 커밋은 A 가 먼저인 경우에도 둘 다 전달됨
+        routine_a = self.backend.create_routine("A")
+        self.db.advance(60)
+        first = self.sync()
+
+        routine_b = self.backend.create_routine("B")
+        self.db.docs[("users", "sync-user", "routines", routine_b)]["updated_at"] = "2000-01-01T00:00:00"
+        self.client.put(f"/routines/{routine_a}", json={"title": "A2"})
+        self.db.advance(60)
+
+        self.assertEqual(sorted(self.titles(self.sync(first["cursor"]))), ["A2", "B"])
+
+    def test_paging_older_than_lag(self):
+        for i in range(5):
+            self.backend.create_routine(f"R{i}")
+        self.db.advance(60)
+
+        seen = []
+        cursor = None
+        while True:
+            body = self.sync(cursor, limit=2)
+            seen.extend(self.titles(body))
+            cursor = body["cursor"]
+            if not body["has_more"]:
+                break
+        self.assertEqual(seen, [f"R{i}" for i in range(5)])
+
+    def test_deleted_routine_tombstone(self):
+        routine_id = self.backend.create_routine("A")
+        self.db.advance(60)
+        cursor = self.sync()["cursor"]
+
+        self.client.delete(f"/routines/{routine_id}")
+        self.db.advance(60)
+        body = self.sync(cursor)
+        self.assertEqual([(d["collection"], d["id"]) for d in body["deleted"]], [("routines", routine_id)])
+
+    def test_backfill_legacy_documents(self):
+        self.backend.create_routine("A")
+        self.db.advance(60)
+        cursor = self.sync()["cursor"]
+
+        # sync_at 도입 이전에 저장된 문서는 쿼리에서 빠짐
+        self.db.docs[("users", "sync-user", "routines", "legacy")] = {"title": "legacy", "time": "08:00"}
+        self.assertEqual(self.titles(self.sync(cursor)), [])
+
+        counts = backfill_sync_fields(self.db)
+        self.assertEqual(counts["routines"]["updated"], 1)
+        self.db.advance(60)
+        self.assertEqual(self.titles(self.sync(cursor)), ["legacy"])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/sync", params={"since": "not-a-cursor"}).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()